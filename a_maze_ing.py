@@ -2,103 +2,182 @@
 """Main entry point for the A-Maze-Ing maze generator application."""
 
 from src.Menu import ExecOptions
-from src import Config, Generator, Menu, Renderer
+from src import Config, Generator, Menu
 from src import OutputFileHandler
 from src import Solver
+from src.Config import LARGE_MAZE_BYTES_PER_CELL
+from src.SolutionCache import SolutionCache
+from typing import Iterator, Optional, TYPE_CHECKING
 import sys
-import os
+
+if TYPE_CHECKING:
+    from src.Renderer import Renderer
 
 
 class Main:
-    """Main application class for maze generation and solving."""
+    """Main application class for maze generation and solving.
+
+    The interactive session is a flat loop: the menu returns the selected
+    option, ``exec_result`` runs it and returns the status shown by the
+    next menu, so the stack depth stays constant however long it lasts.
+    MLX is imported and the window opened by the first option that
+    draws, so the menu shows up without waiting for them.
+    """
+
+    def __init__(self, config_file: str,
+                 script: Optional[Iterator[str]] = None) -> None:
+        """Initialize the application with a configuration file.
 
-    def __init__(self, config_file: str) -> None:
-        """Initialize the application with a configuration file."""
+        ``script`` replaces the keyboard answers of the menu, for
+        headless sessions.
+        """
         self.is_solved: bool = False
         self.config: Config = Config(config_file)
         self.generator: Generator = Generator(self.config)
-        self.renderer: Renderer = Renderer(self.config,
-                                           self.generator)
-        self.menu: Menu = Menu(self.config)
+        self._renderer: Optional[Renderer] = None
+        # Resolver el mismo tablero otra vez no repite la búsqueda
+        self.cache = SolutionCache(directory=self.config.cache_dir or None)
+        if self.config.large_maze:
+            self.run_large_maze()
+            return
+        self.menu: Menu = Menu(self.config, script)
         self.solver: Solver = Solver(
             self.generator.maze,
             self.config.entry,
-            self.config.exit)
+            self.config.exit,
+            self.config.solver,
+            self.cache)
         self.generated: bool = False
-        self.main_menu("Welcome to A-Maze-Ing!", self.generated,
-                       self.is_solved)
+        self.running: bool = True
+        self.run("Welcome to A-Maze-Ing!")
+
+    @property
+    def renderer(self) -> 'Renderer':
+        """Return the renderer, opening the MLX window on first use."""
+        if self._renderer is None:
+            from src.Renderer import Renderer
+            self._renderer = Renderer(self.config, self.generator)
+        return self._renderer
+
+    def run_large_maze(self) -> None:
+        """Generate, solve and save a large maze without rendering."""
+        if self.config.streaming:
+            self.run_streaming()
+            return
+        solver = Solver(self.generator.maze, self.config.entry,
+                        self.config.exit, self.config.solver,
+                        self.large_maze_cache())
+        self.generator.generate()
+        # Solo los índices: una vista Cell por celda del camino no cabe
+        # en el presupuesto de memoria de LARGE_MAZE
+        solver.solve_path()
+        OutputFileHandler().save_file(self.config.output_file,
+                                      self.generator.maze,
+                                      self.config,
+                                      solver.path)
+        print(f"[OK] Maze saved to {self.config.output_file}")
+
+    def large_maze_cache(self) -> Optional[SolutionCache]:
+        """Return the cache for large mazes: only worth it on disk."""
+        return self.cache if self.config.cache_dir else None
 
-    def exec_result(self, selection: ExecOptions) -> None:
-        """Execute the selected menu option."""
-        if selection and isinstance(selection, ExecOptions):
+    def run_streaming(self) -> None:
+        """Stream an Eller maze to disk, then solve it from the file."""
+        output = self.config.output_file
+        OutputFileHandler.stream_file(output, self.generator.stream_rows(),
+                                      self.config)
+        print(f"[OK] Maze streamed to {output}")
+
+        # Resolver necesita el tablero completo: solo si cabe en memoria
+        needed = (self.config.width * self.config.height
+                  * LARGE_MAZE_BYTES_PER_CELL)
+        available = Config.available_memory()
+        if available is not None and needed > available:
+            print("[WARN] Not enough memory to solve the maze, "
+                  "the solution line is left empty")
+            return
+        from src.MazeLoader import MappedMaze
+        with MappedMaze(output) as maze:
+            board = maze.to_board()
+        solver = Solver(board, self.config.entry, self.config.exit,
+                        self.config.solver, self.large_maze_cache())
+        path = solver.solve_path()
+        if path:
+            OutputFileHandler.append_path(output, path, board.width)
+            print(f"[OK] Solution appended to {output}")
+
+    def run(self, status: str = "") -> None:
+        """Show the menu and execute selections until the user exits."""
+        while self.running:
             try:
-                if selection is ExecOptions.GEN_MAZE_WITH_RENDER:
-                    self.menu.print_header()
-                    self.is_solved = False
-                    self.start_generation(ExecOptions.GEN_MAZE_WITH_RENDER)
-                elif selection is ExecOptions.GEN_MAZE_NO_RENDER:
-                    self.menu.print_header()
-                    self.is_solved = False
-                    self.start_generation(ExecOptions.GEN_MAZE_NO_RENDER)
-                elif selection is ExecOptions.SHOW_SOLUTION_RENDER:
-                    if self.generated:
-                        self.menu.print_header()
-                        self.start_solving(ExecOptions.SHOW_SOLUTION_RENDER)
-                    else:
-                        self.main_menu("Error: Maze must be generated first",
-                                       self.generated, self.is_solved)
-                elif selection is ExecOptions.SHOW_SOLUTION_NO_RENDER:
-                    if self.generated:
-                        self.menu.print_header()
-                        self.start_solving(ExecOptions.SHOW_SOLUTION_NO_RENDER)
-                    else:
-                        self.main_menu("Error: Maze must be generated first",
-                                       self.generated, self.is_solved)
-                elif selection is ExecOptions.CHANGE_COLOR:
-                    self.change_wall_color()
-                elif selection is ExecOptions.EXIT:
-                    os.system('cls' if os.name == 'nt' else 'clear')
-                    print("Exiting program...")
-                    if hasattr(self, 'renderer'):
-                        self.renderer.destroy()
-                    sys.exit(0)
-                elif selection is ExecOptions.HIDE_SOLVE_PATH:
-                    self.renderer.draw_maze()
-                    self.renderer.sync()
-                    self.is_solved = False
-                    self.main_menu("Solve path hidden", self.generated,
-                                   self.is_solved)
-                else:
-                    self.main_menu("Error: Invalid option selected",
-                                   self.generated, self.is_solved)
-            except ValueError:
-                self.main_menu("Error: Only integers are admitted",
-                               self.generated, self.is_solved)
-            except Exception as error:
-                self.main_menu(f"Unexpected error occurred: \
-{error.__str__()}\n Report it pls! <3", self.generated, self.is_solved)
-
-    def change_wall_color(self) -> None:
+                selection = self.menu.init_menu(status, self.generated,
+                                                self.is_solved)
+            except EOFError:
+                selection = ExecOptions.EXIT
+            status = self.exec_result(selection)
+
+    def exec_result(self, selection: ExecOptions) -> str:
+        """Execute the selected menu option and return the next status."""
+        try:
+            if selection is ExecOptions.GEN_MAZE_WITH_RENDER:
+                self.menu.print_header()
+                self.is_solved = False
+                return self.start_generation(
+                    ExecOptions.GEN_MAZE_WITH_RENDER)
+            elif selection is ExecOptions.GEN_MAZE_NO_RENDER:
+                self.menu.print_header()
+                self.is_solved = False
+                return self.start_generation(ExecOptions.GEN_MAZE_NO_RENDER)
+            elif selection is ExecOptions.SHOW_SOLUTION_RENDER:
+                if not self.generated:
+                    return "Error: Maze must be generated first"
+                self.menu.print_header()
+                return self.start_solving(ExecOptions.SHOW_SOLUTION_RENDER)
+            elif selection is ExecOptions.SHOW_SOLUTION_NO_RENDER:
+                if not self.generated:
+                    return "Error: Maze must be generated first"
+                self.menu.print_header()
+                return self.start_solving(
+                    ExecOptions.SHOW_SOLUTION_NO_RENDER)
+            elif selection is ExecOptions.CHANGE_COLOR:
+                return self.change_wall_color()
+            elif selection is ExecOptions.EXIT:
+                self.menu.clear_screen()
+                print("Exiting program...")
+                self.stop()
+                return ""
+            elif selection is ExecOptions.HIDE_SOLVE_PATH:
+                self.renderer.draw_maze()
+                self.renderer.sync()
+                self.is_solved = False
+                return "Solve path hidden"
+            return "Error: Invalid option selected"
+        except ValueError:
+            return "Error: Only integers are admitted"
+        except Exception as error:
+            return f"Unexpected error occurred: \
+{error.__str__()}\n Report it pls! <3"
+
+    def stop(self) -> None:
+        """Leave the menu loop and release the window."""
+        self.running = False
+        if self._renderer is not None:
+            self._renderer.destroy()
+
+    def change_wall_color(self) -> str:
         """Prompt user for color code and change the background color."""
         select = self.menu.ask_color_code()
-        if select is None:
-            self.change_wall_color()
+        while select is None:
+            select = self.menu.ask_color_code()
 
-        self.renderer.set_wall_color(select)  # type: ignore
+        self.renderer.set_wall_color(select)
         self.renderer.sync()
         if self.is_solved:
             self.start_solving(ExecOptions.SHOW_SOLUTION_NO_RENDER)
-        self.main_menu("Background color changed successfully!",
-                       self.generated, self.is_solved)
-
-    def main_menu(self, status: str = "", generated: bool = False,
-                  solved: bool = False) -> None:
-        """Display the main menu and handle user selection."""
-        result: ExecOptions = self.menu.init_menu(status, generated, solved)
-        self.exec_result(result)
+        return "Background color changed successfully!"
 
-    def start_generation(self, generation_type: ExecOptions) -> None:
-        """Start the maze generation process."""
+    def start_generation(self, generation_type: ExecOptions) -> str:
+        """Start the maze generation process and return its status."""
         state = ""
         try:
             self.generated = False
@@ -115,25 +194,25 @@ class Main:
                 self.renderer.sync()
                 self.renderer.generation_complete = True
             if self.renderer.generation_complete:
+                self.solver.solve()
                 OutputFileHandler().save_file("maze.txt",
                                               self.generator.maze,
                                               self.config,
-                                              self.solver)
+                                              self.solver.path)
                 self.generated = True
                 state = "Maze generated successfully!"
             else:
                 self.generated = False
                 state = "Maze generation was not completed!"
-            self.main_menu(state,
-                           self.generated, self.is_solved)
+            return state
         except Exception as e:
             self.generated = False
             print(f"Fatal error occurred: {e}")
-            if hasattr(self, 'renderer'):
-                self.renderer.destroy()
+            self.stop()
+            return ""
 
-    def start_solving(self, solving_option: ExecOptions) -> None:
-        """Start the maze solving process."""
+    def start_solving(self, solving_option: ExecOptions) -> str:
+        """Start the maze solving process and return its status."""
         try:
             if solving_option is ExecOptions.SHOW_SOLUTION_RENDER:
                 # Resolver con animación paso a paso
@@ -154,17 +233,86 @@ class Main:
                 else:
                     print("No solution found!")
             self.is_solved = True
-            self.main_menu("Solving completed!", self.generated,
-                           self.is_solved)
+            return "Solving completed!"
 
         except Exception as e:
             print(f"Fatal error occurred during solving: {e}")
-            if hasattr(self, 'renderer'):
-                self.renderer.destroy()
+            self.stop()
+            return ""
 
 
 def main() -> None:
     """Entry point function for the package."""
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from src.Batch import run_batch
+        sys.exit(run_batch(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "analyze":
+        from src.MazeAnalytics import run_analytics
+        sys.exit(run_analytics(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "convert":
+        from src.MazeLoader import convert_maze
+        if len(sys.argv) != 4:
+            print("Usage: a_maze_ing.py convert SOURCE DESTINATION")
+            sys.exit(1)
+        try:
+            convert_maze(sys.argv[2], sys.argv[3])
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"[OK] {sys.argv[2]} converted to {sys.argv[3]}")
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "render":
+        from src.MazeLoader import load_maze
+        from src.ImageRenderer import ImageRenderer
+        if len(sys.argv) not in (4, 5):
+            print("Usage: a_maze_ing.py render MAZE IMAGE [CELL_SIZE]")
+            sys.exit(1)
+        try:
+            cell_size = int(sys.argv[4]) if len(sys.argv) == 5 else 0
+            maze = load_maze(sys.argv[2])
+            ImageRenderer(maze.board, maze.path, cell_size).save(sys.argv[3])
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"[OK] {sys.argv[2]} rendered to {sys.argv[3]}")
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "record":
+        from src.AnimationRecorder import AnimationRecorder
+        if len(sys.argv) != 4:
+            print("Usage: a_maze_ing.py record CONFIG_FILE ANIMATION")
+            sys.exit(1)
+        try:
+            config = Config(sys.argv[2])
+            generator = Generator(config)
+            generator.initialize_board()
+            solver = Solver(generator.maze, config.entry, config.exit,
+                            config.solver)
+            recorder = AnimationRecorder(
+                generator.maze, steps_per_frame=config.steps_per_frame,
+                fps=config.fps)
+            batch = recorder.steps_per_frame
+            frames = recorder.record(
+                sys.argv[3], generator.generate_step_by_step(batch),
+                solver.solve_step_by_step(batch))
+            OutputFileHandler.save_file(config.output_file, generator.maze,
+                                        config, solver.path)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"[OK] {frames} frames recorded to {sys.argv[3]}")
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "script":
+        if len(sys.argv) != 4:
+            print("Usage: a_maze_ing.py script CONFIG_FILE ANSWERS_FILE")
+            sys.exit(1)
+        try:
+            # Una respuesta del menú por línea
+            with open(sys.argv[3], "r") as file:
+                Main(sys.argv[2], (line.strip() for line in file))
+        except Exception as e:
+            print(f"{e}")
+            sys.exit(1)
+        sys.exit(0)
     try:
         Main(Config.get_config_file())
     except Exception as e:
@@ -0,0 +1 @@
+"""Pipeline benchmarks, run as ``python3 -m benchmarks.<name>``."""
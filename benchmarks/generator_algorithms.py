@@ -0,0 +1,59 @@
+"""Benchmark of the time and extra memory of every generation algorithm.
+
+Memory is the tracemalloc peak while carving, on top of the board that
+is already allocated, so it shows each algorithm's own working state.
+
+Usage: python3 -m benchmarks.generator_algorithms [side ...]
+"""
+
+from contextlib import redirect_stdout
+import io
+import sys
+import time
+import tracemalloc
+
+from src.Config import Config
+from src.Generator import Generator
+from src.GenerationAlgorithms import GENERATION_ALGORITHMS
+
+
+def measure(name: str, side: int) -> tuple[float, int]:
+    """Return the carving time and peak extra memory of one algorithm."""
+    config = Config.from_values(WIDTH=side, HEIGHT=side, ENTRY="1,1",
+                                EXIT=f"{side},{side}", PERFECT=True,
+                                SEED=1, OUTPUT_FILE="bench.txt",
+                                ALGORITHM=name, LARGE_MAZE=side > 100)
+    with redirect_stdout(io.StringIO()):
+        generator = Generator(config)
+        began = time.perf_counter()
+        generator.generate()
+        elapsed = time.perf_counter() - began
+
+        # Segunda pasada solo para medir memoria (tracemalloc ralentiza)
+        generator = Generator(config)
+        if not generator.maze.size:
+            # Las configuraciones de streaming reservan el tablero al generar
+            generator.initialize_board()
+        tracemalloc.start()
+        generator.generate()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Print time and peak memory per algorithm and maze side."""
+    sides = [int(side) for side in sys.argv[1:]] or [100, 300]
+    print(f"{'algorithm':>14} {'side':>6} {'seconds':>8} {'us/cell':>8} "
+          f"{'peak KiB':>9} {'B/cell':>7}")
+    for name in GENERATION_ALGORITHMS:
+        for side in sides:
+            elapsed, peak = measure(name, side)
+            cells = side * side
+            print(f"{name:>14} {side:>6} {elapsed:>8.3f} "
+                  f"{elapsed / cells * 1e6:>8.2f} {peak / 1024:>9.1f} "
+                  f"{peak / cells:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
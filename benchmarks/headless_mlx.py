@@ -0,0 +1,97 @@
+"""Headless stand-in for the ``mlx`` module used by the benchmarks.
+
+It implements the calls the Renderer makes, backing every image with a
+plain ``bytearray`` of 32-bit pixels, so drawing code runs exactly as
+with MLX but nothing is shown and no display is needed.
+"""
+
+from typing import Any
+import sys
+import types
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+class HeadlessImage:
+    """Image whose pixels live in a bytearray."""
+
+    def __init__(self, width: int, height: int) -> None:
+        """Allocate a black image of the given size."""
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(width * height * 4)
+
+
+class Mlx:
+    """Drop-in replacement for ``mlx.Mlx`` that never opens a window."""
+
+    SYNC_IMAGE_WRITABLE = 1
+    SYNC_WIN_FLUSH = 2
+    SYNC_WIN_COMPLETED = 3
+
+    def __init__(self) -> None:
+        """Start with no frames presented and no loop hook."""
+        self.frames = 0
+        self.loop_hook: Any = None
+        self.looping = False
+
+    def mlx_init(self) -> object:
+        """Return an opaque connection handle."""
+        return object()
+
+    def mlx_get_screen_size(self, mlx_ptr: Any) -> tuple[int, int, int]:
+        """Return (status, width, height) like MLX does."""
+        return 0, SCREEN_WIDTH, SCREEN_HEIGHT
+
+    def mlx_new_window(self, mlx_ptr: Any, width: int, height: int,
+                       title: str) -> object:
+        """Return an opaque window handle."""
+        return object()
+
+    def mlx_new_image(self, mlx_ptr: Any, width: int,
+                      height: int) -> HeadlessImage:
+        """Return an image backed by a bytearray."""
+        return HeadlessImage(width, height)
+
+    def mlx_get_data_addr(self, image: HeadlessImage
+                          ) -> tuple[bytearray, int, int, int]:
+        """Return (buffer, bits per pixel, line length, endianness)."""
+        return image.buffer, 32, image.width * 4, 0
+
+    def mlx_put_image_to_window(self, mlx_ptr: Any, win_ptr: Any,
+                                image: HeadlessImage, x: int,
+                                y: int) -> None:
+        """Count a presented frame."""
+        self.frames += 1
+
+    def mlx_loop_hook(self, mlx_ptr: Any, hook: Any, param: Any) -> int:
+        """Register the function the loop calls on every iteration."""
+        self.loop_hook = (hook, param)
+        return 0
+
+    def mlx_loop(self, mlx_ptr: Any) -> int:
+        """Call the loop hook until ``mlx_loop_exit``, like MLX."""
+        self.looping = self.loop_hook is not None
+        while self.looping:
+            hook, param = self.loop_hook
+            hook(param)
+        return 0
+
+    def mlx_loop_exit(self, mlx_ptr: Any) -> int:
+        """Make ``mlx_loop`` return."""
+        self.looping = False
+        return 0
+
+    def __getattr__(self, name: str) -> Any:
+        """Accept any other ``mlx_*`` call (hooks, syncs, loop, ...)."""
+        if not name.startswith("mlx_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: 0
+
+
+def install() -> None:
+    """Make ``import mlx`` load this stand-in instead of MLX."""
+    module = types.ModuleType("mlx")
+    module.Mlx = Mlx  # type: ignore[attr-defined]
+    sys.modules["mlx"] = module
@@ -0,0 +1,138 @@
+"""Soak test of the interactive menu loop, driven by scripted answers.
+
+Runs thousands of regenerate / solve / hide cycles through ``Main`` with
+``benchmarks.headless_mlx`` in place of MLX, sprinkling color changes,
+invalid answers and animated renders, and checks that the stack depth
+and the traced memory stay flat from one cycle to the next.
+
+Usage: python3 -m benchmarks.menu_soak [--cycles N] [--side N]
+           [--tolerance BYTES]
+"""
+
+from array import array
+from contextlib import redirect_stdout
+from types import FrameType
+from typing import Iterator, Optional
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from benchmarks import headless_mlx
+
+# Cada cuántos ciclos se cambia el color o se anima la generación
+COLOR_EVERY = 7
+ANIMATE_EVERY = 50
+
+# Cycles run before the first memory sample, so caches are warm
+WARMUP_CYCLES = 20
+
+
+def stack_depth() -> int:
+    """Return the number of frames below the caller."""
+    frame: Optional[FrameType] = sys._getframe(1)
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def answers(depths: array, memory: array) -> Iterator[str]:
+    """Yield the menu answers of the soak, sampling at every cycle.
+
+    Samples are taken when the menu asks for the first answer of a
+    cycle, which is always at the same point of the loop, and stored in
+    preallocated arrays so that sampling allocates nothing.
+    """
+    yield "2"                       # Generación estática
+    for cycle in range(len(depths)):
+        depths[cycle] = stack_depth()
+        memory[cycle] = tracemalloc.get_traced_memory()[0]
+        render = "1" if cycle % ANIMATE_EVERY == ANIMATE_EVERY - 1 else "2"
+        yield from ("2", render)    # Resolver
+        yield "2"                   # Ocultar el camino
+        if cycle % COLOR_EVERY == 0:
+            yield from ("3", "not a color", "FF0000")
+        yield "5"                   # Opción inválida
+        yield from ("1", render)    # Regenerar
+    yield "4"
+
+
+def write_config(directory: str, side: int) -> str:
+    """Write a small maze configuration and return its path."""
+    path = os.path.join(directory, "soak.txt")
+    with open(path, "w") as file:
+        file.write(f"WIDTH={side}\nHEIGHT={side}\nENTRY=1,1\n"
+                   f"EXIT={side},{side}\n"
+                   f"OUTPUT_FILE={os.path.join(directory, 'out.txt')}\n"
+                   "PERFECT=False\nFPS=240\nSTEPS_PER_FRAME=1000\n")
+    return path
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of the soak test."""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks.menu_soak",
+        description="Drive the menu loop headlessly and check it stays "
+                    "flat.")
+    parser.add_argument("--cycles", type=int, default=2000,
+                        help="regenerate/solve cycles (default: 2000)")
+    parser.add_argument("--side", type=int, default=12,
+                        help="maze side (default: 12)")
+    parser.add_argument("--tolerance", type=int, default=64 * 1024,
+                        help="allowed memory growth in bytes "
+                             "(default: 64 KiB)")
+    args = parser.parse_args(argv)
+    if args.cycles < 1:
+        parser.error("--cycles must be at least 1")
+    return args
+
+
+def main(argv: list[str]) -> int:
+    """Run the soak and return 1 if the stack or memory grew."""
+    args = parse_args(argv)
+    headless_mlx.install()
+    from a_maze_ing import Main
+
+    depths = array("q", bytes(8 * args.cycles))
+    memory = array("q", bytes(8 * args.cycles))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        config = write_config(directory, args.side)
+        # El menú guarda maze.txt en el directorio actual
+        os.chdir(directory)
+        tracemalloc.start()
+        try:
+            # A /dev/null: un StringIO crecería con cada menú impreso
+            with open(os.devnull, "w") as null, redirect_stdout(null):
+                Main(config, answers(depths, memory))
+        finally:
+            tracemalloc.stop()
+            os.chdir(cwd)
+
+    if not depths[-1]:
+        ran = args.cycles - depths.tolist().count(0)
+        print(f"[FAIL] Only {ran} of {args.cycles} cycles ran")
+        return 1
+    settled = memory[min(WARMUP_CYCLES, len(memory) - 1):]
+    growth = settled[-1] - settled[0]
+    print(f"{args.cycles} cycles, stack depth {min(depths)}-"
+          f"{max(depths)}, memory {settled[0] / 1024:.1f} KiB -> "
+          f"{settled[-1] / 1024:.1f} KiB (peak "
+          f"{max(settled) / 1024:.1f} KiB)")
+    failed = False
+    if min(depths) != max(depths):
+        print("[FAIL] The stack depth changed between cycles")
+        failed = True
+    if growth > args.tolerance:
+        print(f"[FAIL] Memory grew {growth / 1024:.1f} KiB")
+        failed = True
+    if not failed:
+        print("[OK] Stack depth and memory stayed flat")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
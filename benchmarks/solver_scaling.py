@@ -0,0 +1,51 @@
+"""Benchmark showing that Solver.solve scales linearly with board size.
+
+Usage: python3 -m benchmarks.solver_scaling [max_side]
+"""
+
+from contextlib import redirect_stdout
+import io
+import sys
+import time
+
+from src.Config import Config
+from src.Generator import Generator
+from src.Solver import Solver
+
+SIDES = [100, 250, 500, 750, 1000]
+
+
+def bench_side(side: int, seed: int = 42) -> tuple[int, float]:
+    """Generate a perfect side x side maze and time a full solve."""
+    config = Config.from_values(WIDTH=side, HEIGHT=side, ENTRY="1,1",
+                                EXIT=f"{side},{side}", PERFECT=True,
+                                OUTPUT_FILE="bench.txt", SEED=seed,
+                                LARGE_MAZE=side > 100)
+    with redirect_stdout(io.StringIO()):
+        generator = Generator(config)
+        generator.generate()
+        solver = Solver(generator.maze, config.entry, config.exit)
+        start = time.perf_counter()
+        path = solver.solve()
+        elapsed = time.perf_counter() - start
+    if path is None:
+        raise RuntimeError(f"No solution found for {side}x{side}")
+    return len(path), elapsed
+
+
+def main() -> None:
+    """Run the scaling sweep and print time per cell for each size."""
+    max_side = int(sys.argv[1]) if len(sys.argv) > 1 else SIDES[-1]
+    print(f"{'size':>11} {'cells':>9} {'path':>7} {'solve s':>9} "
+          f"{'ns/cell':>8}")
+    for side in SIDES:
+        if side > max_side:
+            break
+        path_length, elapsed = bench_side(side)
+        cells = side * side
+        print(f"{side:>5}x{side:<5} {cells:>9} {path_length:>7} "
+              f"{elapsed:>9.3f} {elapsed / cells * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
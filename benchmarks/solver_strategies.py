@@ -0,0 +1,69 @@
+"""Benchmark comparing every solver strategy on perfect and imperfect mazes.
+
+The weighted class braids half the dead ends of an imperfect maze and
+gives every cell a random cost from 1 to 9: only dijkstra minimizes
+the path cost there, the other strategies ignore the weights. The wall
+follower only runs on perfect mazes.
+
+Usage: python3 -m benchmarks.solver_strategies [side] [seeds]
+"""
+
+from contextlib import redirect_stdout
+import io
+import sys
+
+from src.Config import Config
+from src.Generator import Generator
+from src.Solver import Solver
+from src.SolverStrategies import SOLVER_STRATEGIES
+
+# (label, config values) of each maze class
+MAZE_CLASSES: list[tuple[str, dict[str, object]]] = [
+    ("perfect", {"PERFECT": True}),
+    ("imperfect", {"PERFECT": False}),
+    ("weighted", {"PERFECT": False, "BRAID": 50, "WEIGHTS": "1-9"}),
+]
+
+
+def main() -> None:
+    """Print averaged solver statistics for each maze class."""
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seeds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"{'maze':>9} {'strategy':>14} {'expanded':>9} {'frontier':>9} "
+          f"{'solved':>7} {'cost':>7} {'ms':>8}")
+    for label, values in MAZE_CLASSES:
+        names = [name for name in SOLVER_STRATEGIES
+                 if values["PERFECT"] or name != "wall_follower"]
+        totals = {name: [0, 0, 0, 0, 0.0] for name in names}
+        for seed in range(seeds):
+            config = Config.from_values(WIDTH=side, HEIGHT=side,
+                                        ENTRY="1,1", EXIT=f"{side},{side}",
+                                        SEED=seed, OUTPUT_FILE="bench.txt",
+                                        LARGE_MAZE=side > 100, **values)
+            with redirect_stdout(io.StringIO()):
+                generator = Generator(config)
+                generator.generate()
+                board = generator.maze
+                for name, total in totals.items():
+                    solver = Solver(board, config.entry, config.exit, name)
+                    path = solver.solve_path()
+                    total[0] += solver.stats.nodes_expanded
+                    total[1] = max(total[1], solver.stats.peak_frontier)
+                    total[2] += path is not None
+                    # Coste de entrar en cada celda del camino
+                    if path is not None:
+                        total[3] += (sum(board.weights[index]
+                                         for index in path[1:])
+                                     if board.weights is not None
+                                     else len(path) - 1)
+                    total[4] += solver.stats.elapsed
+        for name, (expanded, frontier, solved, cost,
+                   elapsed) in totals.items():
+            print(f"{label:>9} {name:>14} {expanded // seeds:>9} "
+                  f"{frontier:>9} {solved:>4}/{seeds:<2} "
+                  f"{cost // max(solved, 1):>7} "
+                  f"{elapsed / seeds * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
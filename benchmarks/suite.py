@@ -0,0 +1,306 @@
+"""Benchmark suite of every pipeline stage with a stored baseline.
+
+Sweeps board sizes, PERFECT on and off and several seeds, and records
+the time, tracemalloc peak and cells per second of generation, solving,
+rendering (through ``benchmarks.headless_mlx``) and writing. Results
+can be saved as a baseline JSON and later runs compared against it,
+flagging every stage that got slower or hungrier than the tolerance.
+It also checks the startup: the ``-X importtime`` of the entry point and
+of the core modules in a fresh interpreter must stay within a budget
+and must not load any graphics module.
+
+The default sweep stops at 500x500 so a full run takes a few minutes.
+``--large`` adds the LARGE_MAZE sides 1000 and 2000: a single
+1000x1000 case already takes minutes, so the 50000x50000 limit of
+LARGE_MAZE (2.5 billion cells, tens of GiB) is out of reach of a
+benchmark run. Any side up to that limit can still be given with
+``--sides``.
+
+Usage: python3 -m benchmarks.suite [--sides 20 100 ...] [--large]
+           [--seeds N] [--baseline FILE] [--save FILE]
+           [--tolerance 0.25] [--startup-budget MS]
+"""
+
+from contextlib import redirect_stdout
+from typing import Any, Callable, TypeAlias
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks import headless_mlx
+from src.Config import Config, MAX_DIMENSION, MAX_LARGE_DIMENSION
+from src.Config import MIN_DIMENSION
+from src.Generator import Generator
+from src.OutputFileHandler import OutputFileHandler
+from src.Solver import Solver
+
+# TypeAlias: builds a fresh stage run, returning the action to measure
+StageFactory: TypeAlias = Callable[[], Callable[[], object]]
+# TypeAlias: metric name -> value, per "stage/side/perfect" key
+Results: TypeAlias = dict[str, dict[str, float]]
+
+SIDES = [20, 50, 100, 250, 500]
+# Lados extra de --large (LARGE_MAZE), ver el docstring del módulo
+LARGE_SIDES = [1000, 2000]
+
+# Fast stages are rerun until they add up to this long, keeping the best
+MIN_TOTAL_SECONDS = 1.0
+MAX_REPEATS = 5
+
+# Differences below these are noise, whatever the ratio
+MIN_SECONDS = 0.002
+MIN_PEAK_BYTES = 64 * 1024
+
+# Modules imported at startup, and those that must wait for a window
+STARTUP_MODULES = ["a_maze_ing", "src.Generator", "src.Solver"]
+GRAPHICS_MODULES = ("mlx", "src.Renderer", "src.Framebuffer")
+STARTUP_RUNS = 5
+STARTUP_BUDGET_MS = 100.0
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(make: StageFactory) -> tuple[float, int]:
+    """Return the best run time and the tracemalloc peak of a stage.
+
+    Each is measured on its own fresh runs, since tracing allocations
+    slows the code down.
+    """
+    elapsed = float("inf")
+    total = 0.0
+    for _ in range(MAX_REPEATS):
+        action = make()
+        start = time.perf_counter()
+        action()
+        run = time.perf_counter() - start
+        elapsed = min(elapsed, run)
+        total += run
+        if total >= MIN_TOTAL_SECONDS:
+            break
+
+    action = make()
+    tracemalloc.start()
+    action()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_case(side: int, perfect: bool, seed: int,
+               directory: str) -> dict[str, tuple[float, int]]:
+    """Measure every stage on one side x side maze."""
+    config = Config.from_values(WIDTH=side, HEIGHT=side, ENTRY="1,1",
+                                EXIT=f"{side},{side}", PERFECT=perfect,
+                                SEED=seed, LARGE_MAZE=side > MAX_DIMENSION,
+                                OUTPUT_FILE=os.path.join(directory,
+                                                         "bench.txt"))
+    generator = Generator(config)
+    generator.generate()
+    solver = Solver(generator.maze, config.entry, config.exit,
+                    config.solver)
+    solver.solve()
+
+    def make_generate() -> Callable[[], object]:
+        return Generator(config).generate
+
+    def make_solve() -> Callable[[], object]:
+        return Solver(generator.maze, config.entry, config.exit,
+                      config.solver).solve
+
+    def make_write() -> Callable[[], object]:
+        return lambda: OutputFileHandler.save_file(
+            config.output_file, generator.maze, config, solver.path)
+
+    stages: dict[str, StageFactory] = {"generate": make_generate,
+                                       "solve": make_solve,
+                                       "write": make_write}
+    # El Renderer solo existe en modo interactivo (hasta 100x100)
+    if side <= MAX_DIMENSION:
+        from src.Renderer import Renderer
+        renderer = Renderer(config, generator)
+        stages["render"] = lambda: renderer.draw_maze
+    return {stage: measure(make) for stage, make in stages.items()}
+
+
+def run_suite(sides: list[int], seeds: int) -> Results:
+    """Run every case and aggregate the seeds of each stage.
+
+    Time is the best over seeds, which is the least sensitive to other
+    load on the machine, and memory the largest peak.
+    """
+    samples: dict[str, list[tuple[float, int]]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for side in sides:
+            for perfect in (True, False):
+                for seed in range(seeds):
+                    with redirect_stdout(io.StringIO()):
+                        case = bench_case(side, perfect, seed, directory)
+                    for stage, sample in case.items():
+                        key = case_key(stage, side, perfect)
+                        samples.setdefault(key, []).append(sample)
+    results: Results = {}
+    for key, values in samples.items():
+        seconds = min(elapsed for elapsed, _ in values)
+        side = int(key.split("/")[1])
+        results[key] = {
+            "seconds": seconds,
+            "peak_bytes": max(peak for _, peak in values),
+            "cells_per_second": side * side / seconds if seconds else 0.0,
+        }
+    return results
+
+
+def case_key(stage: str, side: int, perfect: bool) -> str:
+    """Return the results key of a stage, e.g. ``solve/100/perfect``."""
+    return f"{stage}/{side}/{'perfect' if perfect else 'imperfect'}"
+
+
+def measure_startup(module: str) -> tuple[float, list[str]]:
+    """Return the best import time of a module in a fresh interpreter.
+
+    ``-X importtime`` lists every module imported on the way, so the
+    graphics modules that came along are returned too.
+    """
+    best = float("inf")
+    loaded: list[str] = []
+    for _ in range(STARTUP_RUNS):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True, check=True)
+        # Líneas "import time: self | cumulative | módulo" (en µs)
+        cumulative: dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[1].strip().isdigit():
+                cumulative[fields[2].strip()] = int(fields[1])
+        best = min(best, cumulative[module] / 1e6)
+        loaded = [name for name in GRAPHICS_MODULES if name in cumulative]
+    return best, loaded
+
+
+def check_startup(budget_ms: float) -> list[str]:
+    """Print the startup times and return a message per broken limit."""
+    problems = []
+    for module in STARTUP_MODULES:
+        seconds, loaded = measure_startup(module)
+        print(f"{'startup':>9} {module:>16} {seconds * 1000:>9.2f} ms "
+              f"(budget {budget_ms:.0f} ms)")
+        if seconds * 1000 > budget_ms:
+            problems.append(f"import {module}: {seconds * 1000:.1f} ms, "
+                            f"over the {budget_ms:.0f} ms budget")
+        if loaded:
+            problems.append(f"import {module} loads {', '.join(loaded)}")
+    return problems
+
+
+def compare(results: Results, baseline: Results,
+            tolerance: float) -> list[str]:
+    """Return a message for every metric worse than the baseline."""
+    regressions = []
+    for key, metrics in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        seconds, old_seconds = metrics["seconds"], before["seconds"]
+        if (seconds > old_seconds * (1 + tolerance)
+                and seconds - old_seconds > MIN_SECONDS):
+            regressions.append(f"{key}: {old_seconds * 1000:.1f} ms -> "
+                               f"{seconds * 1000:.1f} ms")
+        peak, old_peak = metrics["peak_bytes"], before["peak_bytes"]
+        if (peak > old_peak * (1 + tolerance)
+                and peak - old_peak > MIN_PEAK_BYTES):
+            regressions.append(f"{key}: {old_peak / 1024:.0f} KiB -> "
+                               f"{peak / 1024:.0f} KiB peak")
+    return regressions
+
+
+def print_results(results: Results, baseline: Results) -> None:
+    """Print one line per stage and case, with the change in time."""
+    print(f"{'stage':>9} {'side':>6} {'maze':>9} {'ms':>9} "
+          f"{'Mcells/s':>9} {'peak KiB':>9} {'vs base':>8}")
+    for key, metrics in results.items():
+        stage, side, maze = key.split("/")
+        before = baseline.get(key)
+        change = (f"{metrics['seconds'] / before['seconds']:>7.2f}x"
+                  if before and before["seconds"] else f"{'-':>8}")
+        print(f"{stage:>9} {side:>6} {maze:>9} "
+              f"{metrics['seconds'] * 1000:>9.2f} "
+              f"{metrics['cells_per_second'] / 1e6:>9.3f} "
+              f"{metrics['peak_bytes'] / 1024:>9.1f} {change}")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of the benchmark suite."""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks.suite",
+        description="Time every pipeline stage and compare to a baseline.")
+    parser.add_argument("--sides", type=int, nargs="+", default=SIDES,
+                        help="board sides to sweep (default: %(default)s)")
+    parser.add_argument("--large", action="store_true",
+                        help=f"also sweep the LARGE_MAZE sides {LARGE_SIDES}")
+    parser.add_argument("--seeds", type=int, default=2,
+                        help="seeds per case (default: 2)")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="baseline JSON to compare against")
+    parser.add_argument("--save", metavar="FILE",
+                        help="write the results as a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown ratio (default: 0.25)")
+    parser.add_argument("--startup-budget", type=float, metavar="MS",
+                        default=STARTUP_BUDGET_MS,
+                        help="allowed import time of each startup module "
+                             "(default: %(default)s ms)")
+    args = parser.parse_args(argv)
+    for side in args.sides:
+        if not MIN_DIMENSION <= side <= MAX_LARGE_DIMENSION:
+            parser.error(f"side {side} out of range "
+                         f"({MIN_DIMENSION}..{MAX_LARGE_DIMENSION})")
+    if args.large:
+        args.sides += [side for side in LARGE_SIDES
+                       if side not in args.sides]
+    return args
+
+
+def main(argv: list[str]) -> int:
+    """Run the suite and return 1 if any stage regressed."""
+    args = parse_args(argv)
+    headless_mlx.install()
+    baseline: Results = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+
+    results = run_suite(args.sides, args.seeds)
+    print_results(results, baseline)
+
+    if args.save:
+        report: dict[str, Any] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seeds": args.seeds,
+            "results": results,
+        }
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=1, sort_keys=True)
+            file.write("\n")
+        print(f"[OK] Baseline saved to {args.save}")
+
+    regressions = compare(results, baseline, args.tolerance)
+    regressions += check_startup(args.startup_budget)
+    for message in regressions:
+        print(f"[REGRESSION] {message}")
+    if not regressions:
+        print("[OK] No regressions against the baseline"
+              if baseline else "[OK] Startup within budget")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""Benchmark of tiled generation against the number of worker processes.
+
+Usage: python3 -m benchmarks.tiled_generation [side] [tile_size]
+"""
+
+from contextlib import redirect_stdout
+import io
+import os
+import sys
+import time
+
+from src.Config import Config
+from src.Generator import Generator
+
+
+def bench_workers(side: int, tile_size: int, workers: int) -> float:
+    """Return the generation time of a side x side maze."""
+    config = Config.from_values(WIDTH=side, HEIGHT=side, ENTRY="1,1",
+                                EXIT=f"{side},{side}", PERFECT=True,
+                                OUTPUT_FILE="bench.txt", SEED=42,
+                                LARGE_MAZE=True, WORKERS=workers,
+                                TILE_SIZE=tile_size)
+    with redirect_stdout(io.StringIO()):
+        generator = Generator(config)
+        start = time.perf_counter()
+        generator.generate()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print the speedup over a single untiled DFS for 1..N workers."""
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tile_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    cores = os.cpu_count() or 1
+    baseline = bench_workers(side, tile_size, 1)
+    print(f"{side}x{side}, {cores} cores, tiles of {tile_size}")
+    print(f"{'workers':>8} {'seconds':>8} {'speedup':>8}")
+    print(f"{'untiled':>8} {baseline:>8.2f} {1:>8.2f}")
+    workers = 2
+    while workers <= cores * 2:
+        elapsed = bench_workers(side, tile_size, workers)
+        print(f"{workers:>8} {elapsed:>8.2f} {baseline / elapsed:>8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
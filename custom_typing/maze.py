@@ -1,7 +1,7 @@
-from typing import Dict, Tuple, TypeAlias, TYPE_CHECKING
+from typing import Tuple, TypeAlias, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from src.Cell import Cell
+    from src.Board import Board
 
 
 # Constantes para las direcciones bit a bit
@@ -10,6 +10,12 @@ EAST = 0b0010
 SOUTH = 0b0100
 WEST = 0b1000
 
+# Bits del byte de estado de cada celda
+VISITED = 0b0001
+FIXED = 0b0010
+START = 0b0100
+EXIT = 0b1000
+
 MOVEMENTS = {
     NORTH: (0, -1),
     SOUTH: (0, 1),
@@ -20,8 +26,8 @@ MOVEMENTS = {
 # Tipos de dato para el laberinto
 MazeWalls: TypeAlias = int
 Coordinate: TypeAlias = Tuple[int, int]
-MazeBoard: TypeAlias = Dict[Coordinate, 'Cell']
+MazeBoard: TypeAlias = 'Board'
 
 
 __all__ = ['MazeWalls', 'MazeBoard', 'Coordinate', 'NORTH', 'EAST', 'SOUTH',
-           'WEST']
+           'WEST', 'VISITED', 'FIXED', 'START', 'EXIT']
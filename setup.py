@@ -16,6 +16,9 @@ setup(
     packages=find_packages(),
     py_modules=["a_maze_ing"],
     python_requires=">=3.10",
+    extras_require={
+        "fast": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "a-maze-ing=a_maze_ing:main",
@@ -0,0 +1,386 @@
+"""Headless recording of generation and solving animations.
+
+The steps of ``generate_step_by_step`` and ``solve_step_by_step`` are
+applied to a single framebuffer as incremental updates, as the Renderer
+does in its window, and every sampled frame is encoded at once: only the
+changed rectangle goes into an animated GIF, or the whole frame into a
+numbered PNG or PPM image. Memory stays bounded by the framebuffer, one
+byte of color per cell and one encoded frame.
+"""
+
+from typing import BinaryIO, Iterable, Optional
+from custom_typing import MazeBoard
+from src.Board import START, EXIT, FIXED
+from src.Framebuffer import make_framebuffer
+from src.FrameScheduler import DirtyRegion, CellRect, ANIMATION_SECONDS
+from src.ImageRenderer import PNG_SIGNATURE, PNG_COMPRESSION, write_chunk
+from src.StepEvents import StepAction, StepEvent, StepBatch, Step
+import struct
+import zlib
+
+# Palette of every color the animation uses, as in the Renderer. The
+# framebuffer is drawn with palette indices as colors, so the low byte
+# of each pixel word is its index
+PALETTE = (
+    0x000000,  # Fondo
+    0xFFFFFF,  # Paredes
+    0x00FF00,  # Entrada y logo
+    0xE00000,  # Salida (0xFE00000 en la ventana)
+    0x0000FF,  # Explorando desde la entrada
+    0xFFFF00,  # Explorando desde la salida
+    0x4444FF,  # Visitando la entrada
+    0xFFFF44,  # Visitando la salida
+    0xFF00FF,  # Camino de la solución
+) + (0x000000,) * 7
+(BACKGROUND, WALL, START_COLOR, EXIT_COLOR, EXPLORING_START,
+ EXPLORING_GOAL, VISITING_START, VISITING_GOAL, SOLUTION) = range(9)
+
+# Step action -> interior color of its cells (others clear them)
+SOLVING_COLORS = bytearray(len(StepAction))
+SOLVING_COLORS[StepAction.VISITING_START] = VISITING_START
+SOLVING_COLORS[StepAction.VISITING_GOAL] = VISITING_GOAL
+SOLVING_COLORS[StepAction.FILLING_DEAD_END] = EXPLORING_GOAL
+SOLVING_COLORS[StepAction.SOLUTION_FOUND] = SOLUTION
+
+# Palette index -> one RGB channel, to expand frames to PPM
+CHANNELS = tuple(bytes(PALETTE[index] >> shift & 0xFF if index < 16 else 0
+                       for index in range(256))
+                 for shift in (16, 8, 0))
+
+# Default cell side in pixels, shrinking so frames stay this wide
+MAX_CELL_SIZE = 20
+MIN_CELL_SIZE = 3
+TARGET_IMAGE_SIDE = 800
+
+# GIF constants: 16-color table, LZW codes up to 12 bits
+GIF_COLOR_BITS = 4
+MAX_LZW_CODES = 4096
+# The last frame stays on screen this long before the GIF loops (1/100 s)
+FINAL_FRAME_DELAY = 300
+
+
+class AnimationRecorder:
+    """Record step streams into an animated GIF or an image sequence.
+
+    Every ``steps_per_frame`` steps the cells touched since the last
+    frame are redrawn as one rectangle and a frame is encoded. With
+    ``steps_per_frame`` 0 an animation lasts about ANIMATION_SECONDS at
+    ``fps`` frames per second, like the Renderer's.
+    """
+
+    def __init__(self, board: MazeBoard, cell_size: int = 0,
+                 steps_per_frame: int = 0, fps: int = 25) -> None:
+        """Prepare a framebuffer for a board, which may still be carved."""
+        self.board = board
+        self.cell_size = cell_size or max(MIN_CELL_SIZE, min(
+            MAX_CELL_SIZE,
+            TARGET_IMAGE_SIDE // max(board.width, board.height)))
+        if self.cell_size < MIN_CELL_SIZE:
+            raise ValueError(f"Cell size must be at least {MIN_CELL_SIZE}")
+        self.wall_thickness = 2 if self.cell_size >= 6 else 1
+        self.fps = fps
+        self.steps_per_frame = steps_per_frame or max(
+            1, len(board) // (fps * ANIMATION_SECONDS))
+        self.width = board.width * self.cell_size
+        self.height = board.height * self.cell_size
+        self.buffer = bytearray(self.width * self.height * 4)
+        self.framebuffer = make_framebuffer(self.buffer, self.width,
+                                            self.height)
+        self.dirty = DirtyRegion(board.width)
+        # Color del interior de cada celda (índice de la paleta)
+        self.colors = bytearray(board.size)
+
+    def record(self, file_name: str, *streams: Iterable[Step]) -> int:
+        """Record step streams one after another and return the frames.
+
+        A name ending in ``.gif`` gives an animated GIF; any other must
+        be a pattern such as ``frames/maze_{:05d}.png`` (or ``.ppm``)
+        and gives one image per frame. Streams may be batched, ideally
+        in batches of ``steps_per_frame`` steps.
+        """
+        with open_writer(file_name, self.width, self.height,
+                         self.fps) as writer:
+            self.draw_board()
+            writer.write_frame(self, (0, 0, self.width, self.height))
+            for steps in streams:
+                pending = 0
+                for step in steps:
+                    if isinstance(step, StepBatch):
+                        self.apply_batch(step)
+                        pending += len(step)
+                    else:
+                        self.apply(step)
+                        pending += 1
+                    if pending >= self.steps_per_frame:
+                        self._flush(writer)
+                        pending = 0
+                self._flush(writer)
+            return writer.frames
+
+    def apply(self, event: StepEvent) -> None:
+        """Mark the cells of a step as dirty and record their colors."""
+        self._paint(event.action, event.cells)
+
+    def apply_batch(self, batch: StepBatch) -> None:
+        """Apply every step of a batch in order."""
+        cells = batch.cells
+        start = 0
+        for action, end in zip(batch.actions, batch.ends):
+            self._paint(action, cells[start:end])
+            start = end
+
+    def _paint(self, action: int, cells: Iterable[int]) -> None:
+        """Mark cells as dirty and give them the color of an action."""
+        color = SOLVING_COLORS[action]
+        colors = self.colors
+        flags = self.board.flags
+        special = START | EXIT | FIXED
+        dirty = self.dirty
+        for index in cells:
+            dirty.add(index)
+            # Entrada, salida y logo conservan siempre su color
+            if not flags[index] & special:
+                colors[index] = color
+
+    def draw_board(self) -> None:
+        """Draw the whole board as it is now."""
+        board = self.board
+        self.colors[:] = bytes(board.size)
+        for index, flag in enumerate(board.flags):
+            if flag & EXIT and not flag & FIXED:
+                self.colors[index] = EXIT_COLOR
+            elif flag & (START | FIXED):
+                self.colors[index] = START_COLOR
+        self.dirty.clear()
+        self._redraw((0, 0, board.width, board.height))
+
+    def indices(self, rect: CellRect) -> bytes:
+        """Return the palette indices of a pixel rectangle, row by row."""
+        x0, y0, x1, y1 = rect
+        row = self.width * 4
+        return b"".join(self.buffer[y * row + x0 * 4:y * row + x1 * 4:4]
+                        for y in range(y0, y1))
+
+    def _flush(self, writer: "FrameWriter") -> None:
+        """Redraw the dirty cells and encode a frame if any changed."""
+        if not self.dirty:
+            return
+        x0, y0, x1, y1 = self.dirty.bounds()
+        self.dirty.clear()
+        self._redraw((x0, y0, x1, y1))
+        size = self.cell_size
+        # Las paredes del borde invaden un píxel fuera del rectángulo
+        writer.write_frame(self, (max(x0 * size - 1, 0),
+                                  max(y0 * size - 1, 0),
+                                  min(x1 * size + 1, self.width),
+                                  min(y1 * size + 1, self.height)))
+
+    def _redraw(self, region: CellRect) -> None:
+        """Clear a rectangle of cells and redraw its colors and walls."""
+        board = self.board
+        columns = board.width
+        size = self.cell_size
+        framebuffer = self.framebuffer
+        x0, y0, x1, y1 = region
+        framebuffer.fill_rect(x0 * size - 1, y0 * size - 1,
+                              (x1 - x0) * size + 2, (y1 - y0) * size + 2,
+                              BACKGROUND)
+        for y in range(y0, y1):
+            start = y * columns
+            for x, color in enumerate(self.colors[start + x0:start + x1],
+                                      x0):
+                if color:
+                    framebuffer.fill_rect(x * size + 1, y * size + 1,
+                                          size - 2, size - 2, color)
+        # Las paredes vecinas invaden un píxel de la región: se repintan
+        framebuffer.draw_walls(board.walls, columns, board.height, size,
+                               size, WALL, self.wall_thickness,
+                               (max(x0 - 1, 0), max(y0 - 1, 0),
+                                min(x1 + 1, columns),
+                                min(y1 + 1, board.height)))
+
+
+class FrameWriter:
+    """Destination of recorded frames."""
+
+    def __init__(self) -> None:
+        """Start with no frames written."""
+        self.frames = 0
+
+    def __enter__(self) -> "FrameWriter":
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Finish the output."""
+        self.close()
+
+    def write_frame(self, recorder: AnimationRecorder,
+                    rect: CellRect) -> None:
+        """Encode the pixel rectangle of the recorder that changed."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish the output."""
+
+
+class GifWriter(FrameWriter):
+    """Animated GIF whose frames are only the rectangles that changed.
+
+    Each frame is kept encoded until the next arrives, so the last one
+    can be written with a longer delay.
+    """
+
+    def __init__(self, file_name: str, width: int, height: int,
+                 fps: int) -> None:
+        """Open the file and write the header, palette and loop block."""
+        super().__init__()
+        self.delay = max(2, round(100 / fps))
+        self.pending: Optional[bytes] = None
+        self.file: BinaryIO = open(file_name, "wb")
+        self.file.write(b"GIF89a" + struct.pack(
+            "<HHBBB", width, height,
+            0x80 | (GIF_COLOR_BITS - 1) << 4 | (GIF_COLOR_BITS - 1), 0, 0))
+        self.file.write(b"".join(color.to_bytes(3, "big")
+                                 for color in PALETTE))
+        # Extensión NETSCAPE: repetir la animación sin fin
+        self.file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def write_frame(self, recorder: AnimationRecorder,
+                    rect: CellRect) -> None:
+        """Encode a rectangle as an image placed over the last frame."""
+        x0, y0, x1, y1 = rect
+        data = lzw_compress(recorder.indices(rect), GIF_COLOR_BITS)
+        blocks = b"".join(bytes([len(data[start:start + 255])])
+                          + data[start:start + 255]
+                          for start in range(0, len(data), 255))
+        self._write_pending(self.delay)
+        self.pending = (b"\x2c" + struct.pack("<HHHHB", x0, y0, x1 - x0,
+                                              y1 - y0, 0)
+                        + bytes([GIF_COLOR_BITS]) + blocks + b"\x00")
+        self.frames += 1
+
+    def _write_pending(self, delay: int) -> None:
+        """Write the pending frame behind its delay and disposal block."""
+        if self.pending is None:
+            return
+        # Disposal 1: el siguiente frame se dibuja encima de este
+        self.file.write(b"\x21\xf9\x04\x04" + struct.pack("<H", delay)
+                        + b"\x00\x00")
+        self.file.write(self.pending)
+        self.pending = None
+
+    def close(self) -> None:
+        """Write the last frame and the trailer, and close the file."""
+        self._write_pending(FINAL_FRAME_DELAY)
+        self.file.write(b"\x3b")
+        self.file.close()
+
+
+class FrameSequence(FrameWriter):
+    """Numbered PNG or PPM images, one full frame each."""
+
+    def __init__(self, pattern: str, width: int, height: int) -> None:
+        """Check the pattern and remember the image size."""
+        super().__init__()
+        if "{" not in pattern:
+            raise ValueError("An image sequence needs a pattern like "
+                             "frame_{:05d}.png")
+        self.pattern = pattern
+        self.width = width
+        self.height = height
+
+    def write_frame(self, recorder: AnimationRecorder,
+                    rect: CellRect) -> None:
+        """Write the whole frame as the next image of the sequence."""
+        pixels = recorder.indices((0, 0, self.width, self.height))
+        file_name = self.pattern.format(self.frames)
+        with open(file_name, "wb") as file:
+            if file_name.lower().endswith(".ppm"):
+                self._write_ppm(file, pixels)
+            else:
+                self._write_png(file, pixels)
+        self.frames += 1
+
+    def _write_ppm(self, file: BinaryIO, pixels: bytes) -> None:
+        """Write palette indices as a binary PPM image."""
+        rgb = bytearray(len(pixels) * 3)
+        for channel, table in enumerate(CHANNELS):
+            rgb[channel::3] = pixels.translate(table)
+        file.write(f"P6\n{self.width} {self.height}\n255\n".encode("ascii"))
+        file.write(rgb)
+
+    def _write_png(self, file: BinaryIO, pixels: bytes) -> None:
+        """Write palette indices as an 8-bit indexed PNG image."""
+        file.write(PNG_SIGNATURE)
+        write_chunk(file, b"IHDR", struct.pack(">IIBBBBB", self.width,
+                                               self.height, 8, 3, 0, 0, 0))
+        write_chunk(file, b"PLTE", b"".join(color.to_bytes(3, "big")
+                                            for color in PALETTE))
+        width = self.width
+        raw = b"".join(b"\x00" + pixels[start:start + width]
+                       for start in range(0, len(pixels), width))
+        write_chunk(file, b"IDAT", zlib.compress(raw, PNG_COMPRESSION))
+        write_chunk(file, b"IEND", b"")
+
+
+def open_writer(file_name: str, width: int, height: int,
+                fps: int) -> FrameWriter:
+    """Return the frame writer for a GIF name or an image pattern."""
+    if file_name.lower().endswith(".gif"):
+        return GifWriter(file_name, width, height, fps)
+    return FrameSequence(file_name, width, height)
+
+
+def lzw_compress(indices: bytes, code_size: int) -> bytes:
+    """Compress palette indices with the variable-width LZW of GIF.
+
+    Strings are keyed by ``prefix code << 8 | byte``, and the table is
+    cleared whenever it reaches the 4096 codes GIF allows.
+    """
+    clear = 1 << code_size
+    first_code = clear + 2
+    codes: dict[int, int] = {}
+    next_code = first_code
+    width = code_size + 1
+    output = bytearray()
+    # Bits pendientes de escribir, el primero en los bits bajos
+    bits = clear
+    count = width
+    prefix = indices[0]
+    for byte in memoryview(indices)[1:]:
+        key = prefix << 8 | byte
+        code = codes.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << count
+        count += width
+        if next_code == MAX_LZW_CODES:
+            bits |= clear << count
+            count += width
+            codes.clear()
+            next_code = first_code
+            width = code_size + 1
+        else:
+            codes[key] = next_code
+            next_code += 1
+            if next_code > 1 << width:
+                width += 1
+        while count >= 8:
+            output.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+        prefix = byte
+    bits |= prefix << count
+    count += width
+    # El decodificador añade una entrada más antes de leer el final
+    if next_code < MAX_LZW_CODES and next_code + 1 > 1 << width:
+        width += 1
+    bits |= (clear + 1) << count
+    count += width
+    while count > 0:
+        output.append(bits & 0xFF)
+        bits >>= 8
+        count -= 8
+    return bytes(output)
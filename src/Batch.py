@@ -0,0 +1,153 @@
+"""Headless batch generation of many mazes across CPU cores.
+
+This module must never import the Renderer, so batch runs work on
+machines without MLX or a display.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+from typing import Iterable, Iterator, Literal, Optional, TypeAlias
+from src.Config import Config, BINARY_EXTENSION, MAX_SEED
+from src.Generator import Generator
+from src.OutputFileHandler import OutputFileHandler
+from src.RandomSource import derive_seed
+from src.Solver import Solver
+import argparse
+import copy
+import io
+import os
+import tarfile
+import time
+
+# TypeAlias: (file name, maze bytes or None when already on disk)
+BatchResult: TypeAlias = tuple[str, Optional[bytes]]
+# TypeAlias: (file name, seed) of one maze to build
+BatchJob: TypeAlias = tuple[str, int]
+
+
+def build_maze(config: Config, output_dir: Optional[str],
+               job: BatchJob) -> BatchResult:
+    """Generate, solve and serialize one maze with the given seed."""
+    name, seed = job
+    maze_config = copy.copy(config)
+    maze_config.seed = seed
+    stream = io.BytesIO()
+    with redirect_stdout(io.StringIO()):
+        generator = Generator(maze_config)
+        generator.generate()
+        solver = Solver(generator.maze, maze_config.entry,
+                        maze_config.exit, maze_config.solver)
+        solver.solve_path()
+        OutputFileHandler.write(stream, generator.maze, maze_config,
+                                solver.path)
+    data = stream.getvalue()
+    if output_dir is None:
+        return name, data
+    with open(os.path.join(output_dir, name), "wb") as file:
+        file.write(data)
+    return name, None
+
+
+def build_mazes(config: Config, batch: Iterable[BatchJob], jobs: int,
+                output_dir: Optional[str]) -> Iterator[BatchResult]:
+    """Yield built mazes in batch order, in parallel when jobs > 1."""
+    worker = partial(build_maze, config, output_dir)
+    if jobs <= 1:
+        yield from map(worker, batch)
+        return
+    job_list = list(batch)
+    chunksize = max(1, len(job_list) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(worker, job_list, chunksize=chunksize)
+
+
+def parse_range(text: str, option: str) -> range:
+    """Parse a START:END command line range, END excluded."""
+    try:
+        first, last = (int(value) for value in text.split(":"))
+    except ValueError:
+        raise ValueError(f"{option} must look like START:END")
+    if last <= first:
+        raise ValueError(f"{option} END must be greater than START")
+    return range(first, last)
+
+
+def parse_jobs(args: argparse.Namespace, config: Config) -> list[BatchJob]:
+    """Return the name and seed of every maze selected on the command line.
+
+    Explicit ``--seeds`` are used as they are. Otherwise maze ``i`` of
+    the batch gets ``derive_seed(SEED, i)``, so ``--indices i:i+1``
+    rebuilds that single maze byte for byte.
+    """
+    # Mismo formato que elegiría save_file para OUTPUT_FILE
+    suffix = (BINARY_EXTENSION
+              if config.output_file.endswith(BINARY_EXTENSION) else ".txt")
+    if args.seeds:
+        seeds = parse_range(args.seeds, "--seeds")
+        if seeds.start < 0 or seeds.stop > MAX_SEED + 1:
+            raise ValueError(f"--seeds must be within 0:{MAX_SEED + 1}")
+        return [(f"maze_{seed}{suffix}", seed) for seed in seeds]
+    master = config.seed if config.seed is not None else 0
+    indices = (parse_range(args.indices, "--indices") if args.indices
+               else range(args.count))
+    return [(f"maze_{index}{suffix}", derive_seed(master, index))
+            for index in indices]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of the batch command."""
+    parser = argparse.ArgumentParser(
+        prog="a-maze-ing batch",
+        description="Generate, solve and write many mazes headlessly.")
+    parser.add_argument("config", help="configuration file (.txt)")
+    seeds = parser.add_mutually_exclusive_group()
+    seeds.add_argument("--count", type=int, default=100,
+                       help="number of mazes, seeded from SEED (default 100)")
+    seeds.add_argument("--indices", metavar="START:END",
+                       help="rebuild only these mazes of the SEED batch")
+    seeds.add_argument("--seeds", metavar="START:END",
+                       help="explicit seed range, END excluded")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--output-dir", default="mazes",
+                        help="write one file per maze (default: mazes)")
+    output.add_argument("--archive", metavar="FILE",
+                        help="write every maze to a single .tar/.tar.gz")
+    return parser.parse_args(argv)
+
+
+def run_batch(argv: list[str]) -> int:
+    """Run the batch command and return the process exit status."""
+    args = parse_args(argv)
+    config = Config(args.config)
+    try:
+        batch = parse_jobs(args, config)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    began = time.perf_counter()
+    count = 0
+    if args.archive:
+        mode: Literal["w:gz", "w"] = (
+            "w:gz" if args.archive.endswith(("gz", ".tgz")) else "w")
+        with tarfile.open(args.archive, mode) as archive:
+            for name, data in build_mazes(config, batch, args.jobs, None):
+                info = tarfile.TarInfo(name)
+                info.size = len(data or b"")
+                info.mtime = int(time.time())
+                archive.addfile(info, io.BytesIO(data or b""))
+                count += 1
+        destination = args.archive
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for _ in build_mazes(config, batch, args.jobs, args.output_dir):
+            count += 1
+        destination = args.output_dir
+
+    elapsed = time.perf_counter() - began
+    print(f"[OK] {count} mazes written to {destination} in {elapsed:.2f}s "
+          f"({count / elapsed:.1f} mazes/s with {args.jobs} workers)")
+    return 0
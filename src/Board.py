@@ -0,0 +1,281 @@
+"""Array-backed maze board storing walls and flags in flat byte arrays."""
+
+from typing import Iterable, Iterator, Optional, TypeAlias
+from custom_typing.maze import Coordinate, MOVEMENTS, NORTH, EAST, SOUTH, WEST
+from custom_typing.maze import VISITED, FIXED, START, EXIT
+from src.Cell import Cell, NeighborMap
+
+# The flag bits are defined with the directions, to share them with Cell
+__all__ = ['Board', 'BoardCell', 'VISITED', 'FIXED', 'START', 'EXIT',
+           'ALL_WALLS', 'DIRECTIONS', 'OPPOSITE', 'IndexNeighbors', 'fill']
+
+ALL_WALLS = NORTH | EAST | SOUTH | WEST
+DIRECTIONS: tuple[int, ...] = (NORTH, EAST, SOUTH, WEST)
+OPPOSITE: dict[int, int] = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST,
+                            WEST: EAST}
+
+# TypeAlias for (direction, neighbor index) pairs
+IndexNeighbors: TypeAlias = list[tuple[int, int]]
+
+# Primer tramo copiado al rellenar un array, antes de duplicarlo
+FILL_CHUNK = 1 << 16
+CLOSED_CHUNK = bytes([ALL_WALLS]) * FILL_CHUNK
+CLEAR_CHUNK = bytes(FILL_CHUNK)
+
+
+def fill(buffer: bytearray, chunk: bytes) -> None:
+    """Overwrite a buffer in place with copies of a one-byte chunk.
+
+    The chunk is copied once and the filled prefix is then doubled, so
+    a board of any size takes a few dozen slice copies and no temporary
+    buffer, as fast as allocating a new one.
+    """
+    view = memoryview(buffer)
+    end = len(buffer)
+    done = min(len(chunk), end)
+    view[:done] = memoryview(chunk)[:done]
+    while done < end:
+        step = min(done, end - done)
+        view[done:done + step] = view[:step]
+        done += step
+
+
+class Board:
+    """Maze board backed by flat arrays indexed by ``y * width + x``.
+
+    Coordinates stay 1-based as everywhere else in the project, so the
+    cell ``(x, y)`` lives at index ``(y - 1) * width + (x - 1)``. The
+    board also behaves like the old ``Dict[Coordinate, Cell]`` so code
+    written against the mapping API keeps working through ``BoardCell``
+    views.
+
+    Walls on the board border are never opened, so a cell's open walls
+    can be followed with the ``steps`` offsets without bounds checks.
+
+    ``version`` changes whenever the board is reallocated or carved, so
+    cached solutions of an older content are never reused. Code writing
+    ``walls`` directly must call ``touch`` afterwards; weights are set
+    with ``set_weights``, which does it.
+    """
+
+    def __init__(self, width: int = 0, height: int = 0) -> None:
+        """Initialize a board with every wall closed."""
+        self.width: int = 0
+        self.height: int = 0
+        self.size: int = 0
+        self.walls: bytearray = bytearray()
+        self.flags: bytearray = bytearray()
+        # Optional cost of entering each cell, used by weighted solvers
+        self.weights: Optional[bytearray] = None
+        self.steps: IndexNeighbors = []
+        self.version: int = 0
+        self.allocate(width, height)
+
+    def allocate(self, width: int, height: int) -> None:
+        """Allocate fresh storage for a board of the given size."""
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.walls = bytearray([ALL_WALLS]) * self.size
+        self.flags = bytearray(self.size)
+        self.weights = None
+        self.steps = [(NORTH, -width), (EAST, 1), (SOUTH, width), (WEST, -1)]
+        self.touch()
+
+    def reset(self) -> None:
+        """Close every wall and clear every flag, reusing the storage.
+
+        Unlike ``allocate``, the arrays and the ``steps`` offsets are
+        kept, so views over them stay valid and no second board is held
+        while the new one is filled.
+        """
+        fill(self.walls, CLOSED_CHUNK)
+        fill(self.flags, CLEAR_CHUNK)
+        self.weights = None
+        self.touch()
+
+    def touch(self) -> None:
+        """Mark the content as changed, invalidating cached solutions."""
+        self.version += 1
+
+    def set_weights(self, weights: Optional[Iterable[int]]) -> None:
+        """Set the cost (1-255) of entering each cell, or clear them.
+
+        Raises ValueError unless there is one weight per cell.
+        """
+        if weights is None:
+            self.weights = None
+        else:
+            values = bytearray(weights)
+            if len(values) != self.size:
+                raise ValueError(f"Expected {self.size} cell weights, "
+                                 f"got {len(values)}")
+            if values.count(0):
+                raise ValueError("Cell weights must be at least 1")
+            self.weights = values
+        self.touch()
+
+    # ===== INDEX ARITHMETIC =====
+
+    def index(self, coord: Coordinate) -> int:
+        """Return the flat index of a 1-based coordinate."""
+        return (coord[1] - 1) * self.width + (coord[0] - 1)
+
+    def coord(self, index: int) -> Coordinate:
+        """Return the 1-based coordinate of a flat index."""
+        y, x = divmod(index, self.width)
+        return (x + 1, y + 1)
+
+    def in_bounds(self, coord: Coordinate) -> bool:
+        """Check if a coordinate lies inside the board."""
+        return 1 <= coord[0] <= self.width and 1 <= coord[1] <= self.height
+
+    def neighbor(self, index: int, direction: int) -> int:
+        """Return the neighbor index in a direction, or -1 if outside."""
+        width = self.width
+        if direction == NORTH:
+            return index - width if index >= width else -1
+        if direction == SOUTH:
+            return index + width if index + width < self.size else -1
+        if direction == EAST:
+            return index + 1 if (index + 1) % width else -1
+        if direction == WEST:
+            return index - 1 if index % width else -1
+        raise ValueError(f"Invalid direction: {direction}")
+
+    def neighbors(self, index: int) -> IndexNeighbors:
+        """Return the in-bounds neighbors of a cell in N, E, S, W order."""
+        width = self.width
+        x = index % width
+        result: IndexNeighbors = []
+        if index >= width:
+            result.append((NORTH, index - width))
+        if x + 1 < width:
+            result.append((EAST, index + 1))
+        if index + width < self.size:
+            result.append((SOUTH, index + width))
+        if x:
+            result.append((WEST, index - 1))
+        return result
+
+    def open_neighbors(self, index: int) -> IndexNeighbors:
+        """Return the neighbors reachable without crossing a wall."""
+        walls = self.walls[index]
+        return [(direction, neighbor)
+                for direction, neighbor in self.neighbors(index)
+                if not walls & direction]
+
+    def remove_wall_between(self, index: int, direction: int) -> int:
+        """Open the wall on both sides and return the neighbor index."""
+        neighbor = self.neighbor(index, direction)
+        if neighbor < 0:
+            raise ValueError("Cannot open a wall on the board border")
+        self.walls[index] &= ~direction
+        self.walls[neighbor] &= ~OPPOSITE[direction]
+        return neighbor
+
+    # ===== MAPPING API =====
+
+    def cell(self, index: int) -> 'BoardCell':
+        """Return a Cell view over the cell at a flat index."""
+        return BoardCell(self, index)
+
+    def get(self, coord: Coordinate,
+            default: Optional['BoardCell'] = None) -> Optional['BoardCell']:
+        """Return the Cell view at a coordinate or a default value."""
+        if not self.in_bounds(coord):
+            return default
+        return BoardCell(self, self.index(coord))
+
+    def keys(self) -> Iterator[Coordinate]:
+        """Iterate over every coordinate in row-major order."""
+        for y in range(1, self.height + 1):
+            for x in range(1, self.width + 1):
+                yield (x, y)
+
+    def values(self) -> Iterator['BoardCell']:
+        """Iterate over a Cell view of every cell in row-major order."""
+        for index in range(self.size):
+            yield BoardCell(self, index)
+
+    def items(self) -> Iterator[tuple[Coordinate, 'BoardCell']]:
+        """Iterate over (coordinate, Cell view) pairs."""
+        for index in range(self.size):
+            cell = BoardCell(self, index)
+            yield cell.coord, cell
+
+    def __getitem__(self, coord: Coordinate) -> 'BoardCell':
+        """Return the Cell view at a coordinate."""
+        if not self.in_bounds(coord):
+            raise KeyError(coord)
+        return BoardCell(self, self.index(coord))
+
+    def __contains__(self, coord: object) -> bool:
+        """Check if a coordinate belongs to the board."""
+        return (isinstance(coord, tuple) and len(coord) == 2
+                and self.in_bounds(coord))
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        """Iterate over every coordinate like a dict would."""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Return the number of cells."""
+        return self.size
+
+
+class BoardCell(Cell):
+    """Cell view that reads and writes its state from a Board."""
+
+    __slots__ = ('_board', '_index')
+
+    def __init__(self, board: Board, index: int) -> None:
+        """Bind the view to a board cell without copying its state."""
+        self._board = board
+        self._index = index
+        self.coord = board.coord(index)
+
+    @property
+    def index(self) -> int:
+        """Return the flat index of the cell."""
+        return self._index
+
+    @property
+    def walls(self) -> int:
+        """Return the wall bitfield of the cell."""
+        return self._board.walls[self._index]
+
+    @walls.setter
+    def walls(self, value: int) -> None:
+        self._board.walls[self._index] = value & ALL_WALLS
+        self._board.touch()
+
+    @property
+    def flags(self) -> int:
+        """Return the flag byte of the cell."""
+        return self._board.flags[self._index]
+
+    @flags.setter
+    def flags(self, value: int) -> None:
+        self._board.flags[self._index] = value
+
+    @property
+    def neighbors(self) -> NeighborMap:
+        """Return the in-bounds neighbors computed from the index."""
+        return {direction: BoardCell(self._board, neighbor)
+                for direction, neighbor in self._board.neighbors(self._index)}
+
+    def set_maze_reference(self, maze: 'Board') -> None:
+        """Do nothing, a view is always bound to its board."""
+
+    def get_accessible_neighbors(self) -> NeighborMap:
+        """Return a dict with the accessible neighbors of this cell."""
+        board = self._board
+        walls = board.walls[self._index]
+        neighbors: NeighborMap = {}
+        for direction in MOVEMENTS:
+            if not walls & direction:
+                neighbor = board.neighbor(self._index, direction)
+                if neighbor >= 0:
+                    neighbors[direction] = BoardCell(board, neighbor)
+        return neighbors
@@ -1,16 +1,50 @@
 """Configuration module for maze settings."""
 
 from custom_typing.maze import Coordinate
+from src.SolverStrategies import SOLVER_STRATEGIES, DEFAULT_STRATEGY
+from src.SolverStrategies import WallFollower
+from src.GenerationAlgorithms import GENERATION_ALGORITHMS
+from src.GenerationAlgorithms import DEFAULT_ALGORITHM
+from src.TiledGeneration import MIN_TILE_SIZE
+import os
 import sys
 
+# Size limits for the default and the large-maze modes
+MAX_DIMENSION = 100
+MAX_LARGE_DIMENSION = 50000
+MIN_DIMENSION = 10
+
+# Memory budget per cell in large-maze mode (bytes):
+#   2 -> board walls and flags bytearrays
+#   4 -> generation DFS stack (array of uint32, worst case)
+#   8 -> solver parent arrays (two int32 arrays)
+#   2 -> output row buffers and slack
+LARGE_MAZE_BYTES_PER_CELL = 16
+
+# Memory per column of the streaming Eller pipeline (bytes, measured
+# ~340): two rows of walls and labels, the member lists of each set and
+# the carved steps of one row; plus the fixed output buffers
+STREAMING_BYTES_PER_COLUMN = 384
+STREAMING_BUFFER_BYTES = 4 << 20
+
+# Extra paths opened in imperfect mazes unless LOOPS says otherwise
+DEFAULT_LOOPS = 10
+
+# Side of the tiles carved in parallel when WORKERS is not 1
+DEFAULT_TILE_SIZE = 1024
+
+# OUTPUT_FILE suffix selecting the packed binary format
+BINARY_EXTENSION = ".amz"
+
+# Seeds are stored as unsigned 64-bit integers in binary files
+MAX_SEED = (1 << 64) - 1
+
 
 class Config:
     """Configuration class for maze parameters."""
 
-    def __init__(self, config_file: str) -> None:
+    def __init__(self, config_file: str | None = None) -> None:
         """Initialize configuration from a file."""
-        print("Reading config file...")
-
         self.width: int = 0
         self.height: int = 0
         self.entry: Coordinate = (0, 0)
@@ -18,7 +52,23 @@ class Config:
         self.perfect: bool = False
         self.output_file: str = ""
         self.seed: int | None = None
+        self.large_maze: bool = False
+        self.solver: str = DEFAULT_STRATEGY
+        self.algorithm: str = DEFAULT_ALGORITHM
+        self.fps: int = 60
+        self.steps_per_frame: int = 0
+        self.loops: int = DEFAULT_LOOPS
+        self.braid: int = 0
+        self.workers: int = 1
+        self.tile_size: int = DEFAULT_TILE_SIZE
+        self.fast_random: bool = False
+        self.cache_dir: str = ""
+        # (mínimo, máximo) del coste aleatorio de cada celda
+        self.weights: tuple[int, int] | None = None
 
+        if config_file is None:
+            return
+        print("Reading config file...")
         try:
             self.parse_file(config_file)
             self.check_config()
@@ -28,6 +78,15 @@ class Config:
             print(f"Config File Error: {e}")
             sys.exit(1)
 
+    @classmethod
+    def from_values(cls, **values: object) -> 'Config':
+        """Build a validated configuration from KEY=value pairs."""
+        config = cls()
+        for key, value in values.items():
+            config.line_processor(key, str(value))
+        config.check_config()
+        return config
+
     def parse_file(self, config_file: str) -> None:
         """Parse the configuration file and extract values."""
         try:
@@ -47,10 +106,14 @@ class Config:
         """Validate the configuration values."""
         if not hasattr(self, 'width') or not self.width:
             raise Exception("Value WIDTH is needed!")
-        if self.width > 100 or self.height > 100:
-            raise Exception("Maximum width and height is 100")
-        if self.width < 10 or self.height < 10:
-            raise Exception("Minimum width and height is 10")
+        max_dimension = (MAX_LARGE_DIMENSION if self.large_maze
+                         else MAX_DIMENSION)
+        if self.width > max_dimension or self.height > max_dimension:
+            hint = "" if self.large_maze else " (set LARGE_MAZE=True)"
+            raise Exception(
+                f"Maximum width and height is {max_dimension}{hint}")
+        if self.width < MIN_DIMENSION or self.height < MIN_DIMENSION:
+            raise Exception(f"Minimum width and height is {MIN_DIMENSION}")
         if not hasattr(self, 'height') or not self.height:
             raise Exception("Value HEIGHT is needed!")
         if not hasattr(self, 'entry') or not isinstance(self.entry, tuple):
@@ -69,6 +132,87 @@ class Config:
             raise Exception("Value PERFECT is needed!")
         if not hasattr(self, 'output_file') or not self.output_file:
             raise Exception("Value OUTPUT_FILE is needed!")
+        if not 1 <= self.fps <= 240:
+            raise Exception("Value FPS must be between 1 and 240")
+        if self.steps_per_frame < 0:
+            raise Exception("Value STEPS_PER_FRAME can't be negative")
+        if self.loops < 0:
+            raise Exception("Value LOOPS can't be negative")
+        if not 0 <= self.braid <= 100:
+            raise Exception("Value BRAID must be between 0 and 100")
+        if self.solver == WallFollower.name and not self.perfect:
+            # Con bucles la salida puede quedar en una isla inalcanzable
+            raise Exception(
+                f"SOLVER={WallFollower.name} only works on perfect mazes "
+                "(set PERFECT=True or pick another SOLVER)")
+        if self.seed is not None and not 0 <= self.seed <= MAX_SEED:
+            raise Exception(f"Value SEED must be between 0 and {MAX_SEED}")
+        if self.weights is not None:
+            low, high = self.weights
+            if not 1 <= low <= high <= 255:
+                raise Exception("Value WEIGHTS must be MIN-MAX with "
+                                "1 <= MIN <= MAX <= 255")
+            if self.streaming:
+                raise Exception("Value WEIGHTS can't be used with a "
+                                "streamed maze")
+        if self.workers < 0:
+            raise Exception("Value WORKERS can't be negative")
+        if self.tile_size < MIN_TILE_SIZE:
+            raise Exception(
+                f"Value TILE_SIZE must be at least {MIN_TILE_SIZE}")
+        if self.large_maze:
+            self.check_memory()
+
+    @property
+    def streaming(self) -> bool:
+        """Whether a large maze is streamed to disk row by row.
+
+        Large Eller mazes written in the text format never hold the
+        whole board: finished rows go straight to the output file.
+        """
+        return (self.large_maze and self.algorithm == "eller"
+                and not self.output_file.endswith(BINARY_EXTENSION))
+
+    @property
+    def tiled(self) -> bool:
+        """Whether a large maze is carved in tiles on worker processes."""
+        return self.large_maze and self.workers != 1 and not self.streaming
+
+    def estimate_memory(self) -> int:
+        """Return the estimated peak memory in bytes of a large maze."""
+        if self.streaming:
+            return (self.width * STREAMING_BYTES_PER_COLUMN
+                    + STREAMING_BUFFER_BYTES)
+        return self.width * self.height * LARGE_MAZE_BYTES_PER_CELL
+
+    def check_memory(self) -> None:
+        """Fail early if the maze would not fit in the available RAM."""
+        available = Config.available_memory()
+        needed = self.estimate_memory()
+        if available is not None and needed > available:
+            basis = (f"{STREAMING_BYTES_PER_COLUMN} bytes per column, "
+                     f"streamed" if self.streaming
+                     else f"{LARGE_MAZE_BYTES_PER_CELL} bytes per cell")
+            raise Exception(
+                f"A {self.width}x{self.height} maze needs about "
+                f"{needed / 2**20:.0f} MiB ({basis}) but only "
+                f"{available / 2**20:.0f} MiB are available")
+
+    @staticmethod
+    def available_memory() -> int | None:
+        """Return the available RAM in bytes, or None if unknown."""
+        try:
+            with open("/proc/meminfo", "r") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        try:
+            return (os.sysconf("SC_AVPHYS_PAGES")
+                    * os.sysconf("SC_PAGE_SIZE"))
+        except (AttributeError, ValueError, OSError):
+            return None
 
     def line_processor(self, key: str, value: str) -> None:
         """Process a single configuration line."""
@@ -94,6 +238,49 @@ class Config:
                 self.output_file = value
             elif key == "SEED":
                 self.seed = int(value)
+            elif key == "LARGE_MAZE":
+                if value == "True":
+                    self.large_maze = True
+                elif value == "False":
+                    self.large_maze = False
+                else:
+                    raise ValueError("Invalid boolean for LARGE_MAZE")
+            elif key == "SOLVER":
+                if value not in SOLVER_STRATEGIES:
+                    raise ValueError(
+                        f"Invalid SOLVER, expected one of: "
+                        f"{', '.join(SOLVER_STRATEGIES)}")
+                self.solver = value
+            elif key == "ALGORITHM":
+                if value not in GENERATION_ALGORITHMS:
+                    raise ValueError(
+                        f"Invalid ALGORITHM, expected one of: "
+                        f"{', '.join(GENERATION_ALGORITHMS)}")
+                self.algorithm = value
+            elif key == "FPS":
+                self.fps = int(value)
+            elif key == "STEPS_PER_FRAME":
+                self.steps_per_frame = int(value)
+            elif key == "LOOPS":
+                self.loops = int(value)
+            elif key == "BRAID":
+                self.braid = int(value.rstrip("%"))
+            elif key == "WORKERS":
+                self.workers = int(value)
+            elif key == "TILE_SIZE":
+                self.tile_size = int(value)
+            elif key == "FAST_RANDOM":
+                if value == "True":
+                    self.fast_random = True
+                elif value == "False":
+                    self.fast_random = False
+                else:
+                    raise ValueError("Invalid boolean for FAST_RANDOM")
+            elif key == "CACHE_DIR":
+                self.cache_dir = value
+            elif key == "WEIGHTS":
+                low, high = value.split("-")
+                self.weights = (int(low), int(high))
             else:
                 raise ValueError(f"Unknown configuration key: {key}")
         except Exception as e:
@@ -0,0 +1,122 @@
+"""Frame pacing and dirty-rectangle tracking for animated rendering."""
+
+from typing import Any, Iterator, TypeAlias
+import time
+
+# (x0, y0, x1, y1) in 0-based cell units, end coordinates excluded
+CellRect: TypeAlias = tuple[int, int, int, int]
+
+# Fraction of the frame time that may be spent pulling steps
+DRAIN_BUDGET = 0.8
+
+# Duración aproximada de una animación cuando STEPS_PER_FRAME=0
+ANIMATION_SECONDS = 8
+
+
+class DirtyRegion:
+    """Set of modified cells merged into rectangles once per frame."""
+
+    def __init__(self, columns: int) -> None:
+        """Initialize an empty region for a board of the given width."""
+        self.columns = columns
+        self.cells: set[int] = set()
+
+    def add(self, index: int) -> None:
+        """Mark a cell as modified."""
+        self.cells.add(index)
+
+    def clear(self) -> None:
+        """Forget every modified cell."""
+        self.cells.clear()
+
+    def __bool__(self) -> bool:
+        """Return whether any cell is dirty."""
+        return bool(self.cells)
+
+    def bounds(self) -> CellRect:
+        """Return the smallest rectangle containing every dirty cell."""
+        columns = self.columns
+        xs = [index % columns for index in self.cells]
+        return (min(xs), min(self.cells) // columns,
+                max(xs) + 1, max(self.cells) // columns + 1)
+
+    def rectangles(self) -> list[CellRect]:
+        """Merge the dirty cells into rectangles covering exactly them.
+
+        Cells are first grouped into horizontal runs per row; runs with
+        the same span in consecutive rows are then merged vertically.
+        """
+        rects: list[CellRect] = []
+        # Rectángulos abiertos: tramo (x0, x1) -> fila superior
+        open_rects: dict[tuple[int, int], int] = {}
+        previous = -2
+        for y, runs in self._row_runs():
+            if y != previous + 1:
+                for (x0, x1), top in open_rects.items():
+                    rects.append((x0, top, x1, previous + 1))
+                open_rects = {}
+            still_open = {span: open_rects.pop(span, y) for span in runs}
+            for (x0, x1), top in open_rects.items():
+                rects.append((x0, top, x1, y))
+            open_rects = still_open
+            previous = y
+        for (x0, x1), top in open_rects.items():
+            rects.append((x0, top, x1, previous + 1))
+        return rects
+
+    def _row_runs(self) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+        """Yield each dirty row with its runs of consecutive cells."""
+        row = -1
+        runs: list[tuple[int, int]] = []
+        for index in sorted(self.cells):
+            y, x = divmod(index, self.columns)
+            if y != row:
+                if runs:
+                    yield row, runs
+                row, runs = y, [(x, x + 1)]
+            elif runs[-1][1] == x:
+                runs[-1] = (runs[-1][0], x + 1)
+            else:
+                runs.append((x, x + 1))
+        if runs:
+            yield row, runs
+
+
+class FrameScheduler:
+    """Paces animation frames at a target FPS and drains steps per frame.
+
+    Each frame pulls up to ``steps_per_frame`` steps from a step
+    generator, stopping early once the frame's time budget is spent.
+    """
+
+    def __init__(self, fps: int, steps_per_frame: int = 1) -> None:
+        """Initialize the scheduler for a target frame rate."""
+        self.fps = fps
+        self.frame_time = 1.0 / fps
+        self.steps_per_frame = max(1, steps_per_frame)
+        self.last_frame: float = 0.0
+
+    def start(self) -> None:
+        """Reset the frame clock so the first frame is due now."""
+        self.last_frame = time.perf_counter() - self.frame_time
+
+    def due(self) -> bool:
+        """Return whether the next frame should be produced now."""
+        now = time.perf_counter()
+        if now - self.last_frame < self.frame_time:
+            return False
+        self.last_frame = now
+        return True
+
+    def drain(self, steps: Iterator[Any]) -> tuple[list[Any], bool]:
+        """Pull the steps of one frame and whether the stream ended."""
+        deadline = self.last_frame + self.frame_time * DRAIN_BUDGET
+        batch: list[Any] = []
+        for _ in range(self.steps_per_frame):
+            try:
+                batch.append(next(steps))
+            except StopIteration:
+                return batch, True
+            if time.perf_counter() >= deadline:
+                break
+        return batch, False
@@ -0,0 +1,180 @@
+"""Framebuffers drawing into 32-bit pixel buffers with bulk slice writes.
+
+Pixels are stored as little-endian ``0xAARRGGBB`` words, the layout of
+the MLX image returned by ``mlx_get_data_addr``. NumPy is optional: when
+it is installed the buffer is wrapped as a zero-copy ``uint32`` array,
+otherwise a ``memoryview`` fallback copies whole rows at a time.
+"""
+
+from array import array
+from typing import Any, TypeAlias
+from custom_typing.maze import NORTH, EAST, SOUTH, WEST
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+OPAQUE = 0xFF000000
+
+# (x0, y0, x1, y1) in 0-based cell units, end coordinates excluded
+CellRegion: TypeAlias = tuple[int, int, int, int]
+
+
+class Framebuffer:
+    """Pure Python framebuffer over a writable buffer of 32-bit pixels."""
+
+    def __init__(self, buffer: Any, width: int, height: int,
+                 stride: int | None = None) -> None:
+        """Wrap a buffer of at least ``stride * height`` pixels."""
+        self.width = width
+        self.height = height
+        self.stride = stride or width
+        # memoryview plano aquí, array (alto, ancho) en NumpyFramebuffer
+        self.pixels: Any = memoryview(buffer).cast('B').cast('I')
+
+    @staticmethod
+    def pixel(color: int) -> int:
+        """Return the opaque 32-bit pixel value of a 0xRRGGBB color."""
+        return (OPAQUE | color) & 0xFFFFFFFF
+
+    def fill(self, color: int) -> None:
+        """Fill the whole buffer with a color."""
+        row = array('I', [self.pixel(color)]) * self.width
+        for y in range(self.height):
+            offset = y * self.stride
+            self.pixels[offset:offset + self.width] = row
+
+    def put_pixel(self, x: int, y: int, color: int) -> None:
+        """Set one pixel, ignoring coordinates outside the buffer."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[y * self.stride + x] = self.pixel(color)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int,
+                  color: int) -> None:
+        """Fill the rectangle [x, x + width) x [y, y + height), clipped."""
+        x_start, x_end = max(x, 0), min(x + width, self.width)
+        y_start, y_end = max(y, 0), min(y + height, self.height)
+        if x_start >= x_end or y_start >= y_end:
+            return
+        row = array('I', [self.pixel(color)]) * (x_end - x_start)
+        for py in range(y_start, y_end):
+            offset = py * self.stride
+            self.pixels[offset + x_start:offset + x_end] = row
+
+    def draw_walls(self, walls: bytes | bytearray, columns: int, rows: int,
+                   cell_width: int, cell_height: int, color: int,
+                   thickness: int, region: CellRegion | None = None) -> None:
+        """Draw the walls of a grid of cells, or of a region of it.
+
+        Every wall is a ``thickness`` wide band centered on the cell edge
+        that spans the edge including both end points, like the lines
+        drawn by the Renderer. ``region`` is ``(x0, y0, x1, y1)`` in
+        0-based cell units with the end coordinates excluded.
+        """
+        x0, y0, x1, y1 = region or (0, 0, columns, rows)
+        shift = thickness // 2
+        for cell_y in range(y0, y1):
+            py = cell_y * cell_height
+            for cell_x in range(x0, x1):
+                cell_walls = walls[cell_y * columns + cell_x]
+                if not cell_walls:
+                    continue
+                px = cell_x * cell_width
+                if cell_walls & NORTH:
+                    self.fill_rect(px, py - shift, cell_width + 1,
+                                   thickness, color)
+                if cell_walls & SOUTH:
+                    self.fill_rect(px, py + cell_height - shift,
+                                   cell_width + 1, thickness, color)
+                if cell_walls & WEST:
+                    self.fill_rect(px - shift, py, thickness,
+                                   cell_height + 1, color)
+                if cell_walls & EAST:
+                    self.fill_rect(px + cell_width - shift, py, thickness,
+                                   cell_height + 1, color)
+
+
+class NumpyFramebuffer(Framebuffer):
+    """Framebuffer backed by a zero-copy NumPy ``uint32`` view."""
+
+    def __init__(self, buffer: Any, width: int, height: int,
+                 stride: int | None = None) -> None:
+        """Wrap the buffer as a (height, width) array without copying."""
+        self.width = width
+        self.height = height
+        self.stride = stride or width
+        flat = np.frombuffer(buffer, dtype='<u4',
+                             count=self.stride * height)
+        self.pixels = flat.reshape(height, self.stride)[:, :width]
+
+    def fill(self, color: int) -> None:
+        """Fill the whole buffer with a color."""
+        self.pixels[:] = self.pixel(color)
+
+    def put_pixel(self, x: int, y: int, color: int) -> None:
+        """Set one pixel, ignoring coordinates outside the buffer."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[y, x] = self.pixel(color)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int,
+                  color: int) -> None:
+        """Fill the rectangle [x, x + width) x [y, y + height), clipped."""
+        x_start, x_end = max(x, 0), min(x + width, self.width)
+        y_start, y_end = max(y, 0), min(y + height, self.height)
+        if x_start < x_end and y_start < y_end:
+            self.pixels[y_start:y_end, x_start:x_end] = self.pixel(color)
+
+    def draw_walls(self, walls: bytes | bytearray, columns: int, rows: int,
+                   cell_width: int, cell_height: int, color: int,
+                   thickness: int, region: CellRegion | None = None) -> None:
+        """Draw the walls of a grid or region with a few masked writes."""
+        x0, y0, x1, y1 = region or (0, 0, columns, rows)
+        pixel = self.pixel(color)
+        shift = thickness // 2
+        grid = np.frombuffer(walls, dtype=np.uint8, count=columns * rows)
+        grid = grid.reshape(rows, columns)[y0:y1, x0:x1]
+        region_rows, region_columns = grid.shape
+        left, top = x0 * cell_width, y0 * cell_height
+
+        for direction, offset in ((NORTH, 0), (SOUTH, cell_height)):
+            mask = (grid & direction) != 0
+            # Each wall spans px .. px + cell_width, both ends included
+            spans = np.zeros((region_rows, region_columns * cell_width + 1),
+                             dtype=bool)
+            spans[:, :-1] = np.repeat(mask, cell_width, axis=1)
+            spans[:, cell_width::cell_width] |= mask
+            right = min(left + spans.shape[1], self.width)
+            spans = spans[:, :right - left]
+            for t in range(thickness):
+                ys = (top + np.arange(region_rows) * cell_height + offset
+                      + t - shift)
+                valid = (ys >= 0) & (ys < self.height)
+                band = self.pixels[ys[valid], left:right]
+                band[spans[valid]] = pixel
+                self.pixels[ys[valid], left:right] = band
+
+        for direction, offset in ((WEST, 0), (EAST, cell_width)):
+            mask = (grid & direction) != 0
+            spans = np.zeros((region_rows * cell_height + 1, region_columns),
+                             dtype=bool)
+            spans[:-1, :] = np.repeat(mask, cell_height, axis=0)
+            spans[cell_height::cell_height, :] |= mask
+            bottom = min(top + spans.shape[0], self.height)
+            spans = spans[:bottom - top, :]
+            for t in range(thickness):
+                xs = (left + np.arange(region_columns) * cell_width + offset
+                      + t - shift)
+                valid = (xs >= 0) & (xs < self.width)
+                band = self.pixels[top:bottom, xs[valid]]
+                band[spans[:, valid]] = pixel
+                self.pixels[top:bottom, xs[valid]] = band
+
+
+def make_framebuffer(buffer: Any, width: int, height: int,
+                     stride: int | None = None) -> Framebuffer:
+    """Return the fastest framebuffer available for a pixel buffer."""
+    if np is not None:
+        return NumpyFramebuffer(buffer, width, height, stride)
+    return Framebuffer(buffer, width, height, stride)
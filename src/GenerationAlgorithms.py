@@ -0,0 +1,575 @@
+"""Pluggable maze carving algorithms used by the Generator.
+
+Every algorithm carves a perfect maze over the cells that are not fixed
+logo cells, drawing from its own ``rng`` stream so seeded runs are
+reproducible and independent of any other generator. ``carve`` yields
+``(current, next)`` after opening the wall between two cells, which
+drives the generation animation.
+"""
+
+from array import array
+from collections import deque
+from typing import Collection, Generator, Iterator, MutableSequence
+from typing import TypeAlias
+from custom_typing.maze import NORTH, EAST, SOUTH, WEST
+from src.Board import Board, IndexNeighbors, OPPOSITE, VISITED, FIXED
+from src.Board import ALL_WALLS
+import random
+
+# (celda actual, celda siguiente o -1 al retroceder)
+CarveStep: TypeAlias = tuple[int, int]
+Carve: TypeAlias = Generator[CarveStep, None, None]
+UnvisitedNeighbors: TypeAlias = list[tuple[int, int]]
+UnionFind: TypeAlias = 'array[int]'
+
+# Valores que caben en un array('I'); más allá hace falta 'Q'
+UINT32_LIMIT = 1 << 32
+
+# Estados de celda del algoritmo de Prim
+OUTSIDE = 0
+FRONTIER = 1
+INSIDE = 2
+
+
+def find(parent: UnionFind, index: int) -> int:
+    """Return the root of a union-find set, halving the path."""
+    while parent[index] != index:
+        parent[index] = parent[parent[index]]
+        index = parent[index]
+    return index
+
+
+class GenerationAlgorithm:
+    """Base class for maze carving algorithms over a Board."""
+
+    name: str = ""
+    # Whether the fixed cells can leave parts of the maze disconnected
+    needs_repair: bool = False
+
+    def __init__(self, board: Board, large_maze: bool = False,
+                 rng: random.Random | None = None) -> None:
+        """Bind the algorithm to a board with every wall closed."""
+        self.board = board
+        self.large_maze = large_maze
+        self.rng = rng or random.Random()
+
+    def carve(self) -> Carve:
+        """Carve the maze, yielding every opened wall."""
+        raise NotImplementedError
+
+    def run(self) -> Carve:
+        """Carve the maze and join the parts the fixed cells cut off."""
+        yield from self.carve()
+        if self.needs_repair:
+            yield from self.connect_components()
+
+    def free_neighbors(self, index: int) -> IndexNeighbors:
+        """Return the in-bounds neighbors that are not fixed cells."""
+        flags = self.board.flags
+        return [(direction, neighbor)
+                for direction, neighbor in self.board.neighbors(index)
+                if not flags[neighbor] & FIXED]
+
+    def random_free_cell(self) -> int:
+        """Return a random cell that is not a fixed cell."""
+        flags = self.board.flags
+        while True:
+            index = self.rng.randrange(self.board.size)
+            if not flags[index] & FIXED:
+                return index
+
+    def open_wall(self, index: int, direction: int, neighbor: int) -> None:
+        """Open the wall between two adjacent cells on both sides."""
+        walls = self.board.walls
+        walls[index] &= ~direction
+        walls[neighbor] &= ~OPPOSITE[direction]
+
+    def connect_components(self) -> Carve:
+        """Join every part of the maze cut off from the first free cell.
+
+        Row-based algorithms cannot always link a run of cells to the
+        rest of the maze when fixed cells block the way. Each unreached
+        component gets exactly one random wall opened towards the part
+        already reached, so the maze stays perfect. The bookkeeping is
+        one byte per cell.
+        """
+        board = self.board
+        flags = board.flags
+        size = board.size
+        # 1 = unida al laberinto, 2 = componente en exploración
+        reached = bytearray(size)
+        root = next((index for index in range(size)
+                     if not flags[index] & FIXED), -1)
+        if root < 0:
+            return
+        self.flood(root, reached, 1, collect=False)
+        progress = True
+        while progress:
+            progress = False
+            for start in range(size):
+                if reached[start] or flags[start] & FIXED:
+                    continue
+                component = self.flood(start, reached, 2)
+                bridges = [(index, direction, neighbor)
+                           for index in component
+                           for direction, neighbor
+                           in self.free_neighbors(index)
+                           if reached[neighbor] == 1]
+                mark = 1 if bridges else 0
+                for index in component:
+                    reached[index] = mark
+                if bridges:
+                    index, direction, neighbor = self.rng.choice(bridges)
+                    self.open_wall(index, direction, neighbor)
+                    progress = True
+                    yield index, neighbor
+
+    def flood(self, start: int, reached: bytearray, mark: int,
+              collect: bool = True) -> list[int]:
+        """Mark the cells reachable from a cell, returning them if asked."""
+        walls = self.board.walls
+        steps = self.board.steps
+        reached[start] = mark
+        component = [start] if collect else []
+        frontier = deque([start])
+        while frontier:
+            current = frontier.popleft()
+            for direction, step in steps:
+                neighbor = current + step
+                if not walls[current] & direction and not reached[neighbor]:
+                    reached[neighbor] = mark
+                    frontier.append(neighbor)
+                    if collect:
+                        component.append(neighbor)
+        return component
+
+
+class DepthFirst(GenerationAlgorithm):
+    """Randomized iterative depth-first search (recursive backtracker)."""
+
+    name = "dfs"
+
+    def carve(self) -> Carve:
+        """Carve the board with iterative DFS over flat cell indices.
+
+        Yields ``(current, next)`` after breaking a wall and
+        ``(current, -1)`` after backtracking to a non-empty stack.
+        """
+        board = self.board
+        walls = board.walls
+        flags = board.flags
+        width = board.width
+        size = board.size
+        blocked = VISITED | FIXED
+        choice = self.rng.choice
+        # Iterative DFS: choose random initial cell
+        start_x: int = self.rng.randint(1, board.width)
+        start_y: int = self.rng.randint(1, board.height)
+        start: int = board.index((start_x, start_y))
+
+        # Stack of flat indices, a packed uint32 array in large-maze mode
+        stack: MutableSequence[int] = (
+            array('I', [start]) if self.large_maze else [start])
+        # Mark initial cell as visited
+        flags[start] |= VISITED
+
+        while stack:
+            current = stack[-1]
+            x = current % width
+
+            # Unvisited neighbors in N, E, S, W order
+            unvisited: UnvisitedNeighbors = []
+            if current >= width and not flags[current - width] & blocked:
+                unvisited.append((NORTH, current - width))
+            if x + 1 < width and not flags[current + 1] & blocked:
+                unvisited.append((EAST, current + 1))
+            if current + width < size and (
+                    not flags[current + width] & blocked):
+                unvisited.append((SOUTH, current + width))
+            if x and not flags[current - 1] & blocked:
+                unvisited.append((WEST, current - 1))
+
+            if unvisited:
+                direction, next_index = choice(unvisited)
+
+                # Break walls between current and next cell
+                walls[current] &= ~direction
+                walls[next_index] &= ~OPPOSITE[direction]
+
+                flags[next_index] |= VISITED
+                stack.append(next_index)
+                yield current, next_index
+            else:
+                # No unvisited neighbors, backtrack
+                stack.pop()
+                if stack:
+                    yield current, -1
+
+
+class Kruskal(GenerationAlgorithm):
+    """Randomized Kruskal: shuffled walls joined through union-find."""
+
+    name = "kruskal"
+
+    def carve(self) -> Carve:
+        """Open every shuffled wall that joins two different sets."""
+        board = self.board
+        flags = board.flags
+        width = board.width
+        size = board.size
+        # LARGE_MAZE llega a 2.5e9 celdas: 64 bits si 32 no bastan
+        parent = array('I' if size <= UINT32_LIMIT else 'Q', range(size))
+        # Paredes candidatas codificadas como índice * 2 + (0 este, 1 sur)
+        edges = array('I' if 2 * size <= UINT32_LIMIT else 'Q')
+        for index in range(size):
+            if flags[index] & FIXED:
+                continue
+            if (index + 1) % width and not flags[index + 1] & FIXED:
+                edges.append(index * 2)
+            if index + width < size and not flags[index + width] & FIXED:
+                edges.append(index * 2 + 1)
+        self.rng.shuffle(edges)
+
+        for edge in edges:
+            index = edge >> 1
+            direction, neighbor = ((SOUTH, index + width) if edge & 1
+                                   else (EAST, index + 1))
+            root, other = find(parent, index), find(parent, neighbor)
+            if root != other:
+                parent[root] = other
+                self.open_wall(index, direction, neighbor)
+                yield index, neighbor
+
+
+class Prim(GenerationAlgorithm):
+    """Randomized Prim: grow the maze from a random frontier cell."""
+
+    name = "prim"
+
+    def carve(self) -> Carve:
+        """Attach random frontier cells to a random inside neighbor."""
+        board = self.board
+        state = bytearray(board.size)
+        frontier = array('I')
+
+        def add_inside(index: int) -> None:
+            state[index] = INSIDE
+            for _, neighbor in self.free_neighbors(index):
+                if state[neighbor] == OUTSIDE:
+                    state[neighbor] = FRONTIER
+                    frontier.append(neighbor)
+
+        add_inside(self.random_free_cell())
+        while frontier:
+            # Sacar una celda al azar intercambiándola con la última
+            position = self.rng.randrange(len(frontier))
+            current = frontier[position]
+            frontier[position] = frontier[-1]
+            frontier.pop()
+            inside = [(direction, neighbor) for direction, neighbor
+                      in self.free_neighbors(current)
+                      if state[neighbor] == INSIDE]
+            direction, neighbor = self.rng.choice(inside)
+            self.open_wall(current, direction, neighbor)
+            add_inside(current)
+            yield neighbor, current
+
+
+class Wilson(GenerationAlgorithm):
+    """Wilson's algorithm: loop-erased random walks, uniform mazes."""
+
+    name = "wilson"
+
+    def carve(self) -> Carve:
+        """Walk randomly from each cell outside the tree until joining it.
+
+        Only the last exit direction of every walked cell is kept, which
+        erases the loops of the walk for free.
+        """
+        board = self.board
+        flags = board.flags
+        offsets = dict(board.steps)
+        in_tree = bytearray(board.size)
+        heading = bytearray(board.size)
+        in_tree[self.random_free_cell()] = 1
+
+        for start in range(board.size):
+            if in_tree[start] or flags[start] & FIXED:
+                continue
+            current = start
+            while not in_tree[current]:
+                options = self.free_neighbors(current)
+                if not options:
+                    # Celda aislada por celdas fijas: no se puede unir
+                    in_tree[current] = 1
+                    break
+                direction, neighbor = self.rng.choice(options)
+                heading[current] = direction
+                current = neighbor
+            current = start
+            while not in_tree[current]:
+                direction = heading[current]
+                neighbor = current + offsets[direction]
+                self.open_wall(current, direction, neighbor)
+                in_tree[current] = 1
+                yield current, neighbor
+                current = neighbor
+
+
+class AldousBroder(GenerationAlgorithm):
+    """Aldous-Broder: one random walk carving into unvisited cells."""
+
+    name = "aldous_broder"
+
+    def carve(self) -> Carve:
+        """Walk at random until every free cell has been visited."""
+        board = self.board
+        flags = board.flags
+        visited = bytearray(board.size)
+        remaining = sum(1 for flag in flags if not flag & FIXED) - 1
+        current = self.random_free_cell()
+        visited[current] = 1
+        while remaining > 0:
+            direction, neighbor = self.rng.choice(self.free_neighbors(current))
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                remaining -= 1
+                self.open_wall(current, direction, neighbor)
+                yield current, neighbor
+            current = neighbor
+
+
+class BinaryTree(GenerationAlgorithm):
+    """Binary tree: every cell opens its north or east wall."""
+
+    name = "binary_tree"
+    needs_repair = True
+
+    def carve(self) -> Carve:
+        """Open a random north or east wall of every cell."""
+        board = self.board
+        flags = board.flags
+        width = board.width
+        for index in range(board.size):
+            if flags[index] & FIXED:
+                continue
+            options: UnvisitedNeighbors = []
+            if index >= width and not flags[index - width] & FIXED:
+                options.append((NORTH, index - width))
+            if (index + 1) % width and not flags[index + 1] & FIXED:
+                options.append((EAST, index + 1))
+            if options:
+                direction, neighbor = self.rng.choice(options)
+                self.open_wall(index, direction, neighbor)
+                yield index, neighbor
+
+
+class Sidewinder(GenerationAlgorithm):
+    """Sidewinder: east runs closed by one north passage, row by row."""
+
+    name = "sidewinder"
+    needs_repair = True
+
+    def carve(self) -> Carve:
+        """Carve each row keeping only the current run in memory."""
+        board = self.board
+        flags = board.flags
+        width = board.width
+        for row in range(0, board.size, width):
+            run: list[int] = []
+            for index in range(row, row + width):
+                if flags[index] & FIXED:
+                    continue
+                run.append(index)
+                can_go_east = index + 1 < row + width and (
+                    not flags[index + 1] & FIXED)
+                if can_go_east and (not row or self.rng.random() < 0.5):
+                    self.open_wall(index, EAST, index + 1)
+                    yield index, index + 1
+                    continue
+                # Cerrar el tramo con un pasillo al norte
+                if row:
+                    members = [cell for cell in run
+                               if not flags[cell - width] & FIXED]
+                    if members:
+                        cell = self.rng.choice(members)
+                        self.open_wall(cell, NORTH, cell - width)
+                        yield cell, cell - width
+                run = []
+
+
+class EllerRows:
+    """Eller's algorithm emitting each row as soon as its walls are final.
+
+    Only the set label of each column of the current row and the walls
+    of the current and next rows are kept, so memory is O(width)
+    whatever the height. A set whose cells all sit above fixed cells is
+    merged with a neighboring set before dropping to the next row, so no
+    part of the maze is ever cut off by the logo.
+    """
+
+    def __init__(self, width: int, height: int, fixed: Collection[int],
+                 extra_paths: int = 0,
+                 rng: random.Random | None = None) -> None:
+        """Prepare a maze of the given size around the fixed indices.
+
+        ``extra_paths`` is roughly the number of loops added for
+        imperfect mazes, one wall opened inside a set at a time.
+        """
+        self.width = width
+        self.height = height
+        self.fixed = fixed
+        self.extra_paths = extra_paths
+        self.rng = rng or random.Random()
+        # Paredes abiertas al construir la última fila emitida
+        self.carved: list[CarveStep] = []
+        # Paredes conocidas de la fila siguiente (sus paredes norte)
+        self.below = bytearray()
+
+    def rows(self) -> Iterator[bytearray]:
+        """Yield the wall bitfields of each row, top to bottom.
+
+        Coin flips are drawn a row at a time with ``randbytes``, one byte
+        per column, instead of one ``random`` call per cell.
+        """
+        width = self.width
+        size = width * self.height
+        # Columnas fijas por fila: solo las filas del logo tienen alguna
+        fixed_columns: dict[int, set[int]] = {}
+        for index in self.fixed:
+            fixed_columns.setdefault(index - index % width, set()).add(
+                index % width)
+        no_columns: set[int] = set()
+        sets = array('I', [0]) * width
+        current = bytearray([ALL_WALLS]) * width
+        next_label = 1
+
+        for row in range(0, size, width):
+            last_row = row + width >= size
+            here = fixed_columns.get(row, no_columns)
+            below_fixed = fixed_columns.get(row + width, no_columns)
+            self.carved = []
+            # Celdas sin conjunto reciben uno nuevo; las fijas ninguno
+            members: dict[int, list[int]] = {}
+            for x in range(width):
+                if x in here:
+                    sets[x] = 0
+                    continue
+                if not sets[x]:
+                    sets[x] = next_label
+                    next_label += 1
+                members.setdefault(sets[x], []).append(x)
+
+            coins = self.rng.randbytes(width)
+            for x in range(width - 1):
+                label, other = sets[x], sets[x + 1]
+                if label != other and label and other and (
+                        last_row or coins[x] & 1):
+                    self._join(row, x, current, sets, members)
+            if self.extra_paths and (
+                    self.rng.random() < self.extra_paths / self.height):
+                # Un bucle: abrir una pared entre celdas del mismo conjunto
+                loops = [x for x in range(width - 1)
+                         if sets[x] and sets[x] == sets[x + 1]
+                         and current[x] & EAST]
+                if loops:
+                    self._open_east(row, self.rng.choice(loops), current)
+            if last_row:
+                self.below = bytearray()
+                yield current
+                return
+
+            if below_fixed:
+                self._merge_stuck_sets(row, current, sets, members,
+                                       below_fixed)
+
+            below = bytearray([ALL_WALLS]) * width
+            below_sets = array('I', [0]) * width
+            coins = self.rng.randbytes(width)
+            carved = self.carved
+            for label, columns in members.items():
+                dropped = False
+                for x in columns:
+                    if coins[x] & 1 and x not in below_fixed:
+                        dropped = True
+                        current[x] &= ~SOUTH
+                        below[x] &= ~NORTH
+                        below_sets[x] = label
+                        carved.append((row + x, row + width + x))
+                if not dropped:
+                    # Cada conjunto baja al menos por una celda
+                    x = self.rng.choice([x for x in columns
+                                         if x not in below_fixed])
+                    current[x] &= ~SOUTH
+                    below[x] &= ~NORTH
+                    below_sets[x] = label
+                    carved.append((row + x, row + width + x))
+            self.below = below
+            yield current
+            current, sets = below, below_sets
+
+    def _merge_stuck_sets(self, row: int, current: bytearray,
+                          sets: 'array[int]', members: dict[int, list[int]],
+                          below_fixed: set[int]) -> None:
+        """Join every set with no way down to a neighboring set."""
+        width = self.width
+        for label in list(members):
+            while label in members and all(
+                    x in below_fixed for x in members[label]):
+                options = [x for x in members[label]
+                           if x + 1 < width and sets[x + 1]
+                           and sets[x + 1] != label]
+                options += [x - 1 for x in members[label]
+                            if x and sets[x - 1] and sets[x - 1] != label]
+                if not options:
+                    raise ValueError("Fixed cells cut off part of the maze")
+                x = self.rng.choice(options)
+                self._join(row, x, current, sets, members)
+                label = sets[x]
+
+    def _open_east(self, row: int, x: int, current: bytearray) -> None:
+        """Open the wall between column x and x + 1 of the current row."""
+        current[x] &= ~EAST
+        current[x + 1] &= ~WEST
+        self.carved.append((row + x, row + x + 1))
+
+    def _join(self, row: int, x: int, current: bytearray,
+              sets: 'array[int]', members: dict[int, list[int]]) -> None:
+        """Open the east wall of column x and merge both sets."""
+        self._open_east(row, x, current)
+        label, other = sets[x], sets[x + 1]
+        # Reetiquetar el conjunto pequeño dentro del grande
+        if len(members[label]) < len(members[other]):
+            label, other = other, label
+        for column in members[other]:
+            sets[column] = label
+        members[label].extend(members.pop(other))
+
+
+class Eller(GenerationAlgorithm):
+    """Eller's algorithm: row by row with one row of set labels."""
+
+    name = "eller"
+
+    def carve(self) -> Carve:
+        """Copy each finished row of ``EllerRows`` into the board."""
+        board = self.board
+        width = board.width
+        fixed = {index for index, flag in enumerate(board.flags)
+                 if flag & FIXED}
+        stream = EllerRows(width, board.height, fixed, rng=self.rng)
+        for row, walls in enumerate(stream.rows()):
+            start = row * width
+            board.walls[start:start + width] = walls
+            # Las paredes norte de la fila siguiente ya están abiertas
+            if stream.below:
+                board.walls[start + width:start + 2 * width] = stream.below
+            yield from stream.carved
+
+
+GENERATION_ALGORITHMS: dict[str, type[GenerationAlgorithm]] = {
+    algorithm.name: algorithm
+    for algorithm in (DepthFirst, Kruskal, Prim, Wilson, AldousBroder,
+                      BinaryTree, Sidewinder, Eller)
+}
+DEFAULT_ALGORITHM = DepthFirst.name
@@ -1,20 +1,40 @@
-"""Maze generator module using DFS algorithm."""
+"""Maze generator module running pluggable carving algorithms."""
 
-from collections import deque
-from typing import TypeAlias, Generator as GenType, Any
-from custom_typing.maze import MazeBoard, Coordinate, NORTH, EAST, SOUTH, WEST
+from typing import TypeAlias, Iterator
+from custom_typing.maze import MazeBoard, Coordinate
 from src.Config import Config
-from src.Cell import Cell
+from src.Board import Board
+from src.Board import FIXED, START, EXIT
+from src.GenerationAlgorithms import GENERATION_ALGORITHMS, Carve, EllerRows
+from src.LoopInjector import LoopInjector
+from src.TiledGeneration import TiledGeneration
+from src.RandomSource import make_rng
+from src.StepEvents import StepAction, Step, RawStep, step_stream
 import random
 
-# TypeAlias for unvisited neighbors and wall candidates
-UnvisitedNeighbors: TypeAlias = list[tuple[int, Cell]]
-WallCandidate: TypeAlias = tuple[Cell, Cell, int]
-GeneratorStep: TypeAlias = dict[str, Any]
+# TypeAlias for the animation steps
+GeneratorStep: TypeAlias = Step
+
+# Offsets of the fixed "42" logo cells from the board center
+LOGO_PATTERN: list[Coordinate] = [
+    # Número "4"
+    (-3, -2), (-3, -1), (-3, 0),  # Línea vertical izquierda
+    (-2, 0),  # Línea horizontal media
+    (-1, 0), (-1, 1), (-1, 2),  # Línea vertical derecha
+
+    # Separación
+
+    # Número "2"
+    (1, -2), (2, -2), (3, -2),  # Línea superior
+    (3, -1),  # Bajada derecha
+    (1, 0), (2, 0), (3, 0),  # Línea media
+    (1, 1),  # Bajada izquierda
+    (1, 2), (2, 2), (3, 2),  # Línea inferior
+]
 
 
 class Generator:
-    """Maze generator using iterative DFS algorithm."""
+    """Maze generator running the configured carving algorithm."""
 
     def __init__(self, config: Config):
         """Initialize the generator with configuration settings."""
@@ -25,208 +45,150 @@ class Generator:
         self.exit: Coordinate = config.exit
         self.output_file: str = config.output_file
         self.seed: int | None = config.seed
-        self.maze: MazeBoard = {}
-        self.initialize_board()
+        self.large_maze: bool = config.large_maze
+        self.algorithm: str = config.algorithm
+        self.loops: int = config.loops
+        self.braid: int = config.braid
+        self.tiled: bool = config.tiled
+        self.workers: int = config.workers
+        self.tile_size: int = config.tile_size
+        self.fast_random: bool = config.fast_random
+        self.weights: tuple[int, int] | None = config.weights
+        self.rng: random.Random = make_rng(self.seed, self.fast_random)
+        self.streaming: bool = config.streaming
+        self.maze: MazeBoard = Board()
+        # En modo streaming el tablero completo nunca se reserva
+        if not self.streaming:
+            self.initialize_board()
 
     def _init_random(self) -> None:
-        """Initialize random generator with seed if provided."""
-        if self.seed is not None:
-            random.seed(self.seed)
+        """Restart this generator's own random stream from its seed."""
+        self.rng = make_rng(self.seed, self.fast_random)
 
     def generate(self) -> None:
-        """Generate the complete maze using iterative DFS algorithm."""
+        """Generate the complete maze with the configured algorithm."""
         print("\nGenerating...")
-        self._init_random()
-        # Iterative DFS: choose random initial cell
-        start_x: int = random.randint(1, self.width)
-        start_y: int = random.randint(1, self.height)
-        start_coord: Coordinate = (start_x, start_y)
-
-        # Stack for iterative DFS using Cell directly
-        start_cell: Cell = self.maze[start_coord]
-        stack: list[Cell] = [start_cell]
-
-        # Mark initial cell as visited
-        start_cell.visited = True
-
-        # Dictionary of opposite directions
-        opposites = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
-
-        while stack:
-            current_cell = stack[-1]
-
-            # Get unvisited neighbors directly from cell
-            unvisited_neighbors: UnvisitedNeighbors = []
-            for direction, neighbor in current_cell.neighbors.items():
-                if not neighbor.visited and not neighbor.is_fixed:
-                    unvisited_neighbors.append((direction, neighbor))
-
-            if unvisited_neighbors:
-                direction, next_cell = random.choice(unvisited_neighbors)
-
-                # Break walls between current_cell and next_cell
-                current_cell.remove_wall(direction)
-                next_cell.remove_wall(opposites[direction])
-
-                # Mark next_cell as visited
-                next_cell.visited = True
-
-                # Add next_cell to stack
-                stack.append(next_cell)
-            else:
-                # No unvisited neighbors, backtrack
-                stack.pop()
+        if self.tiled:
+            self._carve_tiled()
+        else:
+            for _ in self._carve():
+                pass
         if not self.perfect:
             print("\nAdding extra paths...")
             self._add_extra_paths()
+        self._add_weights()
+
+    def generate_step_by_step(
+            self, batch_size: int = 0) -> Iterator[GeneratorStep]:
+        """Generate the maze yielding each step for animation.
 
-    def generate_step_by_step(self) -> GenType[GeneratorStep, None, None]:
-        """Generate the maze using DFS yielding each step for animation."""
+        With ``batch_size`` the steps come in StepBatch chunks.
+        """
         print("\nGenerating...")
         print("Press Q in the maze window to abort generation")
-        self._init_random()
-        # Iterative DFS: choose random initial cell
-        start_x: int = random.randint(1, self.width)
-        start_y: int = random.randint(1, self.height)
-        start_coord: Coordinate = (start_x, start_y)
-
-        # Stack for iterative DFS using Cell directly
-        start_cell: Cell = self.maze[start_coord]
-        stack: list[Cell] = [start_cell]
-
-        # Mark initial cell as visited
-        start_cell.visited = True
-
-        # Dictionary of opposite directions
-        opposites = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
-
-        while stack:
-            current_cell = stack[-1]
-
-            # Get unvisited neighbors directly from cell
-            unvisited_neighbors: UnvisitedNeighbors = []
-            for direction, neighbor in current_cell.neighbors.items():
-                if not neighbor.visited and not neighbor.is_fixed:
-                    unvisited_neighbors.append((direction, neighbor))
-
-            if unvisited_neighbors:
-                direction, next_cell = random.choice(unvisited_neighbors)
-
-                # Break walls between current_cell and next_cell
-                current_cell.remove_wall(direction)
-                next_cell.remove_wall(opposites[direction])
-
-                # Mark next_cell as visited
-                next_cell.visited = True
-
-                # Add next_cell to stack
-                stack.append(next_cell)
-
-                yield {
-                    'current': current_cell.coord,
-                    'action': 'breaking_wall',
-                    'modified_cells': [current_cell, next_cell],
-                }
+        yield from step_stream(self._carve_steps(), batch_size)
+
+    def _carve_steps(self) -> Iterator[RawStep]:
+        """Carve the maze and add the extra paths, yielding raw steps."""
+        breaking = StepAction.BREAKING_WALL
+        backtracking = StepAction.BACKTRACKING
+        for current, next_index in self._carve():
+            if next_index >= 0:
+                yield breaking, current, (current, next_index)
             else:
-                # No unvisited neighbors, backtrack
-                stack.pop()
-                if stack:
-
-                    yield {
-                        'current': current_cell.coord,
-                        'action': 'backtracking',
-                        'modified_cells': [current_cell],
-                    }
+                yield backtracking, current, (current,)
         if not self.perfect:
             print("\nAdding extra paths...")
-            extra_path = self._add_extra_paths()
-            for cell in extra_path:
-                yield {
-                    'current': cell.coord,
-                    'action': 'adding_extra_path',
-                    'modified_cells': [cell],
-                }
-
-    def bfs_distance(self, start: Cell, end: Cell, max_dist: int = 10) -> int:
-        """Calculate BFS distance between two cells respecting walls."""
-        queue = deque([(start, 0)])
-        visited = set()
-        while queue:
-            current, dist = queue.popleft()
-            if current.coord == end.coord:
-                return dist
-            if current.coord in visited or dist > max_dist:
-                continue
-            visited.add(current.coord)
-            for direction, neighbor in current.neighbors.items():
-                if not current.has_wall(direction):
-                    queue.append((neighbor, dist + 1))
-        return 999999  # No path found
-
-    def _add_extra_paths(self, min_dist: int = 6,
-                         max_paths: int = 10) -> list[Cell]:
-        """Add extra paths avoiding trivial cycles."""
-        candidates = []
-
-        # Step 1: collect all candidate walls
-        for cell in self.maze.values():
-            for direction, neighbor in cell.neighbors.items():
-                if not cell.is_fixed and not neighbor.is_fixed and (
-                        cell.has_wall(direction)):
-                    candidates.append((cell, neighbor, direction))
-
-        random.shuffle(candidates)
-
-        extra_path_cells = []
-        added = 0
-
-        # Step 2: break walls if distance is long enough
-        for cell, neighbor, direction in candidates:
-            if added >= max_paths:
-                break
-            dist = self.bfs_distance(cell, neighbor, max_dist=5)
-            if dist >= min_dist:
-                cell.remove_wall(direction)
-                OPPOSITE = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
-                neighbor.remove_wall(OPPOSITE[direction])
-                extra_path_cells.extend([cell, neighbor])
-                added += 1
-
-        return extra_path_cells
+            for index in self._add_extra_paths():
+                yield StepAction.ADDING_EXTRA_PATH, index, (index,)
+        self._add_weights()
+
+    def stream_rows(self) -> Iterator[bytearray]:
+        """Generate an Eller maze yielding each row once it is final.
+
+        Uses O(width) memory and leaves ``self.maze`` empty. The logo
+        cells stay closed, except an entry or exit placed on them, which
+        must stay reachable.
+        """
+        print("\nGenerating rows...")
+        self._init_random()
+        fixed = {(y - 1) * self.width + (x - 1)
+                 for x, y in self.logo_cells()
+                 if (x, y) not in (self.entry, self.exit)}
+        stream = EllerRows(self.width, self.height, fixed,
+                           0 if self.perfect else self.loops, self.rng)
+        yield from stream.rows()
+
+    def _carve(self) -> Carve:
+        """Carve the board with the configured algorithm."""
+        if not self.maze.size:
+            # Un generador de streaming también puede generar en memoria
+            self.initialize_board()
+        self._init_random()
+        algorithm = GENERATION_ALGORITHMS[self.algorithm](
+            self.maze, self.large_maze, self.rng)
+        try:
+            yield from algorithm.run()
+        finally:
+            # También si la animación se aborta a medio tallar
+            self.maze.touch()
+
+    def _carve_tiled(self) -> None:
+        """Carve tiles on worker processes and stitch them together."""
+        self._init_random()
+        tiles = TiledGeneration(self.maze, self.algorithm, self.tile_size,
+                                self.workers, self.logo_cells(), self.rng,
+                                self.fast_random)
+        print(f"Carving {len(tiles.rows) * len(tiles.columns)} tiles...")
+        tiles.run(self.seed)
+        self.maze.touch()
+
+    def _add_extra_paths(self, min_dist: int = 6) -> list[int]:
+        """Add ``loops`` extra paths and braid ``braid`` % of dead ends.
+
+        No new cycle is shorter than ``min_dist + 1`` cells in the
+        carved maze; see ``LoopInjector``.
+        """
+        board = self.maze
+        injector = LoopInjector(board, min_dist, self.rng)
+        opened = injector.add_loops(self.loops)
+        if self.braid:
+            opened += injector.braid(self.braid / 100)
+        board.touch()
+        return [index for wall in opened for index in wall]
+
+    def _add_weights(self) -> None:
+        """Give every cell a random cost in the WEIGHTS range, if set."""
+        if self.weights is None:
+            return
+        low, high = self.weights
+        span = high - low + 1
+        # Cada byte aleatorio se escala al rango, casi uniforme
+        table = bytes(low + byte * span // 256 for byte in range(256))
+        self.maze.set_weights(
+            self.rng.randbytes(self.maze.size).translate(table))
 
     def initialize_board(self) -> None:
-        """Initialize the maze with all walls closed."""
+        """Initialize the maze with all walls closed.
+
+        A board that already has the configured size is reset in place.
+        """
+        board = self.maze
+        if board.size and (board.width, board.height) == (self.width,
+                                                          self.height):
+            board.reset()
+        else:
+            board.allocate(self.width, self.height)
+        if board.in_bounds(self.entry):
+            board.flags[board.index(self.entry)] |= START
+        if board.in_bounds(self.exit):
+            board.flags[board.index(self.exit)] |= EXIT
+
+        for coord in self.logo_cells():
+            board.flags[board.index(coord)] |= FIXED
+
+    def logo_cells(self) -> list[Coordinate]:
+        """Return the coordinates of the fixed "42" logo cells."""
         center_x: int = (self.width + 1) // 2
         center_y: int = (self.height + 1) // 2
-        center_coord: Coordinate = (center_x, center_y)
-
-        logo_pattern: list[Coordinate] = [
-            # Número "4"
-            (-3, -2), (-3, -1), (-3, 0),  # Línea vertical izquierda
-            (-2, 0),  # Línea horizontal media
-            (-1, 0), (-1, 1), (-1, 2),  # Línea vertical derecha
-
-            # Separación
-
-            # Número "2"
-            (1, -2), (2, -2), (3, -2),  # Línea superior
-            (3, -1),  # Bajada derecha
-            (1, 0), (2, 0), (3, 0),  # Línea media
-            (1, 1),  # Bajada izquierda
-            (1, 2), (2, 2), (3, 2),  # Línea inferior
-        ]
-        for y in range(1, self.height + 1):
-            for x in range(1, self.width + 1):
-                self.maze[(x, y)] = Cell((x, y))
-                if (x, y) == self.entry:
-                    self.maze[(x, y)].is_start = True
-                if (x, y) == self.exit:
-                    self.maze[(x, y)].is_exit = True
-
-        for coord in logo_pattern:
-            fixed_coord: Coordinate = (center_coord[0] + coord[0],
-                                       center_coord[1] + coord[1])
-            self.maze[fixed_coord].is_fixed = True
-
-        for cell in self.maze.values():
-            cell.set_maze_reference(self.maze)
+        return [(center_x + dx, center_y + dy) for dx, dy in LOGO_PATTERN]
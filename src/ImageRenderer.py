@@ -0,0 +1,169 @@
+"""Offscreen maze rendering to PNG or PPM images, without MLX.
+
+The image is drawn in horizontal strips of cell rows into a small RGBA
+framebuffer and each strip is encoded as soon as it is finished, so the
+memory used does not depend on the height of the maze.
+"""
+
+from typing import BinaryIO, Iterator, Optional, Sequence
+from custom_typing import MazeBoard
+from src.Board import START, EXIT, FIXED
+from src.Framebuffer import make_framebuffer
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Flag byte -> 1 for the cells drawn with a background color
+SPECIAL_CELLS = bytes(1 if flags & (START | EXIT | FIXED) else 0
+                      for flags in range(256))
+
+# Pixels drawn per strip (16 MiB of RGBA)
+STRIP_PIXELS = 1 << 22
+
+# zlib level of the PNG data: maze images compress well even at low
+# levels, and level 6 is four times slower for a 30% smaller file
+PNG_COMPRESSION = 3
+
+# Default cell side in pixels: as in the window for small mazes and
+# shrinking for big ones, so the image stays around this many pixels
+MAX_CELL_SIZE = 20
+MIN_CELL_SIZE = 3
+TARGET_IMAGE_SIDE = 16384
+
+
+class ImageRenderer:
+    """Draw a maze and its solution like the Renderer, into image files.
+
+    Colors and wall thickness default to those of the MLX window: white
+    walls, green entry and logo, red exit and a magenta solution.
+    """
+
+    def __init__(self, board: MazeBoard,
+                 path: Optional[Sequence[int]] = None,
+                 cell_size: int = 0) -> None:
+        """Prepare to render a board and optional solution indices."""
+        self.board = board
+        self.cell_size = cell_size or max(MIN_CELL_SIZE, min(
+            MAX_CELL_SIZE,
+            TARGET_IMAGE_SIDE // max(board.width, board.height)))
+        if self.cell_size < MIN_CELL_SIZE:
+            raise ValueError(f"Cell size must be at least {MIN_CELL_SIZE}")
+        self.wall_thickness = 2 if self.cell_size >= 6 else 1
+        self.wall_color = 0xFFFFFF
+        self.bg_color = 0x000000
+        self.start_color = 0x00FF00
+        self.end_color = 0xFE00000
+        self.solution_path_color = 0xFF00FF
+        self.width = board.width * self.cell_size
+        self.height = board.height * self.cell_size
+        # Celdas del camino agrupadas por fila, para pintar por franjas
+        self.path_rows: dict[int, list[int]] = {}
+        for index in path or ():
+            self.path_rows.setdefault(index // board.width, []).append(
+                index % board.width)
+
+    def save(self, file_name: str) -> str:
+        """Write the image, as PPM if the name ends in .ppm else PNG."""
+        with open(file_name, "wb") as file:
+            if file_name.lower().endswith(".ppm"):
+                self.write_ppm(file)
+            else:
+                self.write_png(file)
+        return file_name
+
+    def write_ppm(self, file: BinaryIO) -> None:
+        """Write a binary PPM (P6) image to a stream."""
+        file.write(f"P6\n{self.width} {self.height}\n255\n".encode("ascii"))
+        for rgb in self.rgb_strips():
+            file.write(rgb)
+
+    def write_png(self, file: BinaryIO) -> None:
+        """Write an 8-bit RGB PNG image to a stream.
+
+        Every strip is compressed as it arrives and written as its own
+        IDAT chunk.
+        """
+        file.write(PNG_SIGNATURE)
+        write_chunk(file, b"IHDR", struct.pack(">IIBBBBB", self.width,
+                                               self.height, 8, 2, 0, 0, 0))
+        compressor = zlib.compressobj(PNG_COMPRESSION)
+        row_size = self.width * 3
+        for rgb in self.rgb_strips():
+            # Cada fila empieza con el byte de filtro 0 (ninguno)
+            raw = b"".join(b"\x00" + rgb[start:start + row_size]
+                           for start in range(0, len(rgb), row_size))
+            data = compressor.compress(raw)
+            if data:
+                write_chunk(file, b"IDAT", data)
+        write_chunk(file, b"IDAT", compressor.flush())
+        write_chunk(file, b"IEND", b"")
+
+    def rgb_strips(self) -> Iterator[bytearray]:
+        """Yield the image as RGB bytes, a strip of pixel rows at a time."""
+        for pixels in self.strips():
+            rgb = bytearray(len(pixels) // 4 * 3)
+            # Píxeles 0xAARRGGBB en little endian: bytes B, G, R, A
+            rgb[0::3] = pixels[2::4]
+            rgb[1::3] = pixels[1::4]
+            rgb[2::3] = pixels[0::4]
+            yield rgb
+
+    def strips(self) -> Iterator[bytearray]:
+        """Yield the image as RGBA pixel words, a strip at a time.
+
+        Each strip is drawn with one extra cell row above and below, so
+        the walls that spill across its edges come out whole.
+        """
+        board = self.board
+        size = self.cell_size
+        rows_per_strip = max(1, STRIP_PIXELS // (self.width * size))
+        for first in range(0, board.height, rows_per_strip):
+            last = min(first + rows_per_strip, board.height)
+            top = max(first - 1, 0)
+            bottom = min(last + 1, board.height)
+            height = (bottom - top) * size + 1
+            buffer = bytearray(self.width * height * 4)
+            self._draw_rows(buffer, height, top, bottom)
+            row_bytes = self.width * 4
+            yield buffer[(first - top) * size * row_bytes:
+                         (last - top) * size * row_bytes]
+
+    def _draw_rows(self, buffer: bytearray, height: int, top: int,
+                   bottom: int) -> None:
+        """Draw cell rows [top, bottom) into a strip buffer."""
+        board = self.board
+        columns = board.width
+        size = self.cell_size
+        framebuffer = make_framebuffer(buffer, self.width, height)
+        framebuffer.fill(self.bg_color)
+
+        def fill_cell(x: int, y: int, color: int) -> None:
+            framebuffer.fill_rect(x * size + 1, (y - top) * size + 1,
+                                  size - 2, size - 2, color)
+
+        for y in range(top, bottom):
+            for x in self.path_rows.get(y, ()):
+                fill_cell(x, y, self.solution_path_color)
+        # Entrada, salida y logo, encima del camino como en la ventana
+        flags = board.flags
+        start = top * columns
+        special = flags[start:bottom * columns].translate(SPECIAL_CELLS)
+        offset = special.find(1)
+        while offset >= 0:
+            flag = flags[start + offset]
+            y, x = divmod(start + offset, columns)
+            fill_cell(x, y, self.end_color if flag & EXIT and not flag & FIXED
+                      else self.start_color)
+            offset = special.find(1, offset + 1)
+        framebuffer.draw_walls(board.walls[top * columns:bottom * columns],
+                               columns, bottom - top, size, size,
+                               self.wall_color, self.wall_thickness)
+
+
+def write_chunk(file: BinaryIO, kind: bytes, data: bytes) -> None:
+    """Write one PNG chunk: length, type, data and CRC."""
+    file.write(struct.pack(">I", len(data)))
+    file.write(kind)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
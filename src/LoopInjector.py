@@ -0,0 +1,156 @@
+"""Loop injection for imperfect mazes on top of a carved spanning tree."""
+
+from array import array
+from collections import deque
+from typing import TypeAlias
+from custom_typing.maze import NORTH, EAST, SOUTH, WEST
+from src.Board import Board, ALL_WALLS, FIXED, OPPOSITE
+import random
+
+# TypeAlias for an opened wall as (cell index, neighbor index)
+OpenedWall: TypeAlias = tuple[int, int]
+
+# Parent byte of a tree root (any reached cell has a non-zero byte)
+ROOT = 0b10000
+
+# Random walls tried per requested loop before giving up
+ATTEMPTS_PER_LOOP = 20
+
+# Wall bitfields of a dead end: three closed walls and one open
+DEAD_END_WALLS = (ALL_WALLS & ~NORTH, ALL_WALLS & ~EAST,
+                  ALL_WALLS & ~SOUTH, ALL_WALLS & ~WEST)
+DEAD_ENDS = bytes(1 if walls in DEAD_END_WALLS else 0
+                  for walls in range(256))
+
+
+class LoopInjector:
+    """Open extra walls in a perfect maze without creating short cycles.
+
+    Opening the wall between two cells closes a cycle as long as their
+    distance in the spanning tree plus one. The tree is stored as one
+    byte per cell holding the direction to the parent, so that distance
+    is found by climbing at most ``min_dist`` steps from each cell
+    instead of running a BFS per candidate wall.
+
+    Distances are those of the original tree: a new loop is never short
+    in the carved maze, although it may run close to an earlier loop.
+    """
+
+    def __init__(self, board: Board, min_dist: int = 6,
+                 rng: random.Random | None = None) -> None:
+        """Build the parent tree of every part of the board."""
+        self.board = board
+        self.min_dist = min_dist
+        self.rng = rng or random.Random()
+        # Dirección -> desplazamiento del índice, para subir por el árbol
+        self.offsets = [0] * (ALL_WALLS + 1)
+        for direction, step in board.steps:
+            self.offsets[direction] = step
+        self.parent = bytearray(board.size)
+        start = self.parent.find(0)
+        while start >= 0:
+            self._grow_tree(start)
+            start = self.parent.find(0, start)
+
+    def _grow_tree(self, root: int) -> None:
+        """Record the parent direction of every cell reachable from root."""
+        walls = self.board.walls
+        steps = self.board.steps
+        parent = self.parent
+        parent[root] = ROOT
+        frontier = deque([root])
+        while frontier:
+            current = frontier.popleft()
+            for direction, step in steps:
+                neighbor = current + step
+                if not walls[current] & direction and not parent[neighbor]:
+                    parent[neighbor] = OPPOSITE[direction]
+                    frontier.append(neighbor)
+
+    def tree_distance(self, start: int, end: int) -> int:
+        """Return the tree distance, or ``min_dist`` if it is not lower."""
+        limit = self.min_dist
+        parent = self.parent
+        offsets = self.offsets
+        ancestors: dict[int, int] = {}
+        cell = start
+        for steps in range(limit):
+            ancestors[cell] = steps
+            if parent[cell] == ROOT:
+                break
+            cell += offsets[parent[cell]]
+        cell = end
+        for steps in range(limit):
+            if cell in ancestors:
+                return min(ancestors[cell] + steps, limit)
+            if parent[cell] == ROOT:
+                break
+            cell += offsets[parent[cell]]
+        return limit
+
+    def can_open(self, index: int, direction: int) -> int:
+        """Return the neighbor behind a closed wall that may open, or -1."""
+        board = self.board
+        if not board.walls[index] & direction:
+            return -1
+        neighbor = board.neighbor(index, direction)
+        if neighbor < 0 or (board.flags[index]
+                            | board.flags[neighbor]) & FIXED:
+            return -1
+        return neighbor
+
+    def add_loops(self, count: int) -> list[OpenedWall]:
+        """Open up to ``count`` random walls closing long cycles.
+
+        Walls are sampled at random, so memory stays constant and the
+        cost grows with ``count`` rather than with the board size.
+        """
+        board = self.board
+        rng = self.rng
+        opened: list[OpenedWall] = []
+        for _ in range(count * ATTEMPTS_PER_LOOP):
+            if len(opened) >= count:
+                break
+            index = rng.randrange(board.size)
+            direction = rng.choice((EAST, SOUTH))
+            neighbor = self.can_open(index, direction)
+            if neighbor >= 0 and self.tree_distance(
+                    index, neighbor) >= self.min_dist:
+                board.remove_wall_between(index, direction)
+                opened.append((index, neighbor))
+        return opened
+
+    def braid(self, ratio: float) -> list[OpenedWall]:
+        """Remove a fraction of the dead ends by opening one wall each.
+
+        A dead end joins preferably another dead end, removing both,
+        and otherwise the neighbor farthest away in the tree.
+        """
+        board = self.board
+        walls = board.walls
+        dead = walls.translate(DEAD_ENDS)
+        dead_ends = array('I')
+        index = dead.find(1)
+        while index >= 0:
+            if not board.flags[index] & FIXED:
+                dead_ends.append(index)
+            index = dead.find(1, index + 1)
+        chosen = self.rng.sample(range(len(dead_ends)),
+                                 round(len(dead_ends) * ratio))
+        opened: list[OpenedWall] = []
+        for position in chosen:
+            index = dead_ends[position]
+            if not DEAD_ENDS[walls[index]]:
+                continue  # Ya no es un callejón: lo abrió otro
+            options = []
+            for direction in (NORTH, EAST, SOUTH, WEST):
+                neighbor = self.can_open(index, direction)
+                if neighbor >= 0:
+                    options.append((DEAD_ENDS[walls[neighbor]],
+                                    self.tree_distance(index, neighbor),
+                                    self.rng.random(), direction, neighbor))
+            if options:
+                *_, direction, neighbor = max(options)
+                board.remove_wall_between(index, direction)
+                opened.append((index, neighbor))
+        return opened
@@ -0,0 +1,402 @@
+"""Readers for the maze files written by OutputFileHandler.
+
+``load_maze`` parses a whole file, text or binary, into a Board.
+``MappedMaze`` and ``BinaryMaze`` serve rows and single-cell wall
+lookups straight from a memory-mapped file, so archived mazes larger
+than memory can be inspected and validated without materializing the
+grid.
+"""
+
+from typing import Any, Iterator, Optional
+from custom_typing.maze import Coordinate, NORTH, EAST, SOUTH, WEST
+from src.Board import Board, ALL_WALLS, START, EXIT, FIXED
+from src.OutputFileHandler import OutputFileHandler, BINARY_EXTENSION
+from src.OutputFileHandler import BINARY_HEADER, BINARY_MAGIC
+from src.OutputFileHandler import BINARY_VERSION, HAS_SEED, HAS_PATH
+import mmap
+
+# Hex digit -> wall bitfield; any other byte maps to INVALID
+INVALID = 0xFF
+FROM_HEX = bytes(
+    int(chr(byte), 16) if chr(byte) in "0123456789ABCDEFabcdef"
+    else INVALID for byte in range(256))
+
+# Translation tables keeping a single wall bit of each cell
+WALL_BIT = {direction: bytes(int(bool(walls & direction))
+                             for walls in range(256))
+            for direction in (NORTH, EAST, SOUTH, WEST)}
+
+# Movement letter of the solution line -> wall crossed
+LETTER_WALLS = {ord("N"): NORTH, ord("E"): EAST, ord("S"): SOUTH,
+                ord("W"): WEST}
+
+# Hex digit of a packed solution byte -> its two movement letters
+MOVE_PAIRS = {ord(f"{value:x}"): "NESW"[value >> 2] + "NESW"[value & 3]
+              for value in range(16)}
+
+
+def parse_coordinate(line: bytes, name: str) -> Coordinate:
+    """Parse an ``x,y`` line of the output format."""
+    try:
+        x, y = (int(value) for value in line.split(b","))
+    except ValueError:
+        raise ValueError(f"Invalid {name} line: {line!r}")
+    return (x, y)
+
+
+def check_rows(rows: Iterator[bytes], width: int) -> int:
+    """Check decoded wall rows for consistency and return their count.
+
+    Every row must have ``width`` cells, shared walls must be closed on
+    both sides and the border must be closed all around, as the
+    solvers rely on it. Only two rows are kept in memory at a time.
+    """
+    closed_row = b"\x01" * width
+    previous: Optional[bytes] = None
+    height = 0
+    for row in rows:
+        height += 1
+        if len(row) != width:
+            raise ValueError(f"Row {height} has {len(row)} cells, "
+                             f"expected {width}")
+        if INVALID in row:
+            raise ValueError(f"Row {height} has a non hex digit")
+        west = row.translate(WALL_BIT[WEST])
+        east = row.translate(WALL_BIT[EAST])
+        if west[0] != 1 or east[-1] != 1:
+            raise ValueError(f"Row {height} is open on the border")
+        if east[:-1] != west[1:]:
+            x = next(x for x in range(width - 1) if east[x] != west[x + 1])
+            raise ValueError(f"Wall mismatch between ({x + 1},{height}) "
+                             f"and ({x + 2},{height})")
+        north = row.translate(WALL_BIT[NORTH])
+        if previous is None:
+            if north != closed_row:
+                raise ValueError("First row is open on the border")
+        elif previous.translate(WALL_BIT[SOUTH]) != north:
+            south = previous.translate(WALL_BIT[SOUTH])
+            x = next(x for x in range(width) if south[x] != north[x])
+            raise ValueError(f"Wall mismatch between ({x + 1},{height - 1})"
+                             f" and ({x + 1},{height})")
+        previous = row
+    if previous is None:
+        raise ValueError("The maze has no rows")
+    if previous.translate(WALL_BIT[SOUTH]) != closed_row:
+        raise ValueError("Last row is open on the border")
+    return height
+
+
+def parse_path(board: Board, entry: Coordinate, moves: bytes) -> list[int]:
+    """Follow the N/E/S/W moves from the entry, checking every wall."""
+    offsets = dict(board.steps)
+    walls = board.walls
+    current = board.index(entry)
+    path = [current]
+    for position, letter in enumerate(moves, 1):
+        direction = LETTER_WALLS.get(letter)
+        if direction is None:
+            raise ValueError(f"Invalid move {chr(letter)!r} at {position}")
+        if walls[current] & direction:
+            raise ValueError(f"Move {position} crosses a closed wall")
+        current += offsets[direction]
+        path.append(current)
+    return path
+
+
+class LoadedMaze:
+    """Board, entry, exit and solution path read back from a file."""
+
+    def __init__(self, board: Board, entry: Coordinate, exit: Coordinate,
+                 path: Optional[list[int]], seed: Optional[int] = None,
+                 algorithm: str = "") -> None:
+        """Store the parts of a loaded maze."""
+        self.board = board
+        self.entry = entry
+        self.exit = exit
+        self.path = path
+        # Solo el formato binario guarda la semilla y el algoritmo
+        self.seed = seed
+        self.algorithm = algorithm
+
+
+class MazeReader:
+    """Random access to the cells of a stored maze, one row at a time."""
+
+    width: int = 0
+    height: int = 0
+    entry: Coordinate = (0, 0)
+    exit: Coordinate = (0, 0)
+    seed: Optional[int] = None
+    algorithm: str = ""
+
+    def __enter__(self) -> "MazeReader":
+        """Return the reader itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the underlying file."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the underlying file."""
+
+    def row(self, y: int) -> bytes:
+        """Return the wall bitfields of the 1-based row ``y``."""
+        raise NotImplementedError
+
+    def walls(self, coord: Coordinate) -> int:
+        """Return the wall bitfield of one cell without decoding rows."""
+        raise NotImplementedError
+
+    def grid(self) -> bytes:
+        """Return the wall bitfields of every cell in index order."""
+        raise NotImplementedError
+
+    def moves(self) -> bytes:
+        """Return the N/E/S/W letters of the stored solution."""
+        raise NotImplementedError
+
+    def rows(self) -> Iterator[bytes]:
+        """Yield the wall bitfields of every row, top to bottom."""
+        for y in range(1, self.height + 1):
+            yield self.row(y)
+
+    def validate(self) -> None:
+        """Check the whole grid, streaming it row by row."""
+        check_rows(self.rows(), self.width)
+
+    def to_board(self) -> Board:
+        """Materialize the grid into a Board with entry and exit flags.
+
+        Cells with every wall closed are the fixed logo cells, the only
+        ones a generated maze never opens.
+        """
+        board = Board()
+        board.allocate(self.width, self.height)
+        board.walls[:] = self.grid()
+        index = board.walls.find(ALL_WALLS)
+        while index >= 0:
+            board.flags[index] |= FIXED
+            index = board.walls.find(ALL_WALLS, index + 1)
+        for coord, flag in ((self.entry, START), (self.exit, EXIT)):
+            if not board.in_bounds(coord):
+                raise ValueError(f"Coordinate {coord} outside the maze")
+            board.flags[board.index(coord)] |= flag
+        return board
+
+    def load(self) -> LoadedMaze:
+        """Validate the file and return the maze with its solution."""
+        self.validate()
+        board = self.to_board()
+        moves = self.moves()
+        path = parse_path(board, self.entry, moves) if moves else None
+        if path is not None and path[-1] != board.index(self.exit):
+            raise ValueError("The solution does not end at the exit")
+        return LoadedMaze(board, self.entry, self.exit, path, self.seed,
+                          self.algorithm)
+
+
+class MappedMaze(MazeReader):
+    """Text maze file mapped in memory, decoded one row at a time.
+
+    The grid is a block of ``height`` lines of ``width`` hex digits, so
+    row ``y`` starts at byte ``(y - 1) * (width + 1)``.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """Map a maze file and locate its sections."""
+        self.file = open(file_name, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"Maze file '{file_name}' is empty")
+        data = self.data
+        self.width = data.find(b"\n")
+        grid_end = data.find(b"\n\n")
+        if self.width <= 0 or grid_end < 0:
+            self.close()
+            raise ValueError(f"'{file_name}' is not a maze file")
+        self.stride = self.width + 1
+        self.height = (grid_end + 1) // self.stride
+        # Entrada, salida y camino tras la línea vacía
+        tail = data.find(b"\n", grid_end + 2)
+        try:
+            if tail < 0:
+                raise ValueError(f"'{file_name}' has no exit line")
+            self.entry = parse_coordinate(data[grid_end + 2:tail], "entry")
+            end = data.find(b"\n", tail + 1)
+            end = len(data) if end < 0 else end
+            self.exit = parse_coordinate(data[tail + 1:end], "exit")
+        except ValueError:
+            self.close()
+            raise
+        self.path_start = end + 1
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self.data.close()
+        self.file.close()
+
+    def row(self, y: int) -> bytes:
+        """Return the wall bitfields of the 1-based row ``y``."""
+        if not 1 <= y <= self.height:
+            raise IndexError(f"Row {y} outside the maze")
+        start = (y - 1) * self.stride
+        return self.data[start:start + self.width].translate(FROM_HEX)
+
+    def walls(self, coord: Coordinate) -> int:
+        """Return the wall bitfield of one cell without decoding rows."""
+        x, y = coord
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            raise IndexError(f"Cell {coord} outside the maze")
+        return FROM_HEX[self.data[(y - 1) * self.stride + x - 1]]
+
+    def moves(self) -> bytes:
+        """Return the N/E/S/W letters of the stored solution."""
+        return self.data[self.path_start:].rstrip(b"\r\n")
+
+    def validate(self) -> None:
+        """Check the whole grid, streaming it row by row."""
+        check_rows(self._checked_rows(), self.width)
+
+    def _checked_rows(self) -> Iterator[bytes]:
+        """Yield the rows, checking that each one ends where expected."""
+        for y in range(1, self.height + 1):
+            if self.data[y * self.stride - 1] != ord("\n"):
+                raise ValueError(f"Row {y} does not have {self.width} cells")
+            yield self.row(y)
+        if self.height * self.stride != self.data.find(b"\n\n") + 1:
+            raise ValueError("The grid rows have different lengths")
+
+    def grid(self) -> bytes:
+        """Return the wall bitfields of every cell in index order."""
+        grid = self.data[:self.height * self.stride]
+        return grid.replace(b"\n", b"").translate(FROM_HEX)
+
+
+class BinaryMaze(MazeReader):
+    """Packed binary maze read in place through a ``memoryview``.
+
+    Walls are stored two cells per byte, first cell in the high nibble,
+    so single cells are read without decoding the rest of the grid.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        """Parse the header of a binary maze held in any buffer."""
+        view = memoryview(buffer).cast("B")
+        if len(view) < BINARY_HEADER.size or view[:4] != BINARY_MAGIC:
+            raise ValueError("Not a binary maze file")
+        (_, version, flags, algorithm, self.width, self.height,
+         entry_x, entry_y, exit_x, exit_y, seed,
+         self.move_count) = BINARY_HEADER.unpack_from(view)
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary maze version {version}")
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self.seed = seed if flags & HAS_SEED else None
+        self.algorithm = algorithm.rstrip(b"\0").decode("ascii")
+        if not flags & HAS_PATH:
+            self.move_count = 0
+        walls_end = BINARY_HEADER.size + (self.width * self.height + 1) // 2
+        path_end = walls_end + (self.move_count + 3) // 4
+        if len(view) < path_end:
+            raise ValueError("Truncated binary maze file")
+        self.view = view
+        # Vistas sin copia sobre las paredes y el camino empaquetados
+        self.packed = view[BINARY_HEADER.size:walls_end]
+        self.packed_moves = view[walls_end:path_end]
+        self.mapping: Optional[mmap.mmap] = None
+        self.file: Optional[Any] = None
+
+    @classmethod
+    def from_file(cls, file_name: str) -> "BinaryMaze":
+        """Map a binary maze file and read it in place."""
+        file = open(file_name, "rb")
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise ValueError(f"Maze file '{file_name}' is empty")
+        try:
+            maze = cls(mapping)
+        except ValueError:
+            mapping.close()
+            file.close()
+            raise
+        maze.mapping, maze.file = mapping, file
+        return maze
+
+    def close(self) -> None:
+        """Release the views and unmap the file if this reader mapped it."""
+        self.packed.release()
+        self.packed_moves.release()
+        self.view.release()
+        if self.mapping is not None:
+            self.mapping.close()
+        if self.file is not None:
+            self.file.close()
+
+    def row(self, y: int) -> bytes:
+        """Return the wall bitfields of the 1-based row ``y``."""
+        if not 1 <= y <= self.height:
+            raise IndexError(f"Row {y} outside the maze")
+        start = (y - 1) * self.width
+        digits = self.packed[start // 2:(start + self.width + 1) // 2].hex()
+        offset = start % 2
+        return digits[offset:offset + self.width].encode(
+            "ascii").translate(FROM_HEX)
+
+    def walls(self, coord: Coordinate) -> int:
+        """Return the wall bitfield of one cell without decoding rows."""
+        x, y = coord
+        if not (1 <= x <= self.width and 1 <= y <= self.height):
+            raise IndexError(f"Cell {coord} outside the maze")
+        index = (y - 1) * self.width + x - 1
+        byte = self.packed[index // 2]
+        return byte & 0xF if index % 2 else byte >> 4
+
+    def grid(self) -> bytes:
+        """Return the wall bitfields of every cell in index order."""
+        size = self.width * self.height
+        return self.packed.hex()[:size].encode("ascii").translate(FROM_HEX)
+
+    def moves(self) -> bytes:
+        """Return the N/E/S/W letters of the stored solution."""
+        letters = self.packed_moves.hex().translate(MOVE_PAIRS)
+        return letters[:self.move_count].encode("ascii")
+
+
+def open_maze(file_name: str) -> MazeReader:
+    """Open a text or binary maze file, telling them apart by content."""
+    with open(file_name, "rb") as file:
+        magic = file.read(len(BINARY_MAGIC))
+    if magic == BINARY_MAGIC:
+        return BinaryMaze.from_file(file_name)
+    return MappedMaze(file_name)
+
+
+def load_maze(file_name: str) -> LoadedMaze:
+    """Load and validate a maze file written by OutputFileHandler."""
+    with open_maze(file_name) as maze:
+        return maze.load()
+
+
+def convert_maze(source: str, destination: str) -> LoadedMaze:
+    """Convert a maze file between the text and binary formats.
+
+    The output format follows the destination name, binary when it ends
+    in ``BINARY_EXTENSION``. Text files carry no seed or algorithm, so
+    those stay empty when converting from text.
+    """
+    maze = load_maze(source)
+    with open(destination, "wb") as file:
+        if destination.endswith(BINARY_EXTENSION):
+            OutputFileHandler.write_binary(file, maze.board, maze.entry,
+                                           maze.exit, maze.path, maze.seed,
+                                           maze.algorithm)
+        else:
+            OutputFileHandler.write_text(file, maze.board, maze.entry,
+                                         maze.exit, maze.path)
+    return maze
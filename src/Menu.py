@@ -2,6 +2,7 @@
 
 import os
 from enum import Enum
+from typing import Iterator, Optional
 
 from src.Config import Config
 
@@ -65,52 +66,76 @@ class Menu:
 
     def __init__(
                 self,
-                config: Config
+                config: Config,
+                script: Optional[Iterator[str]] = None
                  ):
-        """Initialize the menu with configuration settings."""
+        """Initialize the menu with configuration settings.
+
+        With a ``script`` the answers are read from it instead of the
+        keyboard and the screen is never cleared, so sessions can run
+        headless; an exhausted script raises EOFError like input().
+        """
         self.config = config
+        self.script = script
         self.status: str = ""
         self.generated: bool = False
         self.print_header()
 
+    def read_line(self, prompt: str) -> str:
+        """Return the next answer, from the script or the keyboard."""
+        if self.script is None:
+            return input(prompt)
+        try:
+            line = next(self.script)
+        except StopIteration:
+            raise EOFError("End of the menu script") from None
+        print(f"{prompt}{line}")
+        return line
+
+    def clear_screen(self) -> None:
+        """Clear the terminal, unless the menu is scripted."""
+        if self.script is None:
+            os.system('cls' if os.name == 'nt' else 'clear')
+
     def init_menu(self,
                   status: str = "",
                   generated: bool = False,
                   solved: bool = False
                   ) -> ExecOptions:
-        """Initialize and display the main menu."""
-        self.status = status
-        self.generated = generated
-        self.print_header()
-        if not generated:
-            return self.ask_render_option(RenderOptions.GENERATION)
-        if not solved:
-            print(MenuPrintable.MAIN_MENU.value)
-        if solved:
-            print(MenuPrintable.SOLVED_MENU.value)
-        print()
-        try:
-            selection = int(input("Select an option => "))
-            if selection == 1:
+        """Display the main menu until a valid option is selected."""
+        while True:
+            self.status = status
+            self.generated = generated
+            self.print_header()
+            if not generated:
                 return self.ask_render_option(RenderOptions.GENERATION)
-            elif selection == 2 and generated and not solved:
-                return self.ask_render_option(RenderOptions.SOLUTION)
-            elif selection == 2 and generated and solved:
-                return ExecOptions.HIDE_SOLVE_PATH
-            elif selection == 3 and generated:
-                return ExecOptions.CHANGE_COLOR
-            elif selection == 4 and generated:
-                return ExecOptions.EXIT
-            else:
-                raise ValueError("Invalid option selected")
-        except BackException:
-            return self.init_menu("Going back to main menu...", generated)
-        except ValueError as e:
-            return self.init_menu(f"Error ex: ´{str(e)}", generated)
+            if not solved:
+                print(MenuPrintable.MAIN_MENU.value)
+            if solved:
+                print(MenuPrintable.SOLVED_MENU.value)
+            print()
+            try:
+                selection = int(self.read_line("Select an option => "))
+                if selection == 1:
+                    return self.ask_render_option(RenderOptions.GENERATION)
+                elif selection == 2 and generated and not solved:
+                    return self.ask_render_option(RenderOptions.SOLUTION)
+                elif selection == 2 and generated and solved:
+                    return ExecOptions.HIDE_SOLVE_PATH
+                elif selection == 3 and generated:
+                    return ExecOptions.CHANGE_COLOR
+                elif selection == 4 and generated:
+                    return ExecOptions.EXIT
+                else:
+                    raise ValueError("Invalid option selected")
+            except BackException:
+                status = "Going back to main menu..."
+            except ValueError as e:
+                status = f"Error ex: ´{str(e)}"
 
     def print_header(self) -> None:
         """Clear screen and print the application header."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.clear_screen()
         print(MenuPrintable.LOGO.value)
         print("\t\tWith <3 by amarcill & rgerman-\n")
         print("Generation configuration:")
@@ -126,47 +151,47 @@ class Menu:
     def ask_render_option(self,
                           render_option: RenderOptions
                           ) -> ExecOptions:
-        """Ask user for render option selection."""
+        """Ask user for render option selection until it is valid."""
         is_generate_option: bool = (
                 render_option is RenderOptions.GENERATION)
         render_option_string = render_option.value[1]
         self.status = "Select render option for " + render_option_string
-        self.print_header()
-        print(f"How do you want to {render_option_string}?\n")
-        print("1. Animated render (Will take longer)")
-        print("2. Static render")
-        if self.generated:
-            print("3. Back to main menu")
-        print()
-        try:
-            selection = int(input("Select an option => "))
-            if is_generate_option:
-                if selection == 1:
-                    return ExecOptions.GEN_MAZE_WITH_RENDER
-                elif selection == 2:
-                    return ExecOptions.GEN_MAZE_NO_RENDER
-                elif selection == 3 and self.generated:
-                    raise BackException()
+        while True:
+            self.print_header()
+            print(f"How do you want to {render_option_string}?\n")
+            print("1. Animated render (Will take longer)")
+            print("2. Static render")
+            if self.generated:
+                print("3. Back to main menu")
+            print()
+            try:
+                selection = int(self.read_line("Select an option => "))
+                if is_generate_option:
+                    if selection == 1:
+                        return ExecOptions.GEN_MAZE_WITH_RENDER
+                    elif selection == 2:
+                        return ExecOptions.GEN_MAZE_NO_RENDER
+                    elif selection == 3 and self.generated:
+                        raise BackException()
+                    else:
+                        raise ValueError("Invalid option selected")
                 else:
-                    raise ValueError("Invalid option selected")
-            else:
-                if selection == 1:
-                    return ExecOptions.SHOW_SOLUTION_RENDER
-                elif selection == 2:
-                    return ExecOptions.SHOW_SOLUTION_NO_RENDER
-                elif selection == 3 and self.generated:
-                    raise BackException()
-                else:
-                    raise ValueError("Invalid option selected")
-        except ValueError as e:
-            self.status = "Error: " + str(e)
-            return self.ask_render_option(render_option)
-
-    @staticmethod
-    def ask_color_code() -> int | None:
+                    if selection == 1:
+                        return ExecOptions.SHOW_SOLUTION_RENDER
+                    elif selection == 2:
+                        return ExecOptions.SHOW_SOLUTION_NO_RENDER
+                    elif selection == 3 and self.generated:
+                        raise BackException()
+                    else:
+                        raise ValueError("Invalid option selected")
+            except ValueError as e:
+                self.status = "Error: " + str(e)
+
+    def ask_color_code(self) -> int | None:
         """Prompt user for a hexadecimal color code."""
         try:
-            color: int = int(input("\nWrite the HEX color code => "), 16)
+            color: int = int(self.read_line("\nWrite the HEX color code => "),
+                             16)
         except ValueError:
             print("Color must be valid hexadecimal (0xFFFFFF) or integer")
             return None
@@ -1,35 +1,166 @@
-from .Solver import Solver
-from custom_typing.maze import MazeBoard
-from src.Config import Config
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, Optional, Sequence
+from custom_typing.maze import Coordinate, MazeBoard
+from src.Config import Config, BINARY_EXTENSION
+from src.GenerationAlgorithms import DEFAULT_ALGORITHM
+import struct
+
+# Translation table from wall bitfield bytes to uppercase hex digits
+HEX_DIGITS = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+# Bytes gathered before each write to the stream
+CHUNK_SIZE = 1 << 20
+
+# Binary container: magic, version, flags, algorithm, width, height,
+# entry, exit, seed and number of solution moves (64 bytes)
+BINARY_MAGIC = b"AMZB"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBB2x16sIIIIIIQQ")
+HAS_SEED = 0b01
+HAS_PATH = 0b10
+
+# Solution letters -> base 4 digits, two bits per move
+MOVE_DIGITS = bytes.maketrans(b"NESW", b"0123")
 
 
 class OutputFileHandler:
 
     @staticmethod
-    def save_file(file_name: str, maze: MazeBoard,
-                  config: Config, solver: Solver) -> str:
-        with open(file_name, "w") as file:
-            for y in range(1, config.height + 1):
-                for x in range(1, config.width + 1):
-                    file.write(f"{format(maze[(x, y)].walls, 'X')}")
-                    if x == config.width:
-                        file.write("\n")
-            file.write("\n")
-            file.write(f"{config.entry[0]},{config.entry[1]}\n")
-            file.write(f"{config.exit[0]},{config.exit[1]}\n")
-            path = solver.solve()
-            actual = None
-            while path:
-                actual = path.pop(0)
-                next_cell = path[0] if path else None
-                if next_cell is None:
-                    break
-                if actual.coord[0] < next_cell.coord[0]:
-                    file.write("E")
-                elif actual.coord[0] > next_cell.coord[0]:
-                    file.write("W")
-                elif actual.coord[1] < next_cell.coord[1]:
-                    file.write("S")
-                elif actual.coord[1] > next_cell.coord[1]:
-                    file.write("N")
+    def save_file(file_name: str, maze: MazeBoard, config: Config,
+                  path: Optional[Sequence[int]]) -> str:
+        """Write the maze and a precomputed solution path to a file.
+
+        Files ending in ``BINARY_EXTENSION`` use the packed binary
+        format, any other name the hex text format.
+        """
+        with open(file_name, "wb", buffering=CHUNK_SIZE) as file:
+            OutputFileHandler.write(file, maze, config, path,
+                                    file_name.endswith(BINARY_EXTENSION))
+        return file_name
+
+    @staticmethod
+    def stream_file(file_name: str, rows: Iterable[bytes | bytearray],
+                    config: Config) -> str:
+        """Write rows of wall bitfields to a text file as they arrive.
+
+        Rows are buffered into ~CHUNK_SIZE writes. The solution line is
+        left empty; ``append_path`` adds it once the maze is solved.
+        """
+        with open(file_name, "wb", buffering=CHUNK_SIZE) as file:
+            pending: list[bytes | bytearray] = []
+            size = 0
+            for row in rows:
+                pending.append(row.translate(HEX_DIGITS))
+                pending.append(b"\n")
+                size += len(row) + 1
+                if size >= CHUNK_SIZE:
+                    file.write(b"".join(pending))
+                    pending.clear()
+                    size = 0
+            file.write(b"".join(pending))
+            file.write(b"\n")
+            file.write(f"{config.entry[0]},{config.entry[1]}\n"
+                       .encode("ascii"))
+            file.write(f"{config.exit[0]},{config.exit[1]}\n"
+                       .encode("ascii"))
         return file_name
+
+    @staticmethod
+    def append_path(file_name: str, path: Sequence[int],
+                    width: int) -> None:
+        """Append the solution line to a text maze file."""
+        with open(file_name, "ab", buffering=CHUNK_SIZE) as file:
+            for chunk in OutputFileHandler.path_chunks(path, width):
+                file.write(chunk)
+
+    @staticmethod
+    def write(file: BinaryIO, maze: MazeBoard, config: Config,
+              path: Optional[Sequence[int]],
+              binary: Optional[bool] = None) -> None:
+        """Write the maze in the output format to any binary stream.
+
+        ``path`` holds the flat cell indices of the solution, as stored
+        in ``Solver.path``; None writes an empty solution line. Unless
+        ``binary`` says otherwise, the format follows the suffix of
+        ``config.output_file``, as in ``save_file``.
+        """
+        if binary is None:
+            binary = config.output_file.endswith(BINARY_EXTENSION)
+        if binary:
+            OutputFileHandler.write_binary(file, maze, config.entry,
+                                           config.exit, path, config.seed,
+                                           config.algorithm)
+        else:
+            OutputFileHandler.write_text(file, maze, config.entry,
+                                         config.exit, path)
+
+    @staticmethod
+    def write_text(file: BinaryIO, maze: MazeBoard, entry: Coordinate,
+                   exit: Coordinate, path: Optional[Sequence[int]]) -> None:
+        """Write the hex text format from explicit entry and exit."""
+        for chunk in OutputFileHandler.row_chunks(maze):
+            file.write(chunk)
+        file.write(b"\n")
+        file.write(f"{entry[0]},{entry[1]}\n".encode("ascii"))
+        file.write(f"{exit[0]},{exit[1]}\n".encode("ascii"))
+        if path:
+            for chunk in OutputFileHandler.path_chunks(path, maze.width):
+                file.write(chunk)
+
+    @staticmethod
+    def write_binary(file: BinaryIO, maze: MazeBoard, entry: Coordinate,
+                     exit: Coordinate, path: Optional[Sequence[int]],
+                     seed: Optional[int] = None,
+                     algorithm: str = DEFAULT_ALGORITHM) -> None:
+        """Write the packed binary format to any binary stream.
+
+        After the header come the walls, two cells per byte with the
+        first cell in the high nibble, and then the solution moves, four
+        per byte as 2-bit N/E/S/W codes starting at the high bits.
+        """
+        flags = (HAS_SEED if seed is not None else 0) | (
+            HAS_PATH if path else 0)
+        moves = len(path) - 1 if path else 0
+        file.write(BINARY_HEADER.pack(
+            BINARY_MAGIC, BINARY_VERSION, flags,
+            algorithm.encode("ascii"), maze.width, maze.height,
+            entry[0], entry[1], exit[0], exit[1], seed or 0, moves))
+        walls = maze.walls
+        # Un número par de celdas por bloque para no partir ningún byte
+        for start in range(0, len(walls), CHUNK_SIZE * 2):
+            digits = walls[start:start + CHUNK_SIZE * 2].translate(HEX_DIGITS)
+            if len(digits) % 2:
+                digits += b"0"
+            file.write(bytes.fromhex(digits.decode("ascii")))
+        if not path:
+            return
+        # Cada bloque de letras es múltiplo de 4 salvo el último
+        for letters in OutputFileHandler.path_chunks(path, maze.width):
+            quads = bytearray(letters.translate(MOVE_DIGITS))
+            quads.extend(b"0" * (-len(quads) % 4))
+            file.write(int(quads, 4).to_bytes(len(quads) // 4, "big"))
+
+    @staticmethod
+    def row_chunks(maze: MazeBoard) -> Iterator[bytes]:
+        """Yield the hex rows of the maze grouped in ~CHUNK_SIZE blocks."""
+        width = maze.width
+        walls = maze.walls
+        rows_per_chunk = max(1, CHUNK_SIZE // (width + 1))
+        for first in range(0, maze.height, rows_per_chunk):
+            block = walls[first * width:(first + rows_per_chunk) * width]
+            digits = block.translate(HEX_DIGITS)
+            yield b"\n".join(digits[start:start + width]
+                             for start in range(0, len(digits), width))
+            yield b"\n"
+
+    @staticmethod
+    def path_chunks(path: Sequence[int], width: int) -> Iterator[bytes]:
+        """Yield the N/E/S/W moves of a path in ~CHUNK_SIZE blocks."""
+        # Diferencia de índices entre dos celdas -> letra del movimiento
+        letters = {-width: ord("N"), 1: ord("E"),
+                   width: ord("S"), -1: ord("W")}
+        for first in range(0, len(path) - 1, CHUNK_SIZE):
+            last = min(first + CHUNK_SIZE + 1, len(path))
+            cells = path[first:last]
+            yield bytes(letters[after - before] for before, after
+                        in zip(cells, islice(cells, 1, None)))
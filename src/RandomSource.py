@@ -0,0 +1,69 @@
+"""Per-generator random streams and reproducible seed derivation."""
+
+from hashlib import sha256
+from typing import Iterator, TypeVar, TYPE_CHECKING
+import random
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsLenAndGetItem
+
+T = TypeVar("T")
+
+# Random bytes drawn at once by FastRandom
+BUFFER_SIZE = 1 << 16
+
+# Bytes below which ``byte % count`` is uniform, for 2 to 4 choices
+PICK_LIMITS = (0, 0, 256, 255, 256)
+
+
+def derive_seed(master: int, index: int) -> int:
+    """Return the 64-bit seed of maze ``index`` of a ``master`` seed.
+
+    Hashing keeps the streams of consecutive indices unrelated, and any
+    single maze can be rebuilt from the pair without generating the
+    mazes before it.
+    """
+    digest = sha256(f"{master}:{index}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class FastRandom(random.Random):
+    """Random stream whose ``choice`` reads a precomputed byte buffer.
+
+    Choosing among the few neighbors of a cell costs one buffered byte
+    instead of a ``getrandbits`` call, about twice as fast. Picks stay
+    uniform thanks to rejection sampling, but the sequence differs from
+    ``random.Random``, so a seed gives other mazes than the default.
+    """
+
+    # Misma firma que random.Random.seed, que typeshed ya declara
+    # incompatible con la de _random.Random
+    def seed(  # type: ignore[override]
+            self, a: int | float | str | bytes | bytearray | None = None,
+            version: int = 2) -> None:
+        """Seed the generator and restart the byte buffer."""
+        super().seed(a, version)
+        self._bytes = self._byte_stream()
+
+    def _byte_stream(self) -> Iterator[int]:
+        """Yield random bytes, drawn BUFFER_SIZE at a time."""
+        while True:
+            yield from self.randbytes(BUFFER_SIZE)
+
+    def choice(self, seq: "SupportsLenAndGetItem[T]") -> T:
+        """Return a random element, using one buffered byte if possible."""
+        count = len(seq)
+        if count == 1:
+            return seq[0]
+        if not 1 < count <= 4:
+            return super().choice(seq)
+        byte = next(self._bytes)
+        # Rechazo de los bytes sobrantes para no sesgar la elección
+        while byte >= PICK_LIMITS[count]:
+            byte = next(self._bytes)
+        return seq[byte % count]
+
+
+def make_rng(seed: int | None, fast: bool = False) -> random.Random:
+    """Return a new random stream, seeded from the OS if seed is None."""
+    return FastRandom(seed) if fast else random.Random(seed)
@@ -6,9 +6,12 @@ from custom_typing.maze import NORTH, SOUTH, EAST, WEST
 from src.Config import Config
 from src.Cell import Cell
 from src.Generator import Generator
+from src.Board import START, EXIT, FIXED
+from src.Framebuffer import Framebuffer, CellRegion, make_framebuffer
+from src.FrameScheduler import FrameScheduler, DirtyRegion
+from src.FrameScheduler import ANIMATION_SECONDS
+from src.StepEvents import StepAction
 from mlx import Mlx
-import ctypes
-import time
 
 
 class Renderer:
@@ -36,9 +39,10 @@ class Renderer:
         self.img_ptr = self.mlx.mlx_new_image(self.mlx_ptr, self.width,
                                               self.height)
         addr_info = self.mlx.mlx_get_data_addr(self.img_ptr)
-        self.img_buffer = (
-            ctypes.c_ubyte * (self.width * self.height * 4)).from_buffer(
-                addr_info[0])
+        # Zero-copy view over the MLX image (NumPy when available)
+        self.framebuffer: Framebuffer = make_framebuffer(
+            addr_info[0], self.width, self.height,
+            addr_info[2] // 4 if addr_info[2] else None)
 
         # Estados de renderizado
         self.wall_thickness = 2
@@ -51,14 +55,15 @@ class Renderer:
         # Estado de generación
         self.generation_generator: Any = None
         self.generation_complete = False
-        self.generation_speed = 0.01
-        self.last_generation_time: float = 0.0
 
         # Estado de solución
         self.solving_generator: Any = None
         self.solving_complete = False
-        self.solving_speed = 0.001
-        self.last_solving_time: float = 0.0
+
+        # Animación: pasos agrupados por frame y un volcado por frame
+        self.scheduler = FrameScheduler(config.fps)
+        self.dirty = DirtyRegion(config.width)
+        self.solving_actions: dict[int, int] = {}
 
         # Colores para el solver
         self.exploring_start_color = 0x0000FF  # Azul
@@ -66,23 +71,41 @@ class Renderer:
         self.visiting_start_color = 0x4444FF   # Azul claro
         self.visiting_goal_color = 0xFFFF44    # Amarillo claro
         self.solution_path_color = 0xFF00FF    # Magenta
+        # Color del interior de las celdas según la acción del solver
+        self.solving_colors: dict[int, int] = {
+            StepAction.VISITING_START: self.visiting_start_color,
+            StepAction.VISITING_GOAL: self.visiting_goal_color,
+            StepAction.FILLING_DEAD_END: self.exploring_goal_color,
+            StepAction.SOLUTION_FOUND: self.solution_path_color,
+        }
         self.draw_maze()
         self.sync()
 
     def initialize_rendered_generation(self) -> None:
         """Initialize the maze generation with animation."""
         self.generation_complete = False
-        self.last_generation_time = time.time()
         self.generation_generator = self.generator.generate_step_by_step()
+        self._start_animation()
         self.draw_maze()
 
     def initialize_rendered_solving(self, solver: Any) -> None:
         """Initialize the maze solving with animation."""
         self.solving_complete = False
-        self.last_solving_time = time.time()
         self.solving_generator = solver
+        self._start_animation()
         self.draw_maze()
 
+    def _start_animation(self) -> None:
+        """Reset the frame scheduler and the pending dirty cells."""
+        steps_per_frame = self.config.steps_per_frame
+        if not steps_per_frame and self.board:
+            steps_per_frame = len(self.board) // (
+                self.config.fps * ANIMATION_SECONDS)
+        self.scheduler.steps_per_frame = max(1, steps_per_frame)
+        self.dirty = DirtyRegion(self.config.width)
+        self.solving_actions.clear()
+        self.scheduler.start()
+
     def _setup_hooks(self) -> None:
         """Set up window event hooks."""
         self.mlx.mlx_hook(self.win_ptr, 17, 0, lambda _: self.destroy,
@@ -98,11 +121,8 @@ class Renderer:
         self.mlx.mlx_sync(self.mlx_ptr, Mlx.SYNC_IMAGE_WRITABLE, self.img_ptr)
 
         # Calcular dimensiones
-        max_x = max(x for x, y in self.board.keys())
-        max_y = max(y for x, y in self.board.keys())
-
-        cell_width = self.width // max_x
-        cell_height = self.height // max_y
+        cell_width = self.width // self.board.width
+        cell_height = self.height // self.board.height
 
         for cell in solution:
             x, y = cell.coord
@@ -139,45 +159,32 @@ class Renderer:
         if not self.generation_generator and not self.solving_generator:
             self._end_loop()
 
-        # Procesar generación paso a paso
-        if self.generation_generator and not self.generation_complete:
-            import time
-            current_time = time.time()
-
-            if current_time - self.last_generation_time >= \
-               self.generation_speed:
-                self.last_generation_time = current_time
-
-                try:
-                    step_info = next(self.generation_generator)
-                    modified_cells = step_info.get('modified_cells', [])
-
-                    if modified_cells:
-                        self._draw_cells_incremental(modified_cells)
-
-                except StopIteration:
-                    self.generation_complete = True
-                    self._end_loop()
+        if not self.scheduler.due():
+            return 0
 
-        # Procesar solución paso a paso
+        # Procesar generación: varios pasos por frame, un solo volcado
+        if self.generation_generator and not self.generation_complete:
+            steps, finished = self.scheduler.drain(self.generation_generator)
+            for event in steps:
+                for index in event.cells:
+                    self.dirty.add(index)
+            self._flush_frame()
+            if finished:
+                self.generation_complete = True
+                self._end_loop()
+
+        # Procesar solución: cada celda se pinta con su última acción
         if self.solving_generator and not self.solving_complete:
-            import time
-            current_time = time.time()
-
-            if current_time - self.last_solving_time >= self.solving_speed:
-                self.last_solving_time = current_time
-
-                try:
-                    step_info = next(self.solving_generator)
-                    action = step_info.get('action', '')
-                    modified_cells = step_info.get('modified_cells', [])
-
-                    if modified_cells:
-                        self._draw_cells_solving(modified_cells, action)
-
-                except StopIteration:
-                    self.solving_complete = True
-                    self.mlx.mlx_loop_exit(self.mlx_ptr)
+            steps, finished = self.scheduler.drain(self.solving_generator)
+            for event in steps:
+                action = event.action
+                for index in event.cells:
+                    self.dirty.add(index)
+                    self.solving_actions[index] = action
+            self._flush_frame()
+            if finished:
+                self.solving_complete = True
+                self.mlx.mlx_loop_exit(self.mlx_ptr)
 
         return 0
 
@@ -186,6 +193,8 @@ class Renderer:
         if keycode == 113:
             self.mlx.mlx_loop_exit(self.mlx_ptr)
             self.generator.initialize_board()
+            self.dirty.clear()
+            self.solving_actions.clear()
             self.draw_maze()
             self.sync()
             self.generation_complete = False
@@ -225,20 +234,22 @@ class Renderer:
         self.mlx.mlx_sync(self.mlx_ptr, Mlx.SYNC_IMAGE_WRITABLE, self.img_ptr)
 
         # Clear image buffer with background color
-        bg_with_alpha = 0xFF000000 | self.bg_color  # Add alpha channel
-        for i in range(0, len(self.img_buffer), 4):
-            self.img_buffer[i:i+4] = list(bg_with_alpha.to_bytes(4, 'little'))
+        self.framebuffer.fill(self.bg_color)
 
         # Calculate dimensions of a Cell
-        max_x = max(x for x, y in self.board.keys())
-        max_y = max(y for x, y in self.board.keys())
-
-        cell_width = self.width // max_x
-        cell_height = self.height // max_y
-
-        # Draw each cell
-        for coord, cell in self.board.items():
-            self._draw_cell(cell, cell_width, cell_height)
+        cell_width = self.width // self.board.width
+        cell_height = self.height // self.board.height
+
+        # Entry, exit and logo backgrounds, then every wall in bulk
+        special = START | EXIT | FIXED
+        for index, flags in enumerate(self.board.flags):
+            if flags & special:
+                self._draw_cell(self.board.cell(index), cell_width,
+                                cell_height)
+        self.framebuffer.draw_walls(self.board.walls, self.board.width,
+                                    self.board.height, cell_width,
+                                    cell_height, self.wall_color,
+                                    self.wall_thickness)
 
         # Display image in window
         self.mlx.mlx_put_image_to_window(self.mlx_ptr,
@@ -247,152 +258,75 @@ class Renderer:
 
     def _put_pixel_to_image(self, x: int, y: int, color: int) -> None:
         """Draw a pixel in the image buffer."""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            offset: int = (y * self.width + x) * 4  # 4 bytes por píxel
-            self.img_buffer[offset:offset+4] = list(
-                (0xFF000000 | color).to_bytes(4, 'little'))
+        self.framebuffer.put_pixel(x, y, color)
 
-    def _draw_cells_incremental(self, cells: list[Cell]) -> None:
-        """Draw only the specified cells without clearing the entire screen."""
-        if not self.board:
+    def _flush_frame(self) -> None:
+        """Redraw the dirty rectangles and push a single blit."""
+        if not self.board or not self.dirty:
             return
 
         # Sincronizar imagen para escritura
         self.mlx.mlx_sync(self.mlx_ptr, Mlx.SYNC_IMAGE_WRITABLE, self.img_ptr)
 
-        # Calcular dimensiones
-        max_x = max(x for x, y in self.board.keys())
-        max_y = max(y for x, y in self.board.keys())
+        cell_width = self.width // self.board.width
+        cell_height = self.height // self.board.height
 
-        cell_width = self.width // max_x
-        cell_height = self.height // max_y
+        for region in self.dirty.rectangles():
+            self._redraw_region(region, cell_width, cell_height)
 
-        for cell in cells:
-            # First clear the cell area
-            x, y = cell.coord
-            px = (x - 1) * cell_width
-            py = (y - 1) * cell_height
-            self._fill_rect(px, py, cell_width, cell_height, self.bg_color)
+        # Colorear el interior de las celdas tocadas por el solver
+        for index, action in self.solving_actions.items():
+            color = self._solving_color(action)
+            if color == self.bg_color or (
+                    self.board.flags[index] & (START | EXIT | FIXED)):
+                continue
+            x, y = self.board.coord(index)
+            self._fill_rect((x - 1) * cell_width + 1,
+                            (y - 1) * cell_height + 1,
+                            cell_width - 2, cell_height - 2, color)
 
-            # Then draw the updated cell
-            self._draw_cell(cell, cell_width, cell_height)
+        self.dirty.clear()
+        self.solving_actions.clear()
 
         # Display image in window
         self.mlx.mlx_put_image_to_window(self.mlx_ptr,
                                          self.win_ptr,
                                          self.img_ptr, 0, 0)
 
-    def _draw_cells_solving(self, cells: list[Cell], action: str) -> None:
-        """Draw cells during the solving process."""
+    def _redraw_region(self, region: CellRegion, cell_width: int,
+                       cell_height: int) -> None:
+        """Clear a rectangle of cells and redraw its cells and walls."""
         if not self.board:
             return
-
-        # Sincronizar imagen para escritura
-        self.mlx.mlx_sync(self.mlx_ptr, Mlx.SYNC_IMAGE_WRITABLE, self.img_ptr)
-
-        # Calcular dimensiones
-        max_x = max(x for x, y in self.board.keys())
-        max_y = max(y for x, y in self.board.keys())
-
-        cell_width = self.width // max_x
-        cell_height = self.height // max_y
-
-        # Determinar el color según la acción
-        color = self.bg_color
-        if action in ['init_start', 'exploring_start']:
-            color = self.exploring_start_color
-        elif action in ['init_goal', 'exploring_goal']:
-            color = self.exploring_goal_color
-        elif action == 'visiting_start':
-            color = self.visiting_start_color
-        elif action == 'visiting_goal':
-            color = self.visiting_goal_color
-        elif action == 'solution_found':
-            color = self.solution_path_color
-        elif action in ['backtracking_start', 'backtracking_goal',
-                        'clear_visited']:
-            color = self.bg_color  # Return to black background
-
-        for cell in cells:
-            x, y = cell.coord
-            px = (x - 1) * cell_width
-            py = (y - 1) * cell_height
-
-            # If solution_found, don't clear entire cell, just paint interior
-            # to keep wall-less spaces as they were
-            if action == 'solution_found':
-                # Only paint interior (where there are no walls)
-                if not cell.is_start and not cell.is_exit and (
-                        not cell.is_fixed):
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2,
-                                    cell_height - 2,
-                                    color)
-                # Keep special colors for start/exit/fixed
-                if cell.is_start:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2,
-                                    cell_height - 2,
-                                    self.start_color)
-                elif cell.is_exit:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2,
-                                    cell_height - 2,
-                                    self.end_color)
-                elif cell.is_fixed:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2,
-                                    cell_height - 2,
-                                    self.start_color)
-            else:
-                # For all other actions, clear and redraw
-                self._fill_rect(px, py, cell_width, cell_height, self.bg_color)
-
-                # Paint cell interior with appropriate color
-                if color != self.bg_color:
-                    # Draw colored background for non-special cells
-                    if not cell.is_start and not cell.is_exit and (
-                            not cell.is_fixed):
-                        self._fill_rect(px + 1, py + 1,
-                                        cell_width - 2, cell_height - 2,
-                                        color)
-
-                # Keep special colors for start/exit/fixed always
-                if cell.is_start:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2, cell_height - 2,
-                                    self.start_color)
-                elif cell.is_exit:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2, cell_height - 2,
-                                    self.end_color)
-                elif cell.is_fixed:
-                    self._fill_rect(px + 1, py + 1,
-                                    cell_width - 2, cell_height - 2,
-                                    self.start_color)
-
-                # Dibujar las paredes siempre
-                if cell.has_wall(NORTH):
-                    self._draw_line(px, py,
-                                    px + cell_width, py, self.wall_color,
-                                    self.wall_thickness)
-                if cell.has_wall(SOUTH):
-                    self._draw_line(px, py + cell_height,
-                                    px + cell_width, py + cell_height,
-                                    self.wall_color,
-                                    self.wall_thickness)
-                if cell.has_wall(WEST):
-                    self._draw_line(px, py, px, py + cell_height,
-                                    self.wall_color, self.wall_thickness)
-                if cell.has_wall(EAST):
-                    self._draw_line(px + cell_width, py, px + cell_width,
-                                    py + cell_height, self.wall_color,
-                                    self.wall_thickness)
-
-        # Mostrar la imagen en la ventana
-        self.mlx.mlx_put_image_to_window(self.mlx_ptr,
-                                         self.win_ptr,
-                                         self.img_ptr, 0, 0)
+        x0, y0, x1, y1 = region
+        # Se limpia también la banda de un píxel que rodea la región, donde
+        # quedan los extremos de las paredes que se acaban de abrir
+        self._fill_rect(x0 * cell_width - 1, y0 * cell_height - 1,
+                        (x1 - x0) * cell_width + 2,
+                        (y1 - y0) * cell_height + 2, self.bg_color)
+
+        # Fondos de entrada, salida y logo dentro de la región
+        flags = self.board.flags
+        columns = self.board.width
+        special = START | EXIT | FIXED
+        for y in range(y0, y1):
+            for index in range(y * columns + x0, y * columns + x1):
+                if flags[index] & special:
+                    self._draw_cell(self.board.cell(index), cell_width,
+                                    cell_height)
+
+        # Las paredes vecinas invaden un píxel de la región: se repintan
+        walls_region = (max(x0 - 1, 0), max(y0 - 1, 0),
+                        min(x1 + 1, columns), min(y1 + 1, self.board.height))
+        self.framebuffer.draw_walls(self.board.walls, self.board.width,
+                                    self.board.height, cell_width,
+                                    cell_height, self.wall_color,
+                                    self.wall_thickness, walls_region)
+
+    def _solving_color(self, action: int) -> int:
+        """Return the interior color of a cell for a solver action."""
+        # CLEAR_VISITED y el resto devuelven la celda al fondo
+        return self.solving_colors.get(action, self.bg_color)
 
     def _draw_cell(self, cell: Cell, cell_width: int,
                    cell_height: int) -> None:
@@ -446,6 +380,17 @@ class Renderer:
         dy = abs(y2 - y1)
         steps = max(dx, dy)
 
+        # Líneas horizontales y verticales: un único rectángulo
+        if steps and (dx == 0 or dy == 0):
+            shift = thickness // 2
+            if dx > dy:
+                self.framebuffer.fill_rect(min(x1, x2), y1 - shift,
+                                           dx + 1, thickness, color)
+            else:
+                self.framebuffer.fill_rect(x1 - shift, min(y1, y2),
+                                           thickness, dy + 1, color)
+            return
+
         # Caso especial: un solo punto
         if steps == 0:
             for t in range(thickness):
@@ -478,16 +423,9 @@ class Renderer:
 
     def _fill_rect(self, x: int, y: int, width: int, height: int,
                    color: int) -> None:
-        """Draw a filled rectangle pixel by pixel."""
-        x_start = int(x)
-        y_start = int(y)
-        x_end = int(x + width)
-        y_end = int(y + height)
-
-        for py in range(y_start, y_end):
-            for px in range(x_start, x_end):
-                if 0 <= px < self.width and 0 <= py < self.height:
-                    self._put_pixel_to_image(px, py, color)
+        """Draw a filled rectangle with one slice write per row."""
+        self.framebuffer.fill_rect(int(x), int(y), int(width), int(height),
+                                   color)
 
     def get_window_size(self) -> tuple[int, int]:
         """Calculate window size based on maze dimensions."""
@@ -0,0 +1,106 @@
+"""Solver results cached by a content hash of the maze.
+
+The key hashes the wall grid, the cell weights, the entry, the exit and
+the strategy, so two boards with the same content share their solution.
+Entries live in an LRU dictionary and, optionally, as small files in a
+directory that survives between runs.
+"""
+
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional, TypeAlias
+from custom_typing.maze import MazeBoard
+import os
+
+# TypeAlias: a cached path, None when the maze has no solution
+CachedPath: TypeAlias = Optional[tuple[int, ...]]
+
+DEFAULT_MAX_ENTRIES = 64
+
+# Extensión de las soluciones guardadas en disco
+CACHE_EXTENSION = ".path"
+
+
+class SolutionCache:
+    """LRU cache of solver paths with an optional on-disk tier.
+
+    A path is stored as the tuple of its flat cell indices. On disk it
+    is the raw ``int32`` array in a file named after the key; an empty
+    file records a maze without solution.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 directory: Optional[str] = None) -> None:
+        """Create an empty cache, backed by ``directory`` if given."""
+        if max_entries < 1:
+            raise ValueError("The cache needs room for at least one entry")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries: OrderedDict[str, CachedPath] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(board: MazeBoard, start: int, goal: int, strategy: str) -> str:
+        """Return the content hash of a search on a board."""
+        digest = blake2b(digest_size=16)
+        digest.update(f"{board.width}x{board.height}:{start}:{goal}:"
+                      f"{strategy}:".encode("ascii"))
+        digest.update(board.walls)
+        if board.weights is not None:
+            digest.update(board.weights)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, CachedPath]:
+        """Return (found, path) for a key, from memory or else disk."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        path_file = self._file(key)
+        if path_file and os.path.exists(path_file):
+            indices = array('i')
+            with open(path_file, "rb") as file:
+                indices.frombytes(file.read())
+            path: CachedPath = tuple(indices) if indices else None
+            self._remember(key, path)
+            self.hits += 1
+            return True, path
+        self.misses += 1
+        return False, None
+
+    def put(self, key: str, path: Optional[list[int]]) -> None:
+        """Store the path of a key in memory and on disk."""
+        stored: CachedPath = tuple(path) if path is not None else None
+        self._remember(key, stored)
+        path_file = self._file(key)
+        if path_file:
+            # Escribir y renombrar: nunca queda un fichero a medias
+            temporary = f"{path_file}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(array('i', stored or ()).tobytes())
+            os.replace(temporary, path_file)
+
+    def clear(self) -> None:
+        """Forget the entries kept in memory."""
+        self.entries.clear()
+
+    def _remember(self, key: str, path: CachedPath) -> None:
+        """Insert a memory entry, evicting the least recently used."""
+        self.entries[key] = path
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _file(self, key: str) -> Optional[str]:
+        """Return the file of a key on disk, if there is a disk tier."""
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+
+    def __len__(self) -> int:
+        """Return the number of entries kept in memory."""
+        return len(self.entries)
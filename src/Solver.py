@@ -1,27 +1,56 @@
-from collections import deque
-from typing import Dict, Generator, List, Optional, Set, TypeAlias, Any
+from typing import Generator, Iterator, Optional, TypeAlias
 from custom_typing.maze import Coordinate, MazeBoard
 from src.Cell import Cell
+from src.SolverStrategies import SOLVER_STRATEGIES, DEFAULT_STRATEGY
+from src.SolverStrategies import Search, SearchPath, SearchStep
+from src.SolverStrategies import SolveStats, SolverStrategy
+from src.StepEvents import StepAction, Step, RawStep, NO_CELL, step_stream
+from src.SolutionCache import SolutionCache
+import time
 
 # TypeAlias para clarificar el propósito de las estructuras de datos
-ParentMap: TypeAlias = Dict[Cell, Optional[Cell]]
-VisitedSet: TypeAlias = Set[Cell]
-SolveStep: TypeAlias = Dict[str, Any]
+SolveStep: TypeAlias = Step
 
 
 class Solver:
 
-    def __init__(self, board: MazeBoard, entry: Coordinate, exit: Coordinate):
+    def __init__(self, board: MazeBoard, entry: Coordinate, exit: Coordinate,
+                 strategy: str = DEFAULT_STRATEGY,
+                 cache: Optional[SolutionCache] = None):
+        if strategy not in SOLVER_STRATEGIES:
+            raise ValueError(f"Unknown solver strategy: {strategy}")
         self.board = board
         self.entry = entry
         self.exit = exit
+        self.strategy_name = strategy
+        self.strategy: SolverStrategy = SOLVER_STRATEGIES[strategy](board)
+        self.stats: SolveStats = self.strategy.stats
         self.reconstructed_path: Optional[list[Cell]] = None
-
-    def solve(self) -> Optional[List[Cell]]:
+        # Índices planos de la última solución, reutilizables al guardar
+        self.path: SearchPath = None
+        self.cache = cache
+        # (versión del tablero, inicio, meta, clave) del último hash
+        self._cache_key: tuple[int, int, int, str] = (-1, -1, -1, "")
+        # Clave de la caché de la que sale reconstructed_path
+        self._path_key = ""
+
+    def solve(self) -> Optional[list[Cell]]:
         """
-        Resuelve el laberinto usando BFS bidireccional de forma completa.
+        Resuelve el laberinto con la estrategia configurada.
         Retorna el camino de solución o None si no existe.
         """
+        indices = self.solve_path()
+        if indices is None:
+            return None
+        self.reconstructed_path = self._path_cells(indices)
+        return list(self.reconstructed_path)
+
+    def solve_path(self) -> SearchPath:
+        """Solve the maze and return the path as flat indices only.
+
+        Large mazes only need the indices to write the solution, so no
+        cell view is built for them.
+        """
         print("\nSolving maze...")
         start = self.board.get(self.entry)
         goal = self.board.get(self.exit)
@@ -30,167 +59,133 @@ class Solver:
             print("[ERROR] Invalid entry or exit coordinates")
             return None
 
-        queue_start = deque([start])
-        queue_goal = deque([goal])
-        parent_start: ParentMap = dict()
-        parent_start[start] = None
-        parent_goal: ParentMap = dict()
-        parent_goal[goal] = None
-        visited_start: VisitedSet = {start}
-        visited_goal: VisitedSet = {goal}
-
-        while queue_start and queue_goal:
-            # Verificar si se encontró el punto de encuentro
-            for visited in visited_start:
-                if visited in visited_goal:
-                    path = self.reconstruct_path(
-                        parent_start, parent_goal, visited
-                    )
-                    self.reconstructed_path = path
-                    print(f"[OK] Solution found! Path length: {len(path)}")
-                    return path
-
-            # Expandir desde el inicio
-            node_start = queue_start.popleft()
-            for neighbor in node_start.get_accessible_neighbors().values():
-                if neighbor not in visited_start:
-                    queue_start.append(neighbor)
-                    visited_start.add(neighbor)
-                    parent_start[neighbor] = node_start
-
-            # Expandir desde el objetivo
-            node_goal = queue_goal.popleft()
-            for neighbor in node_goal.get_accessible_neighbors().values():
-                if neighbor not in visited_goal:
-                    queue_goal.append(neighbor)
-                    visited_goal.add(neighbor)
-                    parent_goal[neighbor] = node_goal
-
-        print("[ERROR] No solution found")
-        return None
-
-    def solve_step_by_step(self) -> Generator[SolveStep, None, None]:
-        """Generate the solution step by step using bidirectional BFS."""
+        found, indices = self._cached_path(start.index, goal.index)
+        if not found:
+            search = self._timed_search(start.index, goal.index)
+            while True:
+                try:
+                    next(search)
+                except StopIteration as stop:
+                    indices = stop.value
+                    break
+            self._store_path(start.index, goal.index, indices)
+        self.path = indices
+
+        if indices is None:
+            print("[ERROR] No solution found")
+            print(f"[STATS] {self.stats}")
+            return None
+
+        print(f"[OK] Solution found{' in cache' if found else ''}! "
+              f"Path length: {len(indices)}")
+        print(f"[STATS] {self.stats}")
+        return indices
+
+    def solve_step_by_step(self,
+                           batch_size: int = 0) -> Generator[SolveStep,
+                                                             None, None]:
+        """Generate the solution step by step with the configured strategy.
+
+        With ``batch_size`` the steps come in StepBatch chunks.
+        """
         print("\nSolving...")
         print("Press Q in the maze window to abort solving")
+        yield from step_stream(self._search_steps(), batch_size)
 
-        start = self.board.get(self.entry)
-        goal = self.board.get(self.exit)
+    def _search_steps(self) -> Iterator[RawStep]:
+        """Run the search, yielding raw steps for the animation."""
+        board = self.board
+        start = board.get(self.entry)
+        goal = board.get(self.exit)
 
         if start is None or goal is None:
             print("[ERROR] Invalid entry or exit coordinates")
-            yield {
-                'current': None,
-                'action': 'no_solution',
-                'modified_cells': [],
-            }
+            yield StepAction.NO_SOLUTION, NO_CELL, ()
             return
 
-        queue_start = deque([start])
-        queue_goal = deque([goal])
-        parent_start: ParentMap = dict()
-        parent_start[start] = None
-        parent_goal: ParentMap = dict()
-        parent_goal[goal] = None
-        visited_start: VisitedSet = {start}
-        visited_goal: VisitedSet = {goal}
-
         # Emitir estado inicial
-        yield {
-            'current': start.coord,
-            'action': 'visiting_start',
-            'modified_cells': [start],
-        }
-        yield {
-            'current': goal.coord,
-            'action': 'visiting_goal',
-            'modified_cells': [goal],
-        }
-
-        while queue_start and queue_goal:
-            # Verificar si se encontró el punto de encuentro
-            for visited in visited_start:
-                if visited in visited_goal:
-                    path = self.reconstruct_path(
-                        parent_start, parent_goal, visited
-                    )
-                    self.reconstructed_path = path
-
-                    # Limpiar todas las celdas visitadas (volver a negro)
-                    all_visited = list(visited_start.union(visited_goal))
-                    yield {
-                        'current': visited.coord,
-                        'action': 'clear_visited',
-                        'modified_cells': all_visited,
-                    }
-
-                    # Luego mostrar solo el camino de solución
-                    yield {
-                        'current': visited.coord,
-                        'action': 'solution_found',
-                        'modified_cells': path,
-                    }
-                    return
-
-            # Expandir desde el inicio
-            node_start = queue_start.popleft()
-
-            new_neighbors = []
-            for neighbor in node_start.get_accessible_neighbors().values():
-                if neighbor not in visited_start:
-                    queue_start.append(neighbor)
-                    visited_start.add(neighbor)
-                    parent_start[neighbor] = node_start
-                    new_neighbors.append(neighbor)
-
-            # Si añadimos vecinos, emitir evento para pintarlos
-            if new_neighbors:
-                yield {
-                    'current': node_start.coord,
-                    'action': 'visiting_start',
-                    'modified_cells': new_neighbors,
-                }
-
-            # Expandir desde el objetivo
-            node_goal = queue_goal.popleft()
-
-            new_neighbors = []
-            for neighbor in node_goal.get_accessible_neighbors().values():
-                if neighbor not in visited_goal:
-                    queue_goal.append(neighbor)
-                    visited_goal.add(neighbor)
-                    parent_goal[neighbor] = node_goal
-                    new_neighbors.append(neighbor)
-
-            if new_neighbors:
-                yield {
-                    'current': node_goal.coord,
-                    'action': 'visiting_goal',
-                    'modified_cells': new_neighbors,
-                }
-
-        # No se encontró solución
-        yield {
-            'current': None,
-            'action': 'no_solution',
-            'modified_cells': [],
-        }
-
-    @staticmethod
-    def reconstruct_path(path_start: ParentMap,
-                         path_goal: ParentMap,
-                         meeting_node: Cell) -> List[Cell]:
-        start_half: List[Cell] = []
-        cur: Optional[Cell] = meeting_node
-        while cur is not None:
-            start_half.append(cur)
-            cur = path_start[cur]
-        start_half.reverse()
-
-        goal_half: List[Cell] = []
-        cur = path_goal[meeting_node]
-        while cur is not None:
-            goal_half.append(cur)
-            cur = path_goal[cur]
-
-        return start_half + goal_half
+        yield StepAction.VISITING_START, start.index, (start.index,)
+        yield StepAction.VISITING_GOAL, goal.index, (goal.index,)
+
+        search = self._timed_search(start.index, goal.index)
+        while True:
+            try:
+                action, cells = next(search)
+            except StopIteration as stop:
+                indices: SearchPath = stop.value
+                break
+            if cells:
+                yield action, cells[-1], cells
+
+        self._store_path(start.index, goal.index, indices)
+        self.path = indices
+        if indices is None:
+            # No se encontró solución
+            yield StepAction.NO_SOLUTION, NO_CELL, ()
+            return
+
+        self.reconstructed_path = self._path_cells(indices)
+
+        # Limpiar todas las celdas visitadas (volver a negro)
+        yield (StepAction.CLEAR_VISITED, goal.index,
+               self.strategy.explored())
+
+        # Luego mostrar solo el camino de solución
+        yield StepAction.SOLUTION_FOUND, goal.index, indices
+
+    def _cached_path(self, start: int, goal: int) -> tuple[bool, SearchPath]:
+        """Return (found, path) of the search from the solution cache.
+
+        The board is hashed once per version, so repeated solves of an
+        unchanged board are a dictionary lookup.
+        """
+        if self.cache is None:
+            return False, None
+        found, cached = self.cache.get(self._key(start, goal))
+        if not found:
+            return False, None
+        self.stats = SolveStats(self.strategy_name)
+        self.stats.path_length = len(cached) if cached else 0
+        return True, list(cached) if cached is not None else None
+
+    def _path_cells(self, indices: list[int]) -> list[Cell]:
+        """Return the cells of a path, reused while its key is current."""
+        key = self._cache_key[3] if self.cache is not None else ""
+        if (not key or key != self._path_key
+                or self.reconstructed_path is None):
+            self._path_key = key
+            return [self.board.cell(index) for index in indices]
+        return self.reconstructed_path
+
+    def _store_path(self, start: int, goal: int, path: SearchPath) -> None:
+        """Save the result of a finished search in the solution cache."""
+        if self.cache is not None:
+            self.cache.put(self._key(start, goal), path)
+
+    def _key(self, start: int, goal: int) -> str:
+        """Return the cache key of the search, hashing on board changes."""
+        version = self.board.version
+        cached_version, cached_start, cached_goal, key = self._cache_key
+        if (version, start, goal) != (cached_version, cached_start,
+                                      cached_goal):
+            key = SolutionCache.key(self.board, start, goal,
+                                    self.strategy_name)
+            self._cache_key = (version, start, goal, key)
+        return key
+
+    def _timed_search(self, start: int, goal: int) -> Search:
+        """Run a fresh strategy search, timing only the search itself."""
+        self.strategy = SOLVER_STRATEGIES[self.strategy_name](self.board)
+        self.stats = self.strategy.stats
+        search = self.strategy.search(start, goal)
+        while True:
+            began = time.perf_counter()
+            try:
+                step: SearchStep = next(search)
+            except StopIteration as stop:
+                self.stats.elapsed += time.perf_counter() - began
+                path: SearchPath = stop.value
+                self.stats.path_length = len(path) if path else 0
+                return path
+            self.stats.elapsed += time.perf_counter() - began
+            yield step
@@ -0,0 +1,380 @@
+"""Pluggable path search strategies used by the Solver."""
+
+from array import array
+from collections import deque
+from typing import Generator, Optional, TypeAlias
+import heapq
+from custom_typing.maze import NORTH, EAST, SOUTH, WEST
+from src.Board import Board
+from src.StepEvents import StepAction
+
+# (acción, índices de las celdas tocadas) emitido en cada paso
+SearchStep: TypeAlias = tuple[int, list[int]]
+SearchPath: TypeAlias = Optional[list[int]]
+Search: TypeAlias = Generator[SearchStep, None, SearchPath]
+ParentArray: TypeAlias = 'array[int]'
+
+# Orden horario de direcciones para el seguidor de paredes
+CLOCKWISE: tuple[int, ...] = (NORTH, EAST, SOUTH, WEST)
+
+# Tabla de traducción: número de paredes abiertas de cada celda
+OPEN_DEGREE = bytes(4 - bin(walls & 0xF).count("1") for walls in range(256))
+
+
+class SolveStats:
+    """Counters reported by a strategy after a search."""
+
+    def __init__(self, strategy: str) -> None:
+        """Initialize every counter to zero."""
+        self.strategy: str = strategy
+        self.nodes_expanded: int = 0
+        self.peak_frontier: int = 0
+        self.path_length: int = 0
+        self.elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        """Return a one-line summary of the counters."""
+        return (f"{self.strategy}: {self.nodes_expanded} nodes expanded, "
+                f"peak frontier {self.peak_frontier}, "
+                f"path length {self.path_length}, "
+                f"{self.elapsed * 1000:.2f} ms")
+
+
+class SolverStrategy:
+    """Base class for path search backends over a Board.
+
+    ``search`` is a generator that yields ``(action, cells)`` steps for
+    the animation and returns the path as a list of flat indices, or
+    None when the exit cannot be reached.
+    """
+
+    name: str = ""
+
+    def __init__(self, board: Board) -> None:
+        """Bind the strategy to a board and reset its counters."""
+        self.board = board
+        self.stats = SolveStats(self.name)
+
+    def search(self, start: int, goal: int) -> Search:
+        """Yield the search steps and return the solution path."""
+        raise NotImplementedError
+
+    def explored(self) -> list[int]:
+        """Return the indices touched by the last search."""
+        raise NotImplementedError
+
+    @staticmethod
+    def walk_parents(parent: ParentArray, node: int) -> list[int]:
+        """Return the path from the root of a parent array to a node."""
+        path = [node]
+        while parent[path[-1]] != path[-1]:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+
+class BidirectionalBFS(SolverStrategy):
+    """Level-synchronous bidirectional BFS with O(1) meeting checks."""
+
+    name = "bfs"
+
+    # Lados de la búsqueda
+    FROM_START = 0
+    FROM_GOAL = 1
+
+    def __init__(self, board: Board) -> None:
+        """Initialize empty parent arrays for both sides."""
+        super().__init__(board)
+        self.parents: tuple[ParentArray, ParentArray] = (array('i'),
+                                                         array('i'))
+
+    def search(self, start: int, goal: int) -> Search:
+        """Expand whole frontier levels, alternating by smaller frontier.
+
+        A meeting is detected when a cell discovered by one side already
+        has a parent from the other one.
+        """
+        board = self.board
+        walls = board.walls
+        steps = board.steps
+        stats = self.stats
+        parents = (array('i', [-1]) * board.size,
+                   array('i', [-1]) * board.size)
+        parents[self.FROM_START][start] = start
+        parents[self.FROM_GOAL][goal] = goal
+        self.parents = parents
+        if start == goal:
+            return [start]
+
+        frontiers: list[list[int]] = [[start], [goal]]
+        while frontiers[self.FROM_START] and frontiers[self.FROM_GOAL]:
+            stats.peak_frontier = max(stats.peak_frontier,
+                                      len(frontiers[0]) + len(frontiers[1]))
+            side = (self.FROM_START if len(frontiers[self.FROM_START])
+                    <= len(frontiers[self.FROM_GOAL]) else self.FROM_GOAL)
+            action = (StepAction.VISITING_START if side == self.FROM_START
+                      else StepAction.VISITING_GOAL)
+            own = parents[side]
+            other = parents[1 - side]
+            next_frontier: list[int] = []
+            for current in frontiers[side]:
+                stats.nodes_expanded += 1
+                cell_walls = walls[current]
+                for direction, step in steps:
+                    neighbor = current + step
+                    if cell_walls & direction or own[neighbor] >= 0:
+                        continue
+                    own[neighbor] = current
+                    next_frontier.append(neighbor)
+                    if other[neighbor] >= 0:
+                        yield action, next_frontier
+                        return self.join_halves(neighbor)
+            frontiers[side] = next_frontier
+            yield action, next_frontier
+        return None
+
+    def join_halves(self, meeting_node: int) -> list[int]:
+        """Join both parent chains through the meeting cell."""
+        parent_start, parent_goal = self.parents
+        path = self.walk_parents(parent_start, meeting_node)
+        cur = meeting_node
+        while parent_goal[cur] != cur:
+            cur = parent_goal[cur]
+            path.append(cur)
+        return path
+
+    def explored(self) -> list[int]:
+        """Return the cells reached by either side."""
+        parent_start, parent_goal = self.parents
+        return [index for index in range(len(parent_start))
+                if parent_start[index] >= 0 or parent_goal[index] >= 0]
+
+
+class AStar(SolverStrategy):
+    """A* search with the Manhattan distance heuristic and unit costs."""
+
+    name = "astar"
+
+    def __init__(self, board: Board) -> None:
+        """Initialize an empty parent array."""
+        super().__init__(board)
+        self.parent: ParentArray = array('i')
+
+    def cost(self, index: int) -> int:
+        """Return the cost of entering a cell."""
+        return 1
+
+    def heuristic(self, index: int, goal: int) -> int:
+        """Return the Manhattan distance between two cells."""
+        width = self.board.width
+        return (abs(index % width - goal % width)
+                + abs(index // width - goal // width))
+
+    def search(self, start: int, goal: int) -> Search:
+        """Expand cells in order of cost plus heuristic."""
+        board = self.board
+        walls = board.walls
+        steps = board.steps
+        stats = self.stats
+        best = array('i', [-1]) * board.size
+        parent = array('i', [-1]) * board.size
+        closed = bytearray(board.size)
+        self.parent = parent
+        best[start] = 0
+        parent[start] = start
+        # Ante empates se prefiere el nodo más profundo (-g)
+        heap: list[tuple[int, int, int]] = [
+            (self.heuristic(start, goal), 0, start)]
+        action = StepAction.VISITING_START
+
+        while heap:
+            stats.peak_frontier = max(stats.peak_frontier, len(heap))
+            _, neg_cost, current = heapq.heappop(heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            stats.nodes_expanded += 1
+            if current == goal:
+                return self.walk_parents(parent, goal)
+            cost = -neg_cost
+            cell_walls = walls[current]
+            new_cells: list[int] = []
+            for direction, step in steps:
+                neighbor = current + step
+                if cell_walls & direction or closed[neighbor]:
+                    continue
+                new_cost = cost + self.cost(neighbor)
+                if best[neighbor] < 0 or new_cost < best[neighbor]:
+                    best[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heapq.heappush(heap, (
+                        new_cost + self.heuristic(neighbor, goal),
+                        -new_cost, neighbor))
+                    new_cells.append(neighbor)
+            yield action, new_cells
+        return None
+
+    def explored(self) -> list[int]:
+        """Return the cells that received a parent."""
+        parent = self.parent
+        return [index for index in range(len(parent)) if parent[index] >= 0]
+
+
+class Dijkstra(AStar):
+    """Dijkstra search using the board's per-cell weights."""
+
+    name = "dijkstra"
+
+    def cost(self, index: int) -> int:
+        """Return the board weight of a cell, 1 when unweighted."""
+        weights = self.board.weights
+        return weights[index] if weights is not None else 1
+
+    def heuristic(self, index: int, goal: int) -> int:
+        """Return no estimate so cells expand in pure cost order."""
+        return 0
+
+
+class DeadEndFilling(SolverStrategy):
+    """Fill dead ends until only the routes between entry and exit stay."""
+
+    name = "dead_end"
+
+    def __init__(self, board: Board) -> None:
+        """Initialize an empty touched-cell mask."""
+        super().__init__(board)
+        self.seen = bytearray()
+
+    def search(self, start: int, goal: int) -> Search:
+        """Fill dead ends, then walk the remaining open cells."""
+        board = self.board
+        walls = board.walls
+        steps = board.steps
+        stats = self.stats
+        degree = bytearray(walls.translate(OPEN_DEGREE))
+        filled = bytearray(board.size)
+        self.seen = filled
+        queue = deque(index for index, open_walls in enumerate(degree)
+                      if open_walls == 1 and index != start
+                      and index != goal)
+        action = StepAction.FILLING_DEAD_END
+
+        while queue:
+            stats.peak_frontier = max(stats.peak_frontier, len(queue))
+            current = queue.popleft()
+            filled[current] = 1
+            stats.nodes_expanded += 1
+            cell_walls = walls[current]
+            for direction, step in steps:
+                neighbor = current + step
+                if cell_walls & direction or filled[neighbor]:
+                    continue
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1 and neighbor != start and (
+                        neighbor != goal):
+                    queue.append(neighbor)
+            yield action, [current]
+
+        # Lo que queda es el camino (más los bucles si no es perfecto)
+        parent = array('i', [-1]) * board.size
+        parent[start] = start
+        frontier = deque([start])
+        while frontier:
+            current = frontier.popleft()
+            stats.nodes_expanded += 1
+            if current == goal:
+                return self.walk_parents(parent, goal)
+            cell_walls = walls[current]
+            for direction, step in steps:
+                neighbor = current + step
+                if cell_walls & direction or filled[neighbor] or (
+                        parent[neighbor] >= 0):
+                    continue
+                parent[neighbor] = current
+                frontier.append(neighbor)
+        return None
+
+    def explored(self) -> list[int]:
+        """Return the filled cells."""
+        seen = self.seen
+        return [index for index in range(len(seen)) if seen[index]]
+
+
+class WallFollower(SolverStrategy):
+    """Right-hand wall follower, complete on perfect mazes only."""
+
+    name = "wall_follower"
+
+    def __init__(self, board: Board) -> None:
+        """Initialize an empty visited mask."""
+        super().__init__(board)
+        self.seen = bytearray()
+
+    def search(self, start: int, goal: int) -> Search:
+        """Walk keeping a hand on the right wall until the exit.
+
+        The hand starts on a closed wall of the start cell and the
+        walked route is pruned of dead-end excursions as it goes. The
+        walk is deterministic and reversible, so it only fails by coming
+        back to its first (cell, heading) state after a full circuit of
+        a wall that does not touch the exit, in which case None is
+        returned.
+        """
+        board = self.board
+        walls = board.walls
+        stats = self.stats
+        offsets = dict(board.steps)
+        states = bytearray(board.size)
+        route_position = array('i', [-1]) * board.size
+        self.seen = states
+        route = [start]
+        route_position[start] = 0
+        # Rumbo que deja una pared cerrada a la derecha de la salida
+        heading = next((turn for turn in range(4)
+                        if walls[start] & CLOCKWISE[(turn + 1) % 4]), 0)
+        first_state = -1
+        action = StepAction.VISITING_START
+
+        current = start
+        while current != goal:
+            # Derecha, recto, izquierda y media vuelta
+            for turn in (1, 0, 3, 2):
+                direction = CLOCKWISE[(heading + turn) % 4]
+                if not walls[current] & direction:
+                    heading = (heading + turn) % 4
+                    break
+            else:
+                return None
+            state = current * 4 + heading
+            if state == first_state:
+                return None
+            if first_state < 0:
+                first_state = state
+            states[current] |= 1 << heading
+            current += offsets[CLOCKWISE[heading]]
+            stats.nodes_expanded += 1
+
+            if route_position[current] >= 0:
+                # Volvemos sobre nuestros pasos: podar la excursión
+                for index in route[route_position[current] + 1:]:
+                    route_position[index] = -1
+                del route[route_position[current] + 1:]
+            else:
+                route_position[current] = len(route)
+                route.append(current)
+            stats.peak_frontier = max(stats.peak_frontier, len(route))
+            yield action, [current]
+        return route
+
+    def explored(self) -> list[int]:
+        """Return the cells left by the walk."""
+        seen = self.seen
+        return [index for index in range(len(seen)) if seen[index]]
+
+
+SOLVER_STRATEGIES: dict[str, type[SolverStrategy]] = {
+    strategy.name: strategy
+    for strategy in (BidirectionalBFS, AStar, Dijkstra, DeadEndFilling,
+                     WallFollower)
+}
+DEFAULT_STRATEGY = BidirectionalBFS.name
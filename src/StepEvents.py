@@ -0,0 +1,112 @@
+"""Compact step events of the generation and solving animations.
+
+A step is an integer action, the flat index of the current cell and the
+indices of the cells it touched. Streams yield one ``StepEvent`` per
+step, or, in batched mode, ``StepBatch`` chunks that pack many steps
+into flat arrays without creating an object per step.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Iterable, Iterator, Sequence, TypeAlias
+
+
+class StepAction(IntEnum):
+    """What a step did to its cells."""
+
+    BREAKING_WALL = 0
+    BACKTRACKING = 1
+    ADDING_EXTRA_PATH = 2
+    VISITING_START = 3
+    VISITING_GOAL = 4
+    FILLING_DEAD_END = 5
+    CLEAR_VISITED = 6
+    SOLUTION_FOUND = 7
+    NO_SOLUTION = 8
+
+
+# Índice de ``current`` cuando un paso no tiene celda actual
+NO_CELL = -1
+
+# TypeAlias for a step before wrapping: (action, current, cell indices)
+RawStep: TypeAlias = tuple[int, int, Sequence[int]]
+
+
+class StepEvent:
+    """One animation step.
+
+    ``cells`` may be shared with the producer and must not be modified.
+    """
+
+    __slots__ = ('action', 'current', 'cells')
+
+    def __init__(self, action: int, current: int,
+                 cells: Sequence[int]) -> None:
+        """Store the action, the current cell and the touched cells."""
+        self.action = action
+        self.current = current
+        self.cells = cells
+
+    def __repr__(self) -> str:
+        """Return the event with its action name."""
+        return (f"StepEvent({StepAction(self.action).name}, "
+                f"{self.current}, {list(self.cells)})")
+
+
+class StepBatch:
+    """Consecutive steps packed in flat arrays.
+
+    Step ``i`` has action ``actions[i]``, current cell ``currents[i]``
+    and touched cells ``cells[ends[i - 1]:ends[i]]`` (from 0 for the
+    first step).
+    """
+
+    __slots__ = ('actions', 'currents', 'cells', 'ends')
+
+    def __init__(self) -> None:
+        """Start an empty batch."""
+        self.actions = bytearray()
+        self.currents = array('i')
+        self.cells = array('i')
+        self.ends = array('I')
+
+    def __len__(self) -> int:
+        """Return the number of steps in the batch."""
+        return len(self.actions)
+
+    def append(self, action: int, current: int,
+               cells: Sequence[int]) -> None:
+        """Add one step at the end of the batch."""
+        self.actions.append(action)
+        self.currents.append(current)
+        self.cells.extend(cells)
+        self.ends.append(len(self.cells))
+
+    def __iter__(self) -> Iterator[StepEvent]:
+        """Yield the steps of the batch as events."""
+        start = 0
+        for action, current, end in zip(self.actions, self.currents,
+                                        self.ends):
+            yield StepEvent(action, current, self.cells[start:end])
+            start = end
+
+
+# TypeAlias for an item of a step stream
+Step: TypeAlias = StepEvent | StepBatch
+
+
+def step_stream(raw: Iterable[RawStep],
+                batch_size: int = 0) -> Iterator[Step]:
+    """Wrap raw steps as events, or pack ``batch_size`` per batch."""
+    if not batch_size:
+        for action, current, cells in raw:
+            yield StepEvent(action, current, cells)
+        return
+    batch = StepBatch()
+    for action, current, cells in raw:
+        batch.append(action, current, cells)
+        if len(batch.actions) >= batch_size:
+            yield batch
+            batch = StepBatch()
+    if batch.actions:
+        yield batch
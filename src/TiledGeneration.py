@@ -0,0 +1,159 @@
+"""Tiled generation of huge mazes on a pool of worker processes."""
+
+from array import array
+from typing import Iterator, TypeAlias
+from custom_typing.maze import Coordinate, EAST, SOUTH
+from src.Board import Board, FIXED
+from src.GenerationAlgorithms import GENERATION_ALGORITHMS, UnionFind, find
+from src.RandomSource import derive_seed, make_rng
+import os
+import random
+
+# (algorithm, width, height, fixed cell indices, seed, fast RNG) of a tile
+TileTask: TypeAlias = tuple[str, int, int, list[int], int, bool]
+# First cell and length of each tile along one axis
+Span: TypeAlias = tuple[int, int]
+
+# Smallest tile side accepted (room for the logo and a ring around it)
+MIN_TILE_SIZE = 16
+
+
+def carve_tile(task: TileTask) -> bytes:
+    """Carve one tile as a standalone maze and return its walls.
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    name, width, height, fixed, seed, fast = task
+    board = Board(width, height)
+    for index in fixed:
+        board.flags[index] |= FIXED
+    algorithm = GENERATION_ALGORITHMS[name](board, large_maze=True,
+                                            rng=make_rng(seed, fast))
+    for _ in algorithm.run():
+        pass
+    return bytes(board.walls)
+
+
+def tile_spans(length: int, tile_size: int, keep: Span) -> list[Span]:
+    """Split an axis in tiles whose cuts never touch the ``keep`` span.
+
+    The cells of ``keep`` (the logo) and one cell around them always end
+    up inside the same tile, so the logo cannot cut a tile in parts.
+    """
+    first, last = keep[0] - 1, keep[0] + keep[1]
+    cuts = [0]
+    cut = tile_size
+    while cut < length:
+        if first <= cut <= last:
+            cut = last + 1
+        if length - cut < MIN_TILE_SIZE:
+            break
+        cuts.append(cut)
+        cut += tile_size
+    cuts.append(length)
+    return [(start, end - start) for start, end in zip(cuts, cuts[1:])]
+
+
+class TiledGeneration:
+    """Carve a board tile by tile in parallel and stitch the tiles.
+
+    Every tile is an independent perfect maze over its free cells. The
+    tiles are then joined along a random spanning tree of the tile grid,
+    opening exactly one wall per tree edge, so the whole board stays a
+    perfect maze.
+    """
+
+    def __init__(self, board: Board, algorithm: str, tile_size: int,
+                 workers: int, logo: list[Coordinate],
+                 rng: random.Random | None = None,
+                 fast_random: bool = False) -> None:
+        """Plan the tiles of a board marked with the ``logo`` cells.
+
+        ``workers`` is the number of processes, 0 for one per core.
+        """
+        self.board = board
+        self.algorithm = algorithm
+        self.rng = rng or random.Random()
+        self.fast_random = fast_random
+        self.workers = workers or os.cpu_count() or 1
+        # Celdas del logo en base 0, para repartirlas entre las baldosas
+        self.logo = [(x - 1, y - 1) for x, y in logo]
+        xs = [x for x, _ in self.logo] or [0]
+        ys = [y for _, y in self.logo] or [0]
+        self.columns = tile_spans(board.width, tile_size,
+                                  (min(xs), max(xs) - min(xs) + 1))
+        self.rows = tile_spans(board.height, tile_size,
+                               (min(ys), max(ys) - min(ys) + 1))
+
+    def tasks(self, seed: int | None) -> Iterator[TileTask]:
+        """Yield the work of every tile in row-major order.
+
+        Tile seeds derive from the maze seed and the tile number, so a
+        seeded maze does not depend on the number of workers.
+        """
+        tile = 0
+        for top, height in self.rows:
+            for left, width in self.columns:
+                fixed = [(y - top) * width + x - left
+                         for x, y in self.logo
+                         if left <= x < left + width
+                         and top <= y < top + height]
+                tile_seed = (self.rng.getrandbits(64) if seed is None
+                             else derive_seed(seed, tile))
+                tile += 1
+                yield (self.algorithm, width, height, fixed, tile_seed,
+                       self.fast_random)
+
+    def run(self, seed: int | None) -> None:
+        """Carve every tile on the worker pool, then stitch them."""
+        # multiprocessing tarda en importarse: solo cuando hay tiles
+        from concurrent.futures import ProcessPoolExecutor
+        board = self.board
+        walls = board.walls
+        tiles = ((top, height, left, width)
+                 for top, height in self.rows
+                 for left, width in self.columns)
+        with ProcessPoolExecutor(self.workers) as pool:
+            for (top, height, left, width), tile in zip(
+                    tiles, pool.map(carve_tile, self.tasks(seed))):
+                for y in range(height):
+                    start = (top + y) * board.width + left
+                    walls[start:start + width] = tile[y * width:
+                                                      (y + 1) * width]
+        self.stitch()
+
+    def stitch(self) -> None:
+        """Join the tiles along a random spanning tree of the tile grid.
+
+        Kruskal over the tile adjacencies: each edge that links two
+        separate groups opens one random wall on the shared border.
+        """
+        columns = len(self.columns)
+        count = columns * len(self.rows)
+        edges = [(tile, tile + 1, EAST) for tile in range(count)
+                 if (tile + 1) % columns]
+        edges += [(tile, tile + columns, SOUTH)
+                  for tile in range(count - columns)]
+        self.rng.shuffle(edges)
+        parent: UnionFind = array('I', range(count))
+        for tile, other, direction in edges:
+            root, other_root = find(parent, tile), find(parent, other)
+            if root != other_root:
+                parent[other_root] = root
+                self.open_border(tile, direction)
+
+    def open_border(self, tile: int, direction: int) -> None:
+        """Open one random wall between a tile and its east/south tile."""
+        board = self.board
+        top, height = self.rows[tile // len(self.columns)]
+        left, width = self.columns[tile % len(self.columns)]
+        while True:
+            if direction == EAST:
+                x, y = left + width - 1, top + self.rng.randrange(height)
+            else:
+                x, y = left + self.rng.randrange(width), top + height - 1
+            index = y * board.width + x
+            neighbor = board.neighbor(index, direction)
+            if not (board.flags[index] | board.flags[neighbor]) & FIXED:
+                board.remove_wall_between(index, direction)
+                return
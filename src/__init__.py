@@ -1,6 +1,6 @@
+from typing import Any
 from src.Config import Config
 from src.Generator import Generator
-from src.Renderer import Renderer
 from src.OutputFileHandler import OutputFileHandler
 from src.Menu import Menu
 from src.Solver import Solver
@@ -9,3 +9,11 @@ __all__ = [
     'Config', 'Generator', 'Renderer',
     'OutputFileHandler', 'Menu', 'Solver'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the MLX-backed Renderer only when it is first requested."""
+    if name == 'Renderer':
+        from src.Renderer import Renderer
+        return Renderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")